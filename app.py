@@ -1,12 +1,14 @@
+from __future__ import annotations
+
 from datetime import datetime
+from enum import Enum, auto
 import getpass
 import json
+import os
 import sys
-import textwrap
-from typing import Callable, Any, List, Tuple
+import time
+from typing import TYPE_CHECKING, Callable, Any, Dict, List, Optional, Tuple, Union
 
-import requests
-from requests import RequestException
 from valid8 import ValidationError, validate
 
 from exceptions.primitives.game_description_exception import GameDescriptionException
@@ -21,43 +23,101 @@ from exceptions.primitives.username_exception import UsernameException
 from exceptions.primitives.vote_exception import VoteException
 from functionalities.description import Description
 from functionalities.entry import Entry
-from primitives.email import Email
-from primitives.game_description import GameDescription
-from primitives.game_title import GameTitle
-from primitives.genre import Genre
-from primitives.global_rating import GlobalRating
-from primitives.password import Password
-from primitives.pegi import Pegi
-from primitives.token import Token
-from primitives.username import Username
 from functionalities.menu import Menu
-from primitives.vote import Vote
-
+from utils.table import FORMATS
+
+# Only what the login menu needs is imported up front: the HTTP stack, the catalogue and the
+# primitives are imported by the methods using them, so the first prompt shows before they load
+if TYPE_CHECKING:
+    from catalogue.search_index import SearchIndex
+    from catalogue.store import CatalogueStore
+    from catalogue.sync import CatalogueSync
+    from client.http_client import HttpClient
+    from client.pagination import Page, Paginator
+    from client.prefetcher import Prefetcher
+    from primitives.game_description import GameDescription
+    from primitives.game_title import GameTitle
+    from primitives.genre import Genre
+    from primitives.global_rating import GlobalRating
+    from primitives.pegi import Pegi
+    from primitives.token import Token
+    from primitives.username import Username
+    from utils.table import Column, Rows, Table
+
+
+class Screen(Enum):
+    LOGIN = auto()
+    USER = auto()
+    ADMIN = auto()
 
 
 class App:
 
     __base_url: str = "http://localhost:8000/api/v1"
+    __page_size: int = 50
+    __matches: int = 10
+    __sync_interval: float = 60.0
     __token: Token
-    def __init__(self):
-        self.__menu = ((Menu.Builder(Description("Fiordispino App"), auto_select=lambda: None).
-                       with_entry(Entry.create("1", "Login", on_selected=lambda: self.__login()))).
-                       with_entry(Entry.create("2", "Register", on_selected=lambda: self.__register())).
-                       with_entry(Entry.create("3", "Show Games", on_selected=lambda: self.__show_games())).
-                       with_entry(Entry.create("4", "Show Genres", on_selected=lambda: self.__show_genres())).
-                       with_entry(Entry.create("0", "Exit", on_selected=lambda: print("Goodbye!"), is_exit=True)).
-                       build())
-
-        self.__token = Token("a" * 40)    # Temporary token
+    def __init__(self, client: Optional[HttpClient] = None, store: Optional[CatalogueStore] = None,
+                 output_format: str = "table"):
+        # List views print tables, or stream NDJSON/CSV rows for other tools (see utils.table.Rows)
+        validate("output_format", output_format, is_in=FORMATS)
+        self.__format = output_format
+        # The client, the sync and the prefetcher are created on first use, see the properties below
+        self.__http = client
+        self.__store = store
+        self.__catalogue_sync: Optional[CatalogueSync] = None
+        self.__synced_at = 0.0
+        # Piped input leaves no idle time at the prompts to fill
+        self.__prefetch_budget = int(os.environ.get("FIORDISPINO_PREFETCH_BUDGET") or 2_000_000) if sys.stdin.isatty() else 0
+        self.__background: Optional[Prefetcher] = None
+        # Each screen's menu is built once; run() switches between them instead of nesting them
+        self.__screen: Optional[Screen] = Screen.LOGIN
+        self.__menus: Dict[Screen, Menu] = {}
+
+        self.__token: Optional[Token] = None
+        self.__genres: Optional[Dict[int, Genre]] = None    # Genre id -> name, loaded once per session
+        self.__search_index: Optional[SearchIndex] = None    # Built on the first search, then kept up to date
+
+    @property
+    def __client(self) -> HttpClient:
+        if self.__http is None:
+            from client.catalogue_cache import CatalogueCache
+            from client.http_client import HttpClient
+            self.__http = HttpClient(self.__base_url, token=lambda: self.__token, cache=CatalogueCache.default())
+        return self.__http
+
+    @property
+    def __sync(self) -> CatalogueSync:
+        if self.__catalogue_sync is None:
+            from catalogue.store import CatalogueStore
+            from catalogue.sync import CatalogueSync
+            self.__catalogue_sync = CatalogueSync(self.__client, self.__store or CatalogueStore.default(), self.__page_size)
+        return self.__catalogue_sync
+
+    @property
+    def __prefetcher(self) -> Prefetcher:
+        if self.__background is None:
+            from client.prefetcher import Prefetcher
+            self.__background = Prefetcher(self.__client, budget_bytes=self.__prefetch_budget)
+        return self.__background
+
+    def __cancel_prefetch(self) -> None:
+        if self.__background is not None:
+            self.__background.cancel()
 
     def __login(self) -> None:
+        from requests import RequestException
+        from client.request import Request
+        from primitives.email import Email
+        from primitives.password import Password
         while True:
             try:
                 email = self.__read("Email", Email)
                 password = self.__read_password("Password", Password)
 
-                response = requests.post(
-                    f"{self.__base_url}/auth/login/",
+                response = self.__client.post(
+                    "/auth/login/",
                     json={
                           "email": email.email,
                           "password": password.password,
@@ -67,17 +127,17 @@ class App:
                 if response.status_code != 200 and response.status_code != 201:
                     raise RequestException(response.text)
 
-                response1 = requests.get(
-                    f"{self.__base_url}/user/me/",
-                    headers={"Authorization": f"Token {response.json().get("key")}"},
-                )
+                # The genre map does not depend on the login, so it is warmed in the same round trip
+                me = Request.get("/user/me/", headers={"Authorization": f"Token {self.__client.json(response).get("key")}"})
+                self.__client.prefetch(me, Request.get("/genre/", cached=True))
+                response1 = self.__client.send(me)
 
-                if response1.json().get("is_superuser"):
+                if self.__client.json(response1).get("is_superuser"):
                     print("\nLogged in as admin successfully!")
-                    self.__change_tui_for_logged_admin(response.json().get("key"))
+                    self.__switch_to(Screen.ADMIN, self.__client.json(response).get("key"))
                 else:
                     print("\nLogged in successfully!")
-                    self.__change_tui_for_logged_user(response.json().get("key"))
+                    self.__switch_to(Screen.USER, self.__client.json(response).get("key"))
                 return
 
             except PasswordException:
@@ -89,6 +149,10 @@ class App:
 
 
     def __register(self) -> None:
+        from requests import RequestException
+        from primitives.email import Email
+        from primitives.password import Password
+        from primitives.username import Username
         while True:
             try:
                 username = self.__read("Username", Username)
@@ -98,8 +162,8 @@ class App:
 
                 validate("Confirm Password", confirm_password, equals=password)
 
-                response = requests.post(
-                    f"{self.__base_url}/auth/registration/",
+                response = self.__client.post(
+                    "/auth/registration/",
                     json={"username": username.username,
                           "email": email.email,
                           "password": password.password,
@@ -111,7 +175,7 @@ class App:
                     raise RequestException(response.text)
 
                 print("\nLogged in successfully!")
-                self.__change_tui_for_logged_user(response.json().get("key"))
+                self.__switch_to(Screen.USER, self.__client.json(response).get("key"))
                 return
             except UsernameException:
                 print(UsernameException.help_message + ". Please try again")
@@ -129,64 +193,237 @@ class App:
 
                 print(msg)
 
-    def __change_tui_for_logged_admin(self, token: str) -> None:
-        self.__token = Token(token)
-
-        self.__menu = ((Menu.Builder(Description("Fiordispino App"), auto_select=lambda: None).
-                        with_entry(Entry.create("1", "Show Games", on_selected=lambda: self.__show_games())).
-                        with_entry(Entry.create("2", "Show Genres", on_selected=lambda: self.__show_genres())).
-                        with_entry(Entry.create("3", "Add game", on_selected=lambda: self.__add_game())).
-                        with_entry(Entry.create("4", "Add genre", on_selected=lambda: self.__add_genre()))).
-                        with_entry(Entry.create("5", "Remove game", on_selected=lambda: self.__remove_game())).
-                        with_entry(Entry.create("6", "Remove genre", on_selected=lambda: self.__remove_genre())).
-                        with_entry(Entry.create("7", "Ban user", on_selected=lambda: self.__ban_user())).
-                        with_entry(Entry.create("8", "Show a user games to play list", on_selected=lambda: self.__show_games_to_play_given_user())).
-                        with_entry(Entry.create("9", "Show a user games played list", on_selected=lambda: self.__show_games_played_given_user())).
-                        with_entry(Entry.create("10", "Logout", on_selected=lambda: None, is_exit=True)).
-                        with_entry(Entry.create("0", "Exit", on_selected=lambda: sys.exit("Goodbye!"), is_exit=True)).
-                        build())
-
-        self.run()
-
-    def __change_tui_for_logged_user(self, token: str) -> None:
-        self.__token = Token(token)
-
-        self.__menu = ((Menu.Builder(Description("Fiordispino App"), auto_select=lambda: None).
-                       with_entry(Entry.create("1", "Show Games", on_selected=lambda: self.__show_games())).
-                       with_entry(Entry.create("2", "Show Genres", on_selected=lambda: self.__show_genres())).
-                       with_entry(Entry.create("3", "Show games to play", on_selected=lambda: self.__show_games_to_play())).
-                       with_entry(Entry.create("4", "Show games played", on_selected=lambda: self.__show_games_played()))).
-                       with_entry(Entry.create("5", "Add game to games to play", on_selected=lambda: self.__add_game_to_games_to_play())).
-                       with_entry(Entry.create("6", "Add game to games played", on_selected=lambda: self.__add_game_to_games_played())).
-                       with_entry(Entry.create("7", "Remove game from games to play", on_selected=lambda: self.__remove_game_from_games_to_play())).
-                       with_entry(Entry.create("8", "Remove game from games played", on_selected=lambda: self.__remove_game_from_games_played())).
-                       with_entry(Entry.create("9", "Move game from games to play to games played", on_selected= lambda: self.__move_game_from_games_to_play_to_games_played())).
-                       with_entry(Entry.create("10", "Show a user games to play list", on_selected= lambda: self.__show_games_to_play_given_user())).
-                       with_entry(Entry.create("11", "Show a user games played list", on_selected=lambda: self.__show_games_played_given_user())).
-                       with_entry(Entry.create("12", "Logout", on_selected=lambda: None, is_exit=True)).
-                       with_entry(Entry.create("0", "Exit", on_selected=lambda: sys.exit("Goodbye!"), is_exit=True)).
-                       build())
-
-        self.run()
+    def __switch_to(self, screen: Optional[Screen], token: Optional[str] = None) -> None:
+        self.__cancel_prefetch()
+        if token is not None:
+            from primitives.token import Token
+            self.__token = Token(token)
+        self.__screen = screen
+
+    def __exit(self) -> None:
+        print("Goodbye!")
+        self.__switch_to(None)
+
+    def __menu(self, screen: Screen) -> Menu:
+        if screen not in self.__menus:
+            self.__menus[screen] = {
+                Screen.LOGIN: self.__login_menu,
+                Screen.USER: self.__user_menu,
+                Screen.ADMIN: self.__admin_menu,
+            }[screen]()
+        return self.__menus[screen]
+
+    def __prefetch_next(self) -> None:
+        from client.request import Request
+        # The menu is about to wait in input(): meanwhile the lists its entries show are fetched
+        calls = [self.__games_pages().request(), Request.get("/genre/", cached=True)]
+        if self.__screen == Screen.USER:
+            calls += [Request.get("/games-to-play/", authenticated=True), Request.get("/games-played/", authenticated=True)]
+        self.__prefetcher.start(*calls)
+
+    def __login_menu(self) -> Menu:
+        # Login and Register leave this menu; they only return once the user is logged in
+        return ((Menu.Builder(Description("Fiordispino App"), auto_select=lambda: None).
+                with_entry(Entry.create("1", "Login", on_selected=lambda: self.__login(), is_exit=True))).
+                with_entry(Entry.create("2", "Register", on_selected=lambda: self.__register(), is_exit=True)).
+                with_entry(Entry.create("3", "Show Games", on_selected=lambda: self.__show_games())).
+                with_entry(Entry.create("4", "Show Genres", on_selected=lambda: self.__show_genres())).
+                with_entry(Entry.create("5", "Search games", on_selected=lambda: self.__search_games())).
+                with_entry(Entry.create("diag", "Diagnostics", on_selected=lambda: self.__diagnostics(), is_hidden=True)).
+                with_entry(Entry.create("0", "Exit", on_selected=lambda: self.__exit(), is_exit=True)).
+                build())
+
+    def __admin_menu(self) -> Menu:
+        return ((Menu.Builder(Description("Fiordispino App"), auto_select=lambda: self.__prefetch_next()).
+                with_entry(Entry.create("1", "Show Games", on_selected=lambda: self.__show_games())).
+                with_entry(Entry.create("2", "Show Genres", on_selected=lambda: self.__show_genres())).
+                with_entry(Entry.create("3", "Add game", on_selected=lambda: self.__add_game())).
+                with_entry(Entry.create("4", "Add genre", on_selected=lambda: self.__add_genre()))).
+                with_entry(Entry.create("5", "Remove game", on_selected=lambda: self.__remove_game())).
+                with_entry(Entry.create("6", "Remove genre", on_selected=lambda: self.__remove_genre())).
+                with_entry(Entry.create("7", "Ban user", on_selected=lambda: self.__ban_user())).
+                with_entry(Entry.create("8", "Show a user games to play list", on_selected=lambda: self.__show_games_to_play_given_user())).
+                with_entry(Entry.create("9", "Show a user games played list", on_selected=lambda: self.__show_games_played_given_user())).
+                with_entry(Entry.create("10", "Logout", on_selected=lambda: self.__switch_to(Screen.LOGIN), is_exit=True)).
+                with_entry(Entry.create("11", "Search games", on_selected=lambda: self.__search_games())).
+                with_entry(Entry.create("diag", "Diagnostics", on_selected=lambda: self.__diagnostics(), is_hidden=True)).
+                with_entry(Entry.create("0", "Exit", on_selected=lambda: sys.exit("Goodbye!"), is_exit=True)).
+                build())
+
+    def __user_menu(self) -> Menu:
+        return ((Menu.Builder(Description("Fiordispino App"), auto_select=lambda: self.__prefetch_next()).
+                with_entry(Entry.create("1", "Show Games", on_selected=lambda: self.__show_games())).
+                with_entry(Entry.create("2", "Show Genres", on_selected=lambda: self.__show_genres())).
+                with_entry(Entry.create("3", "Show games to play", on_selected=lambda: self.__show_games_to_play())).
+                with_entry(Entry.create("4", "Show games played", on_selected=lambda: self.__show_games_played()))).
+                with_entry(Entry.create("5", "Add game to games to play", on_selected=lambda: self.__add_game_to_games_to_play())).
+                with_entry(Entry.create("6", "Add game to games played", on_selected=lambda: self.__add_game_to_games_played())).
+                with_entry(Entry.create("7", "Remove game from games to play", on_selected=lambda: self.__remove_game_from_games_to_play())).
+                with_entry(Entry.create("8", "Remove game from games played", on_selected=lambda: self.__remove_game_from_games_played())).
+                with_entry(Entry.create("9", "Move game from games to play to games played", on_selected= lambda: self.__move_game_from_games_to_play_to_games_played())).
+                with_entry(Entry.create("10", "Show a user games to play list", on_selected= lambda: self.__show_games_to_play_given_user())).
+                with_entry(Entry.create("11", "Show a user games played list", on_selected=lambda: self.__show_games_played_given_user())).
+                with_entry(Entry.create("12", "Logout", on_selected=lambda: self.__switch_to(Screen.LOGIN), is_exit=True)).
+                with_entry(Entry.create("13", "Search games", on_selected=lambda: self.__search_games())).
+                with_entry(Entry.create("diag", "Diagnostics", on_selected=lambda: self.__diagnostics(), is_hidden=True)).
+                with_entry(Entry.create("0", "Exit", on_selected=lambda: sys.exit("Goodbye!"), is_exit=True)).
+                build())
+
+    def __diagnostics(self) -> None:
+        from utils.table import Column
+        # Hidden entry: where the time of this session went, backend requests apart from client-side work
+        table = self.__table([Column('KIND', 6), Column('NAME', 36, wrap=True), Column('COUNT', 6), Column('P50 MS', 8),
+                              Column('P95 MS', 8), Column('P99 MS', 8), Column('MAX MS', 8)], "diagnostics")
+        table.header()
+        for kind, name, histogram in self.__client.metrics.summary():
+            table.row(kind, name, histogram.count, *(f"{histogram.percentile(p) * 1000:.1f}" for p in (50, 95, 99)),
+                      f"{histogram.max * 1000:.1f}")
+        table.line()
+        table.flush()
+
+        path = self.__read("Export the trace to a JSONL file (empty to skip)", str)
+        if path:
+            try:
+                print(f"{self.__client.metrics.export(path)} events written to {path}")
+            except OSError as e:
+                print(e)
+
+    def __genre_map(self) -> Dict[int, Genre]:
+        if self.__genres is None:
+            self.__show_genres(with_print=False)
+        return self.__genres
 
     def __get_genre(self, id: int) -> 'Genre':
-        response = requests.get(f"{self.__base_url}/genre/{id}/")
+        from primitives.genre import Genre
+        genres = self.__genre_map()
 
-        return Genre(response.json().get("name"))
+        # Genres added after the map was loaded are fetched once and remembered
+        if id not in genres:
+            response = self.__client.get(f"/genre/{id}/")
+            genres[id] = Genre.of(self.__client.json(response).get("name"))
 
-    def __show_games(self) -> List[int]:
+        return genres[id]
 
-        response = requests.get(f"{self.__base_url}/game/")
-        response.raise_for_status()
-        games_data = response.json()
+    def __page_through(self, paginator: Paginator, render: Callable[[Page], None]) -> None:
+        page = paginator.first()
+        if not page.is_paginated:
+            render(page)
+            return
 
+        current = [page]
 
-        ids = []
-        print(
-            f"{'INDEX':5} | {'TITLE':30} | {'DESCRIPTION':40} | {'GENRE':20} | {'PEGI':6} | {'RELEASE DATE':12} | {'VOTE':13}")
-        print("-" * 157)
+        def render_current() -> None:
+            render(current[0])
+            last = current[0].start + len(current[0].items) - 1
+            total = f" of {current[0].count}" if current[0].count is not None else ""
+            self.__note(f"Rows {current[0].start}-{last}{total}")
+
+        def move(step: Callable[[Page], Optional[Page]]) -> None:
+            page = step(current[0])
+            if page is None:
+                self.__note("No more pages")
+            else:
+                current[0] = page
+
+        (Menu.Builder(Description("Pages"), auto_select=render_current).
+         with_entry(Entry.create("n", "Next page", on_selected=lambda: move(paginator.next))).
+         with_entry(Entry.create("p", "Previous page", on_selected=lambda: move(paginator.previous))).
+         with_entry(Entry.create("0", "Done", is_exit=True)).
+         build().
+         run())
+
+    def __games_pages(self) -> Paginator:
+        from client.pagination import Paginator
+        return Paginator(self.__client, "/game/", self.__page_size, cached=True)
+
+    def __catalogue_index(self) -> SearchIndex:
+        from catalogue.search_index import SearchIndex
+        # The stored catalogue is refreshed with what changed since the last sync, at most once a minute
+        if self.__search_index is not None and time.monotonic() - self.__synced_at < self.__sync_interval:
+            return self.__search_index
+
+        result = self.__sync.sync()
+        self.__synced_at = time.monotonic()
+        if self.__search_index is None:
+            self.__search_index = SearchIndex(self.__sync.store.games())
+        else:
+            for game in result.changed:
+                self.__search_index.add(game)
+            for id in result.deleted:
+                self.__search_index.remove(id)
+        return self.__search_index
+
+    def __search_games(self) -> None:
+        from catalogue.search_index import Query
+        from client.pagination import Page
+        query = self.__read("Search (e.g. zelda genre:adventure pegi<=12 rating>=7 year>=2010)", Query.parse)
+        games = self.__catalogue_index().search(query, limit=self.__page_size)
+        if len(games) == 0:
+            self.__note("No games found")
+            return
+        self.__print_games(Page(games), [])
+
+    def __select_game(self, ids: List[Optional[int]]) -> Optional[int]:
+        from catalogue.words import words
+        from client.pagination import Page
+        # A number picks from the printed list, text shows the best matching titles of the whole catalogue
+        def builder(value: str) -> Union[int, str]:
+            if value.isdigit():
+                validate('value', int(value), min_value=0, max_value=len(ids))
+                return int(value)
+            if not words(value):
+                raise ValueError("Type an index or part of a title")
+            return value
+
+        while True:
+            choice = self.__read('Index or title to search (0 to cancel)', builder)
+            if choice == 0:
+                return None
+            if isinstance(choice, int):
+                # Rows with invalid data are listed without an id; None is kept for a cancellation
+                if ids[choice - 1] is None:
+                    print("That game has invalid data, please choose another one")
+                    continue
+                return ids[choice - 1]
+
+            matches = self.__catalogue_index().complete(choice, k=self.__matches)
+            if len(matches) == 0:
+                self.__note("No games found")
+                continue
+            self.__print_games(Page(matches), [])
+
+            def match_builder(value: str) -> int:
+                validate('value', int(value), min_value=0, max_value=len(matches))
+                return int(value)
+
+            index = self.__read('Match (0 to search again)', match_builder)
+            if index != 0:
+                return matches[index - 1]["id"]
+
+    def __show_games(self) -> List[int]:
+        ids = []    # ids[index - 1] is the id of the game printed at that index, None for invalid rows
+        self.__page_through(self.__games_pages(), lambda page: self.__print_games(page, ids))
+        return ids
+
+    def __print_games(self, page: Page, ids: List[Optional[int]]) -> None:
+        from primitives.game_title import GameTitle
+        from primitives.genre import Genre
+        from primitives.global_rating import GlobalRating
+        from primitives.pegi import Pegi
+        table = self.__games_table('VOTE')
+        table.header()
+
+        # Whatever is fetched anyway keeps the search index fresh
+        if self.__search_index is not None:
+            for game in page.items:
+                if isinstance(game, dict) and "id" in game:
+                    self.__search_index.add(game)
+
+        for index, game in enumerate(page.items, start=page.start):
+            if len(ids) < index:
+                ids.extend([None] * (index - len(ids)))
+            ids[index - 1] = None
 
-        for index, game in enumerate(games_data, start=1):
             try:
                 # 1. Estrazione sicura dei dati
                 g_id = game.get("id")
@@ -200,11 +437,11 @@ class App:
                 # Se una di queste fallisce, il blocco 'except' cattura l'errore
                 title_obj = GameTitle(raw_title)
                 desc_obj = Description(raw_desc)
-                pegi_obj = Pegi(raw_pegi)
+                pegi_obj = Pegi.of(raw_pegi)
 
                 # Generi (gestione lista sicura)
                 genres_list = game.get("genres", [])
-                genres = [Genre(g.get("name", "Unknown")) for g in genres_list if isinstance(g, dict)]
+                genres = [Genre.of(g.get("name", "Unknown")) for g in genres_list if isinstance(g, dict)]
 
                 # 3. Logica Rating robusta
                 rating_str = str(raw_rating)
@@ -217,50 +454,68 @@ class App:
                     display_rating = str(GlobalRating.create(int(int_part), int(dec_part)))
 
                 # 4. Preparazione per la stampa
-                ids.append(g_id)
-                title_lines = textwrap.wrap(str(title_obj), 30)
-                description_lines = textwrap.wrap(str(desc_obj), 40)
+                ids[index - 1] = g_id
                 genres_str = ', '.join(str(g) for g in genres)
-
-                num_lines = max(len(title_lines), len(description_lines))
-
-                for i in range(num_lines):
-                    idx = str(index) if i == 0 else ""
-                    t = title_lines[i] if i < len(title_lines) else ""
-                    d = description_lines[i] if i < len(description_lines) else ""
-                    g = genres_str if i == 0 else ""
-                    p = str(pegi_obj) if i == 0 else ""
-                    r = raw_date if i == 0 else ""
-                    v = display_rating if i == 0 else ""
-                    print(f"{idx:5} | {t:30} | {d:40} | {g:20} | {p:6} | {r:12} | {v}")
+                table.row(index, title_obj, desc_obj, genres_str, pegi_obj, raw_date, display_rating)
 
             except Exception as e:
-                print(f"{index:5} | ERROR: Game ID {game.get('id')} has invalid data: {e}")
+                table.line(f"{index:5} | ERROR: Game ID {game.get('id')} has invalid data: {e}")
                 continue
 
-        print()
-        return ids
+        table.line()
+        table.flush()
+
+    def __table(self, columns: List[Column], name: str) -> Union[Table, Rows]:
+        from utils.table import Rows, Table
+        if self.__format == "table":
+            return Table(columns, Table.terminal_width(), name)
+        return Rows(self.__format, columns, name=name)
+
+    def __note(self, text: str = "") -> None:
+        # Headings and status lines around a list; like Rows.line, kept out of a machine-readable stdout
+        if self.__format == "table":
+            print(text)
+        else:
+            print(text, file=sys.stderr)
+
+    def __games_table(self, vote_header: str, vote_width: int = 13, name: str = "games") -> Union[Table, Rows]:
+        from utils.table import Column
+        return self.__table([Column('INDEX', 5), Column('TITLE', 30, wrap=True), Column('DESCRIPTION', 40, wrap=True),
+                             Column('GENRE', 20), Column('PEGI', 6), Column('RELEASE DATE', 12),
+                             Column(vote_header, vote_width)], name)
 
     def __show_genres(self, with_print=True) -> List[int]:
+        from primitives.genre import Genre
         genres = []
-        response = requests.get(f"{self.__base_url}/genre/")
+        genre_map = {}
+        response = self.__client.get("/genre/", cached=True)
 
         if with_print:
-            print(f"|\t\tGENRES:\t\t\t|")
+            self.__note(f"|\t\tGENRES:\t\t\t|")
 
-        for index, genre in enumerate(response.json(), start=1):
+        for index, genre in enumerate(self.__client.json(response), start=1):
             genres.append(genre.get("id"))
+            genre_map[genre.get("id")] = Genre.of(genre.get("name"))
             if with_print:
-                print(f"{index}: {Genre(genre.get("name"))}")
+                self.__note(f"{index}: {genre_map[genre.get('id')]}")
 
         if with_print:
-            print()
+            self.__note()
 
+        self.__genres = genre_map
         return genres
 
     def __get_game(self, id: int) -> tuple[GameTitle, GameDescription, list[Genre], Pegi, str, GlobalRating]:
-        response = requests.get(f"{self.__base_url}/game/{id}/")
-        data = response.json()
+        from client.request import Request
+        from primitives.game_description import GameDescription
+        from primitives.game_title import GameTitle
+        from primitives.global_rating import GlobalRating
+        from primitives.pegi import Pegi
+        if self.__genres is None:
+            self.__client.prefetch(Request.get(f"/game/{id}/"), Request.get("/genre/", cached=True))
+
+        response = self.__client.get(f"/game/{id}/")
+        data = self.__client.json(response)
 
         # --- Fix per i generi ---
         genres_data = data.get("genres", [])
@@ -293,34 +548,34 @@ class App:
             GameTitle(data.get("title")),
             GameDescription(data.get("description")),
             processed_genres,
-            Pegi(data.get("pegi")),
+            Pegi.of(data.get("pegi")),
             data.get("release_date"),
             rating_obj
         )
 
     def __show_games_to_play(self, with_print=True) -> Tuple[list[int], list[int]]:
-        response1 = requests.get(
-            f"{self.__base_url}/games-to-play/",
-            headers={"Authorization": f"Token {str(self.__token)}"}
-        )
+        from client.request import Request
+        from primitives.game_title import GameTitle
+        from primitives.genre import Genre
+        from primitives.global_rating import GlobalRating
+        from primitives.pegi import Pegi
+        items = self.__client.items(Request.get("/games-to-play/", authenticated=True))
 
         ids_global = [] # List that saves the ids of the global game
         ids_to_play = [] # List that saves the ids of the games to play
 
-        if with_print:
-            print(
-                f"{'INDEX':5} | {'TITLE':30} | {'DESCRIPTION':40} | {'GENRE':20} | {'PEGI':6} | {'RELEASE DATE':12} | {'VOTE BY USERS':13}"
-            )
-            print("-" * 157)
+        table = self.__games_table('VOTE BY USERS', name='games to play') if with_print else None
+        if table is not None:
+            table.header()
 
-        for index, item in enumerate(response1.json(), start=1):
+        for index, item in enumerate(items, start=1):
             ids_global.append(item.get("game").get("id"))
             ids_to_play.append(item.get("id"))
 
             title = str(GameTitle(item.get("game").get("title")))
             description = str(Description(item.get("game").get("description")))
-            genres = [Genre(genre.get("name")) for genre in item.get("game").get("genres")]
-            pegi = str(Pegi(item.get("game").get("pegi")))
+            genres = [Genre.of(genre.get("name")) for genre in item.get("game").get("genres")]
+            pegi = str(Pegi.of(item.get("game").get("pegi")))
             release_date = item.get("game").get("release_date")
 
             title_str = str(title)
@@ -337,44 +592,32 @@ class App:
                 decimal_str = decimal_str.ljust(2, "0")
                 vote_display = GlobalRating.create(int(integer_str), int(decimal_str))
 
-            title_lines = textwrap.wrap(title_str, 30)
-            description_lines = textwrap.wrap(description_str, 40)
-            num_lines = max(len(title_lines), len(description_lines))
-
-            for i in range(num_lines):
-                if with_print:
-                    print(
-                        f"{str(index) if i == 0 else '':5} | "
-                        f"{title_lines[i] if i < len(title_lines) else '':30} | "
-                        f"{description_lines[i] if i < len(description_lines) else '':40} | "
-                        f"{genres_str if i == 0 else '':20} | "
-                        f"{pegi_str if i == 0 else '':6} | "
-                        f"{release_date if i == 0 else '':12} | "
-                        f"{str(vote_display) if i == 0 else ''}"
-                    )
+            if table is not None:
+                table.row(index, title_str, description_str, genres_str, pegi_str, release_date, vote_display)
 
-        if with_print:
-            print()
+        if table is not None:
+            table.line()
+            table.flush()
 
         return (ids_global, ids_to_play)
 
     def __show_games_played(self, with_print=True) -> Tuple[list[int], list[int]]:
-        response = requests.get(
-            f"{self.__base_url}/games-played/",
-            headers={"Authorization": f"Token {str(self.__token)}"}
-        )
+        from client.request import Request
+        from primitives.game_description import GameDescription
+        from primitives.game_title import GameTitle
+        from primitives.genre import Genre
+        from primitives.pegi import Pegi
+        from primitives.vote import Vote
+        items = self.__client.items(Request.get("/games-played/", authenticated=True))
 
         ids_global = []  # List that saves the ids of the global game
         ids_played = []  # List that saves the ids of the games played
 
-        if with_print:
-            print(
-                f"{'INDEX':5} | {'TITLE':30} | {'DESCRIPTION':40} | "
-                f"{'GENRE':20} | {'PEGI':6} | {'RELEASE DATE':12} | {'VOTE GIVEN':13}"
-            )
-            print("-" * 157)
+        table = self.__games_table('VOTE GIVEN', name='games played') if with_print else None
+        if table is not None:
+            table.header()
 
-        for index, item in enumerate(response.json(), start=1):
+        for index, item in enumerate(items, start=1):
             ids_global.append(item.get("game").get("id"))
             ids_played.append(item.get("id"))
 
@@ -382,11 +625,11 @@ class App:
 
             title = GameTitle(game["title"])
             description = GameDescription(game["description"])
-            genres = [Genre(g["name"]) for g in game["genres"]]
-            pegi = Pegi(game["pegi"])
+            genres = [Genre.of(g["name"]) for g in game["genres"]]
+            pegi = Pegi.of(game["pegi"])
             release_date = game["release_date"]
 
-            vote = Vote(item["rating"])
+            vote = Vote.of(item["rating"])
 
             title_str = str(title)
             description_str = str(description)
@@ -394,27 +637,18 @@ class App:
             pegi_str = str(pegi)
             vote_str = str(vote)
 
-            title_lines = textwrap.wrap(title_str, 30)
-            description_lines = textwrap.wrap(description_str, 40)
-            num_lines = max(len(title_lines), len(description_lines))
+            if table is not None:
+                table.row(index, title_str, description_str, g, pegi_str, release_date, vote_str)
 
-            if with_print:
-                for i in range(num_lines):
-                    print(
-                        f"{str(index) if i == 0 else '':5} | "
-                        f"{title_lines[i] if i < len(title_lines) else '':30} | "
-                        f"{description_lines[i] if i < len(description_lines) else '':40} | "
-                        f"{g if i == 0 else '':20} | "
-                        f"{pegi_str if i == 0 else '':6} | "
-                        f"{release_date if i == 0 else '':12} | "
-                        f"{vote_str if i == 0 else ''}"
-                    )
-
-        if with_print:
-            print()
+        if table is not None:
+            table.line()
+            table.flush()
         return (ids_global, ids_played)
 
     def __add_game(self):
+        from primitives.game_description import GameDescription
+        from primitives.game_title import GameTitle
+        from primitives.pegi import Pegi
         def builder_year(value: str) -> int:
             validate("value", int(value), min_value=1952, max_value=datetime.now().year)
             return int(value)
@@ -479,56 +713,55 @@ class App:
                 'box_art': img_file
             }
 
-            response = requests.post(
-                f"{self.__base_url}/game/",
+            response = self.__client.post(
+                "/game/",
                 data=data,
                 files=files,
-                headers={"Authorization": f"Token {str(self.__token)}"}
+                authenticated=True
             )
 
         if response.status_code in [200, 201]:
+            game = self.__client.json(response)
+            if self.__search_index is not None and isinstance(game, dict) and "id" in game:
+                self.__search_index.add(game)
             print("Game added successfully!")
         else:
             print(f"Error: {response.status_code}")
             print(response.text)
 
     def __add_genre(self):
+        from primitives.genre import Genre
         genre_to_add = self.__read("Genre", Genre)
 
-        genres = self.__show_genres(with_print=False)
-
-        for id in genres:
-            if str(self.__get_genre(id)).lower() == str(genre_to_add).lower():
+        for genre in self.__genre_map().values():
+            if str(genre).lower() == str(genre_to_add).lower():
                 print("Genre already added")
                 return
 
-        response = requests.post(
-            f"{self.__base_url}/genre/",
+        response = self.__client.post(
+            "/genre/",
             json={
                 "name": str(genre_to_add),
             },
-            headers={"Authorization": f"Token {str(self.__token)}"}
+            authenticated=True
         )
+        self.__genres = None
 
         print("Genre added successfully!")
 
     def __remove_game(self):
-        ids = self.__show_games()
-
-        def builder(value: str) -> int:
-            validate("value", int(value), min_value=0, max_value=len(ids))
-            return int(value)
-
-        index = self.__read('Index (0 to cancel)', builder)
-        if index == 0:
+        game_id = self.__select_game(self.__show_games())
+        if game_id is None:
             print('Cancelled!')
             return
 
-        response = requests.delete(
-            f"{self.__base_url}/game/{ids[index - 1]}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
+        response = self.__client.delete(
+            f"/game/{game_id}/",
+            authenticated=True,
         )
 
+        if self.__search_index is not None:
+            self.__search_index.remove(game_id)
         print("Game removed successfully!")
 
     def __remove_genre(self):
@@ -543,42 +776,37 @@ class App:
             print('Cancelled!')
             return
 
-        response = requests.delete(
-            f"{self.__base_url}/genre/{ids[index - 1]}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
+        response = self.__client.delete(
+            f"/genre/{ids[index - 1]}/",
+            authenticated=True,
         )
+        self.__genres = None
 
         print("Genre removed successfully!")
 
     def __ban_user(self):
-        response = requests.get(
-            f"{self.__base_url}/user/",
-            headers={"Authorization": f"Token {str(self.__token)}"}
-        )
+        from client.request import Request
+        from primitives.email import Email
+        from primitives.username import Username
+        from utils.table import Column
+        items = self.__client.items(Request.get("/user/", authenticated=True))
 
-        print(f"{'USER':30} | {'EMAIL':50} |")
-        print("-" * 100)
+        table = self.__table([Column('INDEX', 5), Column('USER', 30, wrap=True), Column('EMAIL', 50, wrap=True)], "users")
+        table.header()
 
         users_id = []
 
-        for index, user in enumerate(response.json(), start=1):
+        for index, user in enumerate(items, start=1):
             users_id.append(user.get("id"))
             username = Username(user.get('username'))
-            email = Email(user.get('email'))
+            email = Email(user.get('email'), check_deliverability=False)
 
             username_str = str(username)
             email_str = str(email)
 
-            username_lines = textwrap.wrap(username_str, 30)
-            email_lines = textwrap.wrap(email_str, 50)
-            num_lines = max(len(username_lines), len(email_lines))
+            table.row(index, username_str, email_str)
 
-            for i in range(num_lines):
-                print(
-                    f"{str(index) if i == 0 else '':5} | "
-                    f"{username_lines[i] if i < len(username_lines) else '':30} | "
-                    f"{email_lines[i] if i < len(email_lines) else ''}"
-                )
+        table.flush()
 
         def builder(value: str) -> int:
             validate("value", int(value), min_value=0, max_value=len(users_id))
@@ -589,35 +817,33 @@ class App:
             print('Cancelled!')
             return
 
-        response = requests.delete(
-            f"{self.__base_url}/user/{users_id[index - 1]}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
+        response = self.__client.delete(
+            f"/user/{users_id[index - 1]}/",
+            authenticated=True,
         )
 
         print("User banned successfully!")
 
     def __add_game_to_games_to_play(self) -> None:
+        from client.request import Request
+        self.__client.prefetch(self.__games_pages().request(), Request.get("/games-to-play/", authenticated=True))
         ids = self.__show_games()
         ids_global, ids_to_play = self.__show_games_to_play(with_print=False)
 
-        def builder(value: str) -> int:
-            validate('value', int(value), min_value=0, max_value=len(ids))
-            return int(value)
-
-        index = self.__read('Index (0 to cancel)', builder)
-        if index == 0:
+        game_id = self.__select_game(ids)
+        if game_id is None:
             print('Cancelled!')
             return
-        elif ids[index - 1] in ids_global:
+        elif game_id in ids_global:
             print('Game already in list')
             return
 
-        response = requests.post(
-            f"{self.__base_url}/games-to-play/",
+        response = self.__client.post(
+            "/games-to-play/",
             json={
-                "game": ids[index - 1],
+                "game": game_id,
             },
-            headers={"Authorization": f"Token {str(self.__token)}"},
+            authenticated=True,
         )
 
         if(response.status_code >= 200 and response.status_code < 300):
@@ -626,33 +852,32 @@ class App:
             print("Impossible to add this game to games to play")
 
     def __add_game_to_games_played(self) -> None:
+        from client.request import Request
+        from primitives.vote import Vote
+        self.__client.prefetch(self.__games_pages().request(), Request.get("/games-played/", authenticated=True))
         ids = self.__show_games()
         ids_global, ids_played = self.__show_games_played(with_print=False)
 
-        def builder(value: str) -> int:
-            validate('value', int(value), min_value=0, max_value=len(ids))
-            return int(value)
-
         def vote_builder(value: str) -> 'Vote':
             return Vote(int(value))
 
-        index = self.__read('Index (0 to cancel)', builder)
-        if index == 0:
+        game_id = self.__select_game(ids)
+        if game_id is None:
             print('Cancelled!')
             return
-        elif ids[index - 1] in ids_global:
+        elif game_id in ids_global:
             print('Game already in list')
             return
 
         vote = self.__read('Vote', vote_builder)
 
-        response = requests.post(
-            f"{self.__base_url}/games-played/",
+        response = self.__client.post(
+            "/games-played/",
             json={
-                "game": ids[index - 1],
+                "game": game_id,
                 "rating": vote.vote,
             },
-            headers={"Authorization": f"Token {str(self.__token)}"},
+            authenticated=True,
         )
 
         if (response.status_code >= 200 and response.status_code < 300):
@@ -672,9 +897,9 @@ class App:
             print('Cancelled!')
             return
 
-        response = requests.delete(
-            f"{self.__base_url}/games-to-play/{ids_to_play[index - 1]}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
+        response = self.__client.delete(
+            f"/games-to-play/{ids_to_play[index - 1]}/",
+            authenticated=True,
         )
 
         print("Game removed from games to play!")
@@ -691,14 +916,15 @@ class App:
             print('Cancelled!')
             return
 
-        response = requests.delete(
-            f"{self.__base_url}/games-played/{ids_played[index - 1]}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
+        response = self.__client.delete(
+            f"/games-played/{ids_played[index - 1]}/",
+            authenticated=True,
         )
 
         print("Game removed from games played")
 
     def __move_game_from_games_to_play_to_games_played(self) -> None:
+        from primitives.vote import Vote
         ids_global, ids_to_play = self.__show_games_to_play()
 
         def builder(value: str) -> int:
@@ -713,49 +939,55 @@ class App:
             print('Cancelled!')
             return
 
-        response = requests.delete(
-            f"{self.__base_url}/games-to-play/{ids_to_play[index - 1]}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
-        )
-
+        # The vote is read first so that the two requests go out back to back and nothing is
+        # removed if the user never gets past the prompt. They stay sequential so that the game
+        # has left the backlog before it is recorded as played.
         vote = self.__read('Vote', vote_builder)
 
-        response = requests.post(
-            f"{self.__base_url}/games-played/",
+        response = self.__client.delete(
+            f"/games-to-play/{ids_to_play[index - 1]}/",
+            authenticated=True,
+        )
+
+        response = self.__client.post(
+            "/games-played/",
             json={
                 "game": ids_global[index - 1],
                 "rating": vote.vote,
             },
-            headers={"Authorization": f"Token {str(self.__token)}"},
+            authenticated=True,
         )
 
         print("Game moved to games played!")
 
     def __show_games_to_play_given_user(self) -> None:
+        from client.pagination import Paginator
+        from primitives.username import Username
         username = self.__read('Username', Username)
 
-        response = requests.get(
-            f"{self.__base_url}/games-to-play/owner/{str(username)}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
-        )
+        pages = Paginator(self.__client, f"/games-to-play/owner/{str(username)}/", self.__page_size, authenticated=True)
+        self.__page_through(pages, lambda page: self.__print_games_to_play_given_user(page, username))
 
-        if(len(response.json()) == 0):
-            print(f"No games for user {str(username)}")
+    def __print_games_to_play_given_user(self, page: Page, username: Username) -> None:
+        from primitives.game_title import GameTitle
+        from primitives.genre import Genre
+        from primitives.global_rating import GlobalRating
+        from primitives.pegi import Pegi
+        if len(page.items) == 0:
+            self.__note(f"No games for user {str(username)}")
             return
 
-        print(f"GAMES TO PLAY BY {str(username)}")
-        print(
-            f"{'INDEX':5} | {'TITLE':30} | {'DESCRIPTION':40} | {'GENRE':20} | {'PEGI':6} | {'RELEASE DATE':12} | {'VOTE BY USERS':13}"
-        )
-        print("-" * 157)
+        self.__note(f"GAMES TO PLAY BY {str(username)}")
+        table = self.__games_table('VOTE BY USERS', name='user games to play')
+        table.header()
 
-        for index, item in enumerate(response.json(), start=1):
+        for index, item in enumerate(page.items, start=page.start):
             game_id = item["game"]["id"]
 
             title = str(GameTitle(item.get("game").get("title")))
             description = str(Description(item.get("game").get("description")))
-            genres = [Genre(genre.get("name")) for genre in item.get("game").get("genres")]
-            pegi = str(Pegi(item.get("game").get("pegi")))
+            genres = [Genre.of(genre.get("name")) for genre in item.get("game").get("genres")]
+            pegi = str(Pegi.of(item.get("game").get("pegi")))
             release_date = item.get("game").get("release_date")
 
             title_str = str(title)
@@ -772,51 +1004,45 @@ class App:
                 decimal_str = decimal_str.ljust(2, "0")
                 vote_display = GlobalRating.create(int(integer_str), int(decimal_str))
 
-            title_lines = textwrap.wrap(title_str, 30)
-            description_lines = textwrap.wrap(description_str, 40)
-            num_lines = max(len(title_lines), len(description_lines))
-
-            for i in range(num_lines):
-                print(
-                    f"{str(index) if i == 0 else '':5} | "
-                    f"{title_lines[i] if i < len(title_lines) else '':30} | "
-                    f"{description_lines[i] if i < len(description_lines) else '':40} | "
-                    f"{genres_str if i == 0 else '':20} | "
-                    f"{pegi_str if i == 0 else '':6} | "
-                    f"{release_date if i == 0 else '':12} | "
-                    f"{str(vote_display) if i == 0 else ''}"
-                )
+            table.row(index, title_str, description_str, genres_str, pegi_str, release_date, vote_display)
 
-        print()
+        table.line()
+        table.flush()
 
     def __show_games_played_given_user(self):
+        from client.pagination import Paginator
+        from primitives.username import Username
         username = self.__read('Username', Username)
 
-        response = requests.get(
-            f"{self.__base_url}/games-played/owner/{str(username)}/",
-            headers={"Authorization": f"Token {str(self.__token)}"},
-        )
-
-        if (len(response.json()) == 0):
-            print(f"No games for user {str(username)}")
+        pages = Paginator(self.__client, f"/games-played/owner/{str(username)}/", self.__page_size, authenticated=True)
+        self.__page_through(pages, lambda page: self.__print_games_played_given_user(page, username))
+
+    def __print_games_played_given_user(self, page: Page, username: Username) -> None:
+        from primitives.game_description import GameDescription
+        from primitives.game_title import GameTitle
+        from primitives.genre import Genre
+        from primitives.pegi import Pegi
+        from primitives.vote import Vote
+        if len(page.items) == 0:
+            self.__note(f"No games for user {str(username)}")
             return
 
-        print(f"GAMES PLAYED BY {str(username)}")
-        print(
-            f"{'INDEX':5} | {'TITLE':30} | {'DESCRIPTION':40} | {'GENRE':20} | {'PEGI':6} | {'RELEASE DATE':12} | {f'VOTE GIVEN BY {str(username)}':30}"
-        )
-        print("-" * 157)
+        self.__note(f"GAMES PLAYED BY {str(username)}")
+        # Streamed rows keep the same keys for every user
+        vote_header = f'VOTE GIVEN BY {str(username)}' if self.__format == "table" else 'VOTE GIVEN'
+        table = self.__games_table(vote_header, 30, 'user games played')
+        table.header()
 
-        for index, item in enumerate(response.json(), start=1):
+        for index, item in enumerate(page.items, start=page.start):
             game = item["game"]
 
             title = GameTitle(game["title"])
             description = GameDescription(game["description"])
-            genres = [Genre(g["name"]) for g in game["genres"]]
-            pegi = Pegi(game["pegi"])
+            genres = [Genre.of(g["name"]) for g in game["genres"]]
+            pegi = Pegi.of(game["pegi"])
             release_date = game["release_date"]
 
-            vote = Vote(item["rating"])
+            vote = Vote.of(item["rating"])
 
             title_str = str(title)
             description_str = str(description)
@@ -824,23 +1050,10 @@ class App:
             pegi_str = str(pegi)
             vote_str = str(vote)
 
-            title_lines = textwrap.wrap(title_str, 30)
-            description_lines = textwrap.wrap(description_str, 40)
-            num_lines = max(len(title_lines), len(description_lines))
-
-            for i in range(num_lines):
-                print(
-                    f"{str(index) if i == 0 else '':5} | "
-                    f"{title_lines[i] if i < len(title_lines) else '':30} | "
-                    f"{description_lines[i] if i < len(description_lines) else '':40} | "
-                    f"{g if i == 0 else '':20} | "
-                    f"{pegi_str if i == 0 else '':6} | "
-                    f"{release_date if i == 0 else '':12} | "
-                    f"{vote_str if i == 0 else ''}"
-                )
-
+            table.row(index, title_str, description_str, g, pegi_str, release_date, vote_str)
 
-        print()
+        table.line()
+        table.flush()
 
     @staticmethod
     def __read_password(prompt: str, builder: Callable) -> Any:
@@ -866,10 +1079,13 @@ class App:
                 print(e.help_message)
 
     def __run(self) -> None:
-        self.__menu.run()
+        while self.__screen is not None:
+            self.__menu(self.__screen).run()
 
     def run(self) -> None:
         try:
             self.__run()
         except Exception as e:
             print(e)
+        finally:
+            self.__cancel_prefetch()
@@ -0,0 +1,428 @@
+import argparse
+import csv
+import getpass
+import json
+import os
+import shlex
+import sys
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from valid8 import ValidationError, validate
+
+from client.http_client import HttpClient
+from client.pagination import Paginator
+from client.request import Request
+from exceptions.primitives.game_description_exception import GameDescriptionException
+from exceptions.primitives.game_title_exception import GameTitleException
+from exceptions.primitives.genre_exception import GenreException
+from exceptions.primitives.password_exception import PasswordException
+from exceptions.primitives.pegi_ranking_exception import PegiRankingException
+from exceptions.primitives.token_exception import TokenException
+from exceptions.primitives.username_exception import UsernameException
+from exceptions.primitives.vote_exception import VoteException
+from primitives.email import Email
+from primitives.game_description import GameDescription
+from primitives.game_title import GameTitle
+from primitives.genre import Genre
+from primitives.password import Password
+from primitives.pegi import Pegi
+from primitives.token import Token
+from primitives.username import Username
+from primitives.vote import Vote
+from utils.table import FORMATS, Column, Rows, Table
+
+
+def _ids(value: str) -> List[int]:
+    try:
+        ids = [int(v) for v in value.split(",") if v.strip()]
+        for id in ids:
+            validate("id", id, min_value=1)
+    except (ValueError, ValidationError):
+        raise argparse.ArgumentTypeError(f"expected comma separated positive ids, got {value!r}")
+    if not ids:
+        raise argparse.ArgumentTypeError("expected at least one id")
+    return ids
+
+
+def _concurrency(value: str) -> int:
+    try:
+        concurrency = int(value)
+        validate("concurrency", concurrency, min_value=1)
+    except (ValueError, ValidationError):
+        raise argparse.ArgumentTypeError(f"expected a positive number of requests, got {value!r}")
+    return concurrency
+
+
+def _vote(value: str) -> Vote:
+    try:
+        return Vote.of(int(value))
+    except (ValueError, VoteException):
+        raise argparse.ArgumentTypeError(VoteException.help_message)
+
+
+def _token(value: str) -> Token:
+    try:
+        return Token(value)
+    except TokenException:
+        raise argparse.ArgumentTypeError(TokenException.help_message)
+
+
+def _username(value: str) -> Username:
+    try:
+        return Username(value)
+    except UsernameException:
+        raise argparse.ArgumentTypeError(UsernameException.help_message)
+
+
+_GAME_COLUMNS = [Column('ID', 6), Column('TITLE', 30, wrap=True), Column('DESCRIPTION', 40, wrap=True),
+                 Column('GENRES', 20, wrap=True), Column('PEGI', 7), Column('RELEASE DATE', 12)]
+
+
+class Batch:
+    """Headless counterpart of App, for scripts and pipelines.
+
+    Commands are validated with the same primitives as the TUI, and the requests of one command are
+    sent concurrently over the pooled client. A command file (or "-" for stdin) holds one command per
+    line; every line is parsed before any request is sent. The list commands stream their rows page
+    by page as a table, NDJSON or CSV (--format), validating every row before it is written.
+    """
+
+    default_base_url = "http://localhost:8000/api/v1"
+    list_page_size = 1000    # streamed pages cost no memory, so the list commands ask for few, large ones
+    rows_per_flush = 100
+
+    def __init__(self, base_url: str = default_base_url, max_concurrency: int = 8, out: Optional[TextIO] = None,
+                 output_format: str = "table") -> None:
+        validate("output_format", output_format, is_in=FORMATS)
+        self.__token: Optional[Token] = None
+        self.__client = HttpClient(base_url, token=lambda: self.__token, max_concurrency=max_concurrency)
+        self.__out = out or sys.stdout
+        self.__format = output_format
+
+    @staticmethod
+    def parser(script: bool = False) -> argparse.ArgumentParser:
+        """The command line parser; with script=True, for a line of a command file.
+
+        A line leaves out the options it does not give, so that those of the command line apply.
+        """
+        def default(value: Any) -> Any:
+            return argparse.SUPPRESS if script else value
+
+        parser = argparse.ArgumentParser(prog="fiordispino", description="Run Fiordispino operations without the menus.")
+        base_url = os.environ.get("FIORDISPINO_BASE_URL", Batch.default_base_url)
+        parser.add_argument("--base-url", default=default(base_url))
+        parser.add_argument("--token", type=_token, default=default(None),
+                            help="authentication token, defaults to $FIORDISPINO_TOKEN")
+        parser.add_argument("--email", default=default(None),
+                            help="log in with this email; the password is read from $FIORDISPINO_PASSWORD")
+        parser.add_argument("--concurrency", type=_concurrency, default=default(8), help="requests in flight at once")
+        parser.add_argument("--format", choices=FORMATS, default=default("table"), help="output of the list commands")
+        commands = parser.add_subparsers(dest="command", required=True)
+
+        for name, help in (("add-to-play", "add games to your games to play"),
+                           ("remove-to-play", "remove games from your games to play"),
+                           ("remove-played", "remove games from your games played"),
+                           ("ban", "ban users (admin only)")):
+            command = commands.add_parser(name, help=help)
+            command.add_argument("--ids", type=_ids, required=True, help="comma separated game or user ids")
+
+        command = commands.add_parser("add-played", help="add games to your games played with a vote")
+        command.add_argument("--ids", type=_ids, required=True, help="comma separated game ids")
+        command.add_argument("--vote", type=_vote, required=True, help="vote between 1 and 10")
+
+        command = commands.add_parser("import-games", help="add the games of a CSV or JSONL file (admin only)")
+        command.add_argument("file", help="games file: .csv with ';' separated genres, or .jsonl")
+        command.add_argument("--box-art", default="placeholder_images/useful_formula.jpg",
+                             help="image uploaded as the box art of every game")
+
+        for name, help in (("list-games", "list the catalogue"),
+                           ("list-to-play", "list your games to play, or those of --owner"),
+                           ("list-played", "list your games played, or those of --owner"),
+                           ("list-users", "list the users (admin only)")):
+            command = commands.add_parser(name, help=help)
+            # Also accepted after the command; left unset there, the option before it still applies
+            command.add_argument("--format", choices=FORMATS, default=argparse.SUPPRESS, help="output of the list")
+            if name in ("list-to-play", "list-played"):
+                command.add_argument("--owner", type=_username, default=None, help="username whose list is shown")
+
+        command = commands.add_parser("run", help="run the commands of a file, one per line")
+        command.add_argument("file", help="command file, or - for stdin")
+        return parser
+
+    def login(self, token: Optional[Token] = None, email: Optional[str] = None,
+              password: Optional[str] = None) -> None:
+        if token is not None:
+            self.__token = token
+            return
+
+        response = self.__client.post("/auth/login/", json={
+            "email": Email(email).email,
+            "password": Password(password).password,
+        })
+        if response.status_code not in (200, 201):
+            raise PermissionError(f"login failed: HTTP {response.status_code}")
+        self.__token = Token(self.__client.json(response).get("key"))
+
+    def __write(self, status: str, command: str, id: Any, reason: str = "") -> None:
+        self.__out.write(f"{status} {command} {id}{': ' + reason if reason else ''}\n")
+
+    def __send_all(self, command: str, calls: List[Tuple[Any, Request]],
+                   on_done: Optional[Callable[[], None]] = None) -> int:
+        failed = 0
+        responses = self.__client.gather(*(request for _, request in calls), return_exceptions=True, on_done=on_done)
+        for (id, _), response in zip(calls, responses):
+            if isinstance(response, BaseException):
+                reason = str(response) or type(response).__name__
+            elif not 200 <= response.status_code < 300:
+                reason = f"HTTP {response.status_code}"
+            else:
+                self.__write("OK", command, id)
+                continue
+            failed += 1
+            self.__write("FAILED", command, id, reason)
+        return failed
+
+    def __own_list(self, path: str) -> Dict[int, int]:
+        # Game id -> id of the list entry holding it
+        return {item["game"]["id"]: item["id"] for item in Paginator(self.__client, path, authenticated=True).items()}
+
+    def __add(self, command: str, path: str, ids: List[int], payload: Dict[str, Any]) -> int:
+        listed = self.__own_list(path)
+        calls = []
+        for id in dict.fromkeys(ids):
+            if id in listed:
+                self.__write("SKIPPED", command, id, "already in list")
+            else:
+                calls.append((id, Request.post(path, True, json={"game": id, **payload})))
+        return self.__send_all(command, calls)
+
+    def __remove(self, command: str, path: str, ids: List[int]) -> int:
+        listed = self.__own_list(path)
+        calls = []
+        failed = 0
+        for id in dict.fromkeys(ids):
+            if id not in listed:
+                failed += 1
+                self.__write("FAILED", command, id, "not in list")
+            else:
+                calls.append((id, Request.delete(f"{path}{listed[id]}/", True)))
+        return failed + self.__send_all(command, calls)
+
+    def execute(self, args: argparse.Namespace) -> int:
+        """Runs one parsed command and returns the number of failed operations.
+
+        A --format given with the command, e.g. on a line of a command file, overrides the batch's.
+        """
+        output_format = getattr(args, "format", self.__format)
+        if args.command == "add-to-play":
+            return self.__add(args.command, "/games-to-play/", args.ids, {})
+        if args.command == "add-played":
+            return self.__add(args.command, "/games-played/", args.ids, {"rating": args.vote.vote})
+        if args.command == "remove-to-play":
+            return self.__remove(args.command, "/games-to-play/", args.ids)
+        if args.command == "remove-played":
+            return self.__remove(args.command, "/games-played/", args.ids)
+        if args.command == "ban":
+            return self.__send_all(args.command, [(id, Request.delete(f"/user/{id}/", True)) for id in dict.fromkeys(args.ids)])
+        if args.command == "list-games":
+            return self.__list(args.command, output_format, "/game/", False, _GAME_COLUMNS + [Column('GLOBAL RATING', 13)],
+                               lambda game: [*self.__game_cells(game, output_format), game.get("global_rating")])
+        if args.command in ("list-to-play", "list-played"):
+            path = "/games-to-play/" if args.command == "list-to-play" else "/games-played/"
+            if args.owner is not None:
+                path = f"{path}owner/{args.owner}/"
+            if args.command == "list-to-play":
+                return self.__list(args.command, output_format, path, True, _GAME_COLUMNS,
+                                   lambda item: self.__game_cells(item["game"], output_format))
+            return self.__list(args.command, output_format, path, True, _GAME_COLUMNS + [Column('VOTE', 4)],
+                               lambda item: [*self.__game_cells(item["game"], output_format),
+                                             Vote.of(item["rating"]).vote])
+        if args.command == "list-users":
+            return self.__list(args.command, output_format, "/user/", True, [Column('ID', 6), Column('USERNAME', 30), Column('EMAIL', 50)],
+                               lambda user: [user["id"], Username(user["username"]),
+                                             Email(user["email"], check_deliverability=False)])
+        if args.command == "import-games":
+            return self.__import_games(args.file, args.box_art)
+        if args.command == "run":
+            return self.__script(args.file)
+        raise ValueError(f"unknown command {args.command}")
+
+    @staticmethod
+    def __game_cells(game: Dict[str, Any], output_format: str) -> List[Any]:
+        genres = [str(Genre.of(genre["name"])) for genre in game["genres"]]
+        pegi = Pegi.of(game["pegi"])
+        # NDJSON carries values for other tools to read; the table and CSV show what the TUI prints
+        if output_format == "ndjson":
+            return [game["id"], GameTitle(game["title"]), GameDescription(game["description"]), genres,
+                    pegi.pegi_ranking_int, game["release_date"]]
+        return [game["id"], GameTitle(game["title"]), GameDescription(game["description"]), ", ".join(genres),
+                pegi, game["release_date"]]
+
+    def __list(self, command: str, output_format: str, path: str, authenticated: bool, columns: List[Column],
+               cells: Callable[[Any], List[Any]]) -> int:
+        # Items are decoded from the response as it downloads and each row is written as soon as it is
+        # validated, so only one item is held however long the list; invalid rows are reported on stderr
+        if output_format == "table":
+            rows = Table(columns, name=command)
+        else:
+            rows = Rows(output_format, columns, self.__out, command)
+        rows.header()
+        failed = 0
+        items = Paginator(self.__client, path, self.list_page_size, authenticated).stream()
+        for number, item in enumerate(items, start=1):
+            try:
+                rows.row(*cells(item))
+            except (GameTitleException, GameDescriptionException, GenreException, PegiRankingException,
+                    UsernameException, VoteException) as e:
+                failed += 1
+                print(f"FAILED {command} {item.get('id')}: {e.help_message}", file=sys.stderr)
+            except (KeyError, TypeError, ValueError) as e:
+                failed += 1
+                print(f"FAILED {command} {item.get('id')}: invalid data ({e!r})", file=sys.stderr)
+            if number % self.rows_per_flush == 0:
+                rows.flush(self.__out)
+        rows.flush(self.__out)
+        return failed
+
+    @staticmethod
+    def __game_rows(file: str) -> Iterator[Tuple[int, Union[Dict[str, Any], str]]]:
+        # JSONL lines are yielded undecoded, so that a malformed one is reported with the other rows
+        with open(file, encoding="utf-8", newline="") as f:
+            if file.endswith(".csv"):
+                reader = csv.DictReader(f)
+                for row in reader:
+                    yield reader.line_num, row
+            elif file.endswith((".jsonl", ".ndjson")):
+                for number, line in enumerate(f, start=1):
+                    if line.strip():
+                        yield number, line
+            else:
+                raise ValueError(f"{file}: games can be imported from .csv or .jsonl files")
+
+    @staticmethod
+    def __game_form(row: Dict[str, Any], genre_ids: Dict[Genre, int]) -> List[Tuple[str, str]]:
+        title = GameTitle(row.get("title"))
+        description = GameDescription(row.get("description"))
+        pegi = Pegi.of(int(row.get("pegi")))
+        release_date = date.fromisoformat(row.get("release_date"))
+        validate("release_date.year", release_date.year, min_value=1952, max_value=datetime.now().year)
+
+        names = row.get("genres") or []
+        if isinstance(names, str):
+            names = [name.strip() for name in names.split(";") if name.strip()]
+        genres = [Genre.of(name) for name in names]
+        validate("genres", len(genres), min_value=1, max_value=5)
+        unknown = [str(g) for g in genres if g not in genre_ids]
+        if unknown:
+            raise ValueError(f"unknown genres {', '.join(unknown)}")
+
+        data = [
+            ("description", str(description)),
+            ("title", str(title)),
+            ("pegi", str(pegi.pegi_ranking_int)),
+            ("release_date", release_date.isoformat()),
+        ]
+        data.extend(("genres", str(genre_ids[g])) for g in dict.fromkeys(genres))
+        return data
+
+    def __import_games(self, file: str, box_art: str) -> int:
+        response = self.__client.get("/genre/", cached=True)
+        response.raise_for_status()
+        genre_ids = {Genre.of(genre.get("name")): genre.get("id") for genre in self.__client.json(response)}
+
+        forms = []
+        errors = []
+        for number, row in self.__game_rows(file):
+            try:
+                if isinstance(row, str):
+                    row = json.loads(row)
+                    if not isinstance(row, dict):
+                        raise ValueError("expected a JSON object")
+                forms.append((number, self.__game_form(row, genre_ids)))
+            except json.JSONDecodeError as e:
+                errors.append(f"{file}, line {number}: invalid JSON, {e.msg} at column {e.colno}")
+            except (GameTitleException, GameDescriptionException, GenreException, PegiRankingException) as e:
+                errors.append(f"{file}, line {number}: {e.help_message}")
+            except (TypeError, ValueError, ValidationError) as e:
+                errors.append(f"{file}, line {number}: {e}")
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        # One read of the image; the bytes are reused by every upload
+        with open(box_art, "rb") as f:
+            box_art_file = (os.path.basename(box_art), f.read())
+
+        calls = [(number, Request.post("/game/", True, data=data, files={"box_art": box_art_file}))
+                 for number, data in forms]
+        return self.__send_all("import-games", calls, self.__progress("games", len(calls)))
+
+    @staticmethod
+    def __progress(unit: str, total: int) -> Callable[[], None]:
+        # Reports to stderr roughly every tenth of the work and at the end, so stdout stays one line per id
+        start = time.perf_counter()
+        step = max(1, total // 10)
+        done = 0
+
+        def on_done() -> None:
+            nonlocal done
+            done += 1
+            if done % step == 0 or done == total:
+                elapsed = time.perf_counter() - start
+                print(f"{done}/{total} {unit} in {elapsed:.1f}s ({done / elapsed if elapsed else 0:.1f} {unit}/s)",
+                      file=sys.stderr)
+        return on_done
+
+    def __script(self, file: str) -> int:
+        if file == "-":
+            lines = sys.stdin.readlines()
+        else:
+            with open(file, encoding="utf-8") as f:
+                lines = f.readlines()
+
+        parser = self.parser(script=True)
+        commands = []
+        for number, line in enumerate(lines, start=1):
+            argv = shlex.split(line, comments=True)
+            if not argv:
+                continue
+            try:
+                args = parser.parse_args(argv)
+            except SystemExit:
+                raise ValueError(f"{file}, line {number}: invalid command {line.strip()!r}")
+            if args.command == "run":
+                raise ValueError(f"{file}, line {number}: command files cannot be nested")
+            # One client and one login serve the whole file; only the output can change per line
+            session = [f"--{name.replace('_', '-')}" for name in ("base_url", "token", "email", "concurrency")
+                       if name in vars(args)]
+            if session:
+                raise ValueError(f"{file}, line {number}: {', '.join(session)} can only be given before run")
+            commands.append(args)
+
+        return sum(self.execute(args) for args in commands)
+
+    def close(self) -> None:
+        self.__client.close()
+
+    @staticmethod
+    def main(argv: List[str], out: Optional[TextIO] = None) -> int:
+        args = Batch.parser().parse_args(argv)
+        batch = Batch(args.base_url, args.concurrency, out, args.format)
+
+        try:
+            token = args.token or (_token(os.environ["FIORDISPINO_TOKEN"]) if os.environ.get("FIORDISPINO_TOKEN") else None)
+            # The catalogue is public, every other command acts as a user
+            if token is None and args.email is None and args.command != "list-games":
+                raise PermissionError("no credentials: pass --token, set $FIORDISPINO_TOKEN or use --email")
+            if token is not None or args.email is not None:
+                password = None if token is not None else (os.environ.get("FIORDISPINO_PASSWORD") or getpass.getpass("Password: "))
+                batch.login(token, args.email, password)
+            failed = batch.execute(args)
+        except (argparse.ArgumentTypeError, PermissionError, PasswordException, ValueError, OSError) as e:
+            print(f"fiordispino: {e}", file=sys.stderr)
+            return 2
+        finally:
+            batch.close()
+
+        return 1 if failed else 0
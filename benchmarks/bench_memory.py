@@ -0,0 +1,64 @@
+"""Bytes per game record held in memory, with slotted primitives and with per-instance __dict__s.
+
+Run with ``python -m benchmarks.bench_memory [count]``. The "dict" figures use copies of the
+primitives declared as plain frozen dataclasses, without __slots__, which is how they were laid out
+before they were slotted.
+"""
+import sys
+import tracemalloc
+from dataclasses import MISSING, field, make_dataclass
+from typing import Callable, Dict, List
+
+from functionalities.description import Description
+from primitives.game_title import GameTitle
+from primitives.genre import Genre
+from primitives.global_rating import GlobalRating
+from primitives.pegi import Pegi
+
+
+def unslotted(cls: type) -> type:
+    """The same frozen dataclass declared anew without slots=True; a subclass would keep the slots too."""
+    # Validation and private class attributes, e.g. GlobalRating's create key, come along
+    namespace = {name: value for name, value in vars(cls).items()
+                 if name in ("__post_init__", "__str__") or name.startswith(f"_{cls.__name__}__")}
+    fields = [(f.name, f.type, field() if f.default is MISSING else field(default=f.default))
+              for f in cls.__dataclass_fields__.values()]
+    return make_dataclass(cls.__name__, fields, namespace=namespace, frozen=True, order=True)
+
+
+def records(count: int, title: type, description: type, genre: type, pegi: type,
+            rating: Callable[[int, int], object]) -> List[Dict[str, object]]:
+    # Genres and PEGI values are rebuilt per record on purpose, as an uninterned catalogue would do
+    return [{
+        "title": title(f"Game {i}"),
+        "description": description(f"A fantastic game, number {i}."),
+        "genres": [genre("Role Playing"), genre("Adventure")],
+        "pegi": pegi((3, 7, 12, 16, 18)[i % 5]),
+        "global_rating": rating(i % 10, i % 100),
+    } for i in range(count)]
+
+
+def measure(count: int, **layout) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    catalogue = records(count, **layout)
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del catalogue
+    return allocated / count
+
+
+def main(count: int = 100_000) -> None:
+    rating = unslotted(GlobalRating)
+    layouts = {
+        "slots": dict(title=GameTitle, description=Description, genre=Genre, pegi=Pegi, rating=GlobalRating.create),
+        "dict": dict(title=unslotted(GameTitle), description=unslotted(Description), genre=unslotted(Genre),
+                     pegi=unslotted(Pegi), rating=lambda i, d: rating(d + i * 100, GlobalRating._GlobalRating__create_key)),
+    }
+    print(f"{'LAYOUT':8} | {'BYTES/RECORD':>12}")
+    for name, layout in layouts.items():
+        print(f"{name:8} | {measure(count, **layout):12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
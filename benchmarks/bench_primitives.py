@@ -0,0 +1,64 @@
+"""Construction throughput of the validated primitives.
+
+Run with ``python -m benchmarks.bench_primitives [count]``.
+"""
+import sys
+import time
+from typing import Callable
+
+from functionalities.description import Description
+from functionalities.key import Key
+from primitives.email import Email
+from primitives.game_description import GameDescription
+from primitives.game_title import GameTitle
+from primitives.genre import Genre
+from primitives.global_rating import GlobalRating
+from primitives.password import Password
+from primitives.pegi import Pegi
+from primitives.publisher import Publisher
+from primitives.ranting_count import RatingCount
+from primitives.token import Token
+from primitives.username import Username
+from primitives.vote import Vote
+from utils.regex import pattern
+
+PRIMITIVES = {
+    "GameTitle": lambda i: GameTitle(f"Game {i}"),
+    "GameDescription": lambda i: GameDescription(f"A fantastic game, number {i}."),
+    "Genre": lambda i: Genre("Role Playing"),
+    "Genre.of": lambda i: Genre.of("Role Playing"),
+    "Pegi": lambda i: Pegi((3, 7, 12, 16, 18)[i % 5]),
+    "Pegi.of": lambda i: Pegi.of((3, 7, 12, 16, 18)[i % 5]),
+    "Publisher": lambda i: Publisher(f"Publisher {i}"),
+    "Token": lambda i: Token(f"{i:040d}"),
+    "Username": lambda i: Username(f"user_{i}"),
+    "Description": lambda i: Description(f"Entry {i}"),
+    "Key": lambda i: Key(str(i % 100)),
+    "Vote": lambda i: Vote(i % 10 + 1),
+    "Vote.of": lambda i: Vote.of(i % 10 + 1),
+    "GlobalRating": lambda i: GlobalRating.create(i % 10, i % 100),
+    "RatingCount": lambda i: RatingCount(i),
+    "Password": lambda i: Password(f"password{i}"),
+    "Email": lambda i: Email(f"user{i}@gmail.com", check_deliverability=False),
+}
+
+
+def measure(build: Callable[[int], object], count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        build(i)
+    return time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    print(f"{'PRIMITIVE':16} | {'OBJECTS/S':>12} | {'US/OBJECT':>9}")
+    for name, build in PRIMITIVES.items():
+        elapsed = measure(build, count)
+        print(f"{name:16} | {count / elapsed:12,.0f} | {elapsed / count * 1e6:9.2f}")
+
+    elapsed = measure(lambda i: pattern(r'[a-zA-Z0-9\s:]*'), count)
+    print(f"{'pattern()':16} | {count / elapsed:12,.0f} | {elapsed / count * 1e6:9.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,55 @@
+"""Build and query times of the catalogue search index.
+
+Run with ``python -m benchmarks.bench_search [count]``.
+"""
+import random
+import sys
+import time
+
+from catalogue.search_index import Query, SearchIndex
+
+QUERIES = ["zelda", "zelda 123", "genre:shooter", "pegi:18", "year>=2010 rating>=7.5",
+           "zelda genre:shooter pegi<=12 rating>=7.5 year>=2010"]
+COMPLETIONS = ["zel", "zelda orig", "zleda", "portla relaoded", "mario 1234"]
+
+
+def catalogue(count: int):
+    rng = random.Random(0)
+    return [{
+        "id": i,
+        "title": f"{rng.choice(['Zelda', 'Mario', 'Doom', 'Halo', 'Portal'])} {rng.choice(['Origins', 'Legends', 'II', 'Reloaded'])} {i}",
+        "genres": [{"name": rng.choice(["Shooter", "Role Playing", "Adventure", "Puzzle"])}],
+        "pegi": rng.choice([3, 7, 12, 16, 18]),
+        "release_date": f"{rng.randint(1980, 2025)}-{rng.randint(1, 12):02d}-01",
+        "global_rating": round(rng.random() * 10, 2),
+    } for i in range(count)]
+
+
+def main(count: int = 100_000) -> None:
+    games = catalogue(count)
+    start = time.perf_counter()
+    index = SearchIndex(games)
+    print(f"built over {count:,} games in {time.perf_counter() - start:.2f}s")
+
+    print(f"{'QUERY':52} | {'MS':>7}")
+    for text in QUERIES:
+        query = Query.parse(text)
+        start = time.perf_counter()
+        for _ in range(10):
+            index.search(query, limit=50)
+        print(f"{text:52} | {(time.perf_counter() - start) * 100:7.2f}")
+
+    for text in COMPLETIONS:
+        start = time.perf_counter()
+        for _ in range(10):
+            index.complete(text, k=10)
+        print(f"{'complete ' + repr(text):52} | {(time.perf_counter() - start) * 100:7.2f}")
+
+    start = time.perf_counter()
+    for game in games[:1000]:
+        index.add(dict(game, title=game["title"] + " Remastered"))
+    print(f"1,000 incremental updates in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
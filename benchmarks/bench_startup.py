@@ -0,0 +1,63 @@
+"""Cold start of the TUI: time to the first prompt, and which imports it is spent on.
+
+Run with ``python -m benchmarks.bench_startup [runs]``. Every run starts ``main.py`` in a fresh
+interpreter and stops the clock when the login menu asks for its first key. The import breakdown
+comes from one more run under ``-X importtime``, once with typeguard and once in production mode.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+PROMPT = b"? "
+
+
+def first_prompt(production: bool = False, importtime: bool = False) -> Tuple[float, str]:
+    """Seconds from process start to the first menu prompt, and the stderr of the process."""
+    env = {**os.environ, "FIORDISPINO_PRODUCTION": "1" if production else "0"}
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "main.py"]
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    output = b""
+    while not output.endswith(PROMPT):
+        chunk = os.read(process.stdout.fileno(), 4096)
+        if not chunk:
+            raise RuntimeError(f"main.py exited before its first prompt: {output.decode()}")
+        output += chunk
+    elapsed = time.perf_counter() - start
+    _, stderr = process.communicate(b"0\n")
+    return elapsed, stderr.decode()
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) of every import reported by -X importtime."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        imports.append((name.strip(), int(own), int(cumulative)))
+    return imports
+
+
+def main(runs: int = 5, top: int = 10) -> None:
+    print(f"{'MODE':12} | {'FIRST PROMPT MS':>15} | {'IMPORTS MS':>10} | {'MODULES':>7}")
+    breakdowns: Dict[str, List[Tuple[str, int, int]]] = {}
+    for mode, production in (("typeguard", False), ("production", True)):
+        median = statistics.median(first_prompt(production)[0] for _ in range(runs))
+        imports = breakdowns[mode] = parse_importtime(first_prompt(production, importtime=True)[1])
+        print(f"{mode:12} | {median * 1000:15.1f} | {sum(own for _, own, _ in imports) / 1000:10.1f} | {len(imports):7}")
+
+    for mode, imports in breakdowns.items():
+        print(f"\nSlowest imports ({mode}), self time")
+        for name, own, cumulative in sorted(imports, key=lambda i: i[1], reverse=True)[:top]:
+            print(f"  {name:40} {own / 1000:8.1f} ms  ({cumulative / 1000:.1f} ms with its imports)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,61 @@
+"""One large catalogue page read with response.json() and with the streaming decoder.
+
+Run with ``python -m benchmarks.bench_stream [count]``. The page comes from the local backend,
+started in its own process so that its memory and CPU are not counted; the table shows the time to
+the first game, to the last one, and the peak memory traced while reading.
+"""
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterator, Tuple
+
+from client.http_client import HttpClient
+from client.json_stream import iter_items
+from client.request import Request
+
+
+def buffered(client: HttpClient, request: Request) -> Iterator[dict]:
+    yield from client.send(request).json()["results"]
+
+
+def streamed(client: HttpClient, request: Request) -> Iterator[dict]:
+    with client.stream(request) as response:
+        yield from iter_items(response.iter_content(64 * 1024))
+
+
+def read(games: Callable[[], Iterator[dict]]) -> Tuple[float, float, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in games():
+        first = first or time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first or total, total, peak / 1e6, count
+
+
+def main(count: int = 50_000) -> None:
+    server = subprocess.Popen([sys.executable, "-m", "fake_backend.server", "--port", "0", "--games", str(count),
+                               "--users", "0"], stderr=subprocess.PIPE, text=True)
+    try:
+        base_url = re.search(r"at (\S+);", server.stderr.readline()).group(1)
+        client = HttpClient(base_url)
+        request = Request.get("/game/", params={"limit": count, "offset": 0})
+        client.send(request).content    # warm-up: connection and the server's first encoding
+        print(f"{'DECODER':10} | {'FIRST GAME MS':>13} | {'ALL MS':>8} | {'PEAK MB':>8} | {'GAMES':>7}")
+        for name, decode in (("json()", buffered), ("streaming", streamed)):
+            first, total, peak, games = read(lambda: decode(client, request))
+            print(f"{name:10} | {first * 1000:13.1f} | {total * 1000:8.1f} | {peak:8.1f} | {games:7,}")
+        client.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,56 @@
+"""Game list rendering with typeguard enabled and in production mode.
+
+Run with ``python -m benchmarks.bench_typechecking [count]``. Each mode runs in its own interpreter,
+because FIORDISPINO_PRODUCTION is read when the primitives are imported.
+"""
+import os
+import subprocess
+import sys
+import time
+
+
+def render(count: int) -> float:
+    from functionalities.description import Description
+    from functionalities.entry import Entry
+    from primitives.game_title import GameTitle
+    from primitives.genre import Genre
+    from primitives.global_rating import GlobalRating
+    from primitives.pegi import Pegi
+    from utils.table import Column, Table
+
+    games = [{
+        "id": i,
+        "title": f"Game {i}",
+        "description": f"A fantastic game, number {i}, with a long enough description to wrap.",
+        "genres": [{"name": "Role Playing"}, {"name": "Adventure"}],
+        "pegi": (3, 7, 12, 16, 18)[i % 5],
+        "release_date": "2020-01-01",
+        "global_rating": 7.5,
+    } for i in range(count)]
+
+    start = time.perf_counter()
+    table = Table([Column('INDEX', 5), Column('TITLE', 30, wrap=True), Column('DESCRIPTION', 40, wrap=True),
+                   Column('GENRE', 20), Column('PEGI', 6), Column('RELEASE DATE', 12), Column('VOTE', 13)])
+    table.header()
+    for index, game in enumerate(games, start=1):
+        genres = ', '.join(str(Genre(g["name"])) for g in game["genres"])
+        table.row(index, GameTitle(game["title"]), Description(game["description"]), genres,
+                  Pegi(game["pegi"]), game["release_date"], GlobalRating.create(7, 50))
+        Entry.create(str(index % 100), f"Select {game['title']}")
+    table.getvalue()
+    return time.perf_counter() - start
+
+
+def main(count: int = 10_000) -> None:
+    print(f"{'MODE':12} | {'ROWS/S':>10} | {'US/ROW':>8}")
+    for mode, production in (("typeguard", "0"), ("production", "1")):
+        output = subprocess.run(
+            [sys.executable, "-c", f"from benchmarks.bench_typechecking import render; print(render({count}))"],
+            env={**os.environ, "FIORDISPINO_PRODUCTION": production}, capture_output=True, text=True, check=True
+        ).stdout
+        elapsed = float(output)
+        print(f"{mode:12} | {count / elapsed:10,.0f} | {elapsed / count * 1e6:8.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,222 @@
+"""Benchmark suite with JSON baselines.
+
+Run with ``python -m benchmarks.suite [--only TEXT] [--save FILE] [--compare FILE] [--threshold 0.25]``.
+Every case times a fixed, seeded workload a few times and keeps the median. With --compare, a case
+slower than its baseline median by more than the threshold (a fraction, 0.25 = 25%) is reported as
+a regression and the run exits with status 1.
+"""
+import argparse
+import builtins
+import contextlib
+import functools
+import getpass
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+from benchmarks.bench_primitives import PRIMITIVES
+from benchmarks.bench_startup import first_prompt
+from client.http_client import HttpClient
+from client.pagination import Page
+from fake_backend.dataset import Dataset
+from fake_backend.server import FakeBackend
+from functionalities.description import Description
+from functionalities.entry import Entry
+from functionalities.menu import Menu
+from utils.typechecking import PRODUCTION
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Callable[[], Any]
+    operations: int = field(default=1)    # operations per run, for the throughput column
+    repeat: int = field(default=5)
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline: float
+    median: float
+
+    @property
+    def change(self) -> float:
+        return self.median / self.baseline - 1
+
+
+def measure(case: Case) -> Dict[str, float]:
+    case.run()    # warm-up: imports, lazily compiled patterns, caches
+    times = []
+    for _ in range(case.repeat):
+        start = time.perf_counter()
+        case.run()
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    return {"median": median, "min": min(times), "ops_per_s": case.operations / median if median else 0.0}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[Regression]:
+    """Cases of results slower than in baseline by more than threshold; cases new to either are skipped."""
+    return [Regression(name, baseline[name]["median"], result["median"])
+            for name, result in results.items()
+            if name in baseline and result["median"] > baseline[name]["median"] * (1 + threshold)]
+
+
+def primitive_cases(count: int = 10_000) -> Iterator[Case]:
+    for name, build in PRIMITIVES.items():
+        yield Case(f"primitives/{name}", lambda build=build: [build(i) for i in range(count)], count)
+
+
+def menu(entries: int) -> Menu:
+    builder = Menu.Builder(Description("Benchmark"))
+    for i in range(1, entries):
+        builder.with_entry(Entry.create(str(i), f"Entry {i}"))
+    return builder.with_entry(Entry.create("0", "Exit", is_exit=True)).build()
+
+
+def menu_cases(builds: int = 200, selections: int = 1_000) -> Iterator[Case]:
+    yield Case("menu/build 20 entries", lambda: [menu(20) for _ in range(builds)], builds)
+
+    def dispatch() -> None:
+        keys = iter([str(i % 19 + 1) for i in range(selections)] + ["0"])
+        with patch.object(builtins, "input", lambda prompt="": next(keys)), contextlib.redirect_stdout(io.StringIO()):
+            menu(20).run()
+    yield Case(f"menu/dispatch {selections:,} keys", dispatch, selections)
+
+
+@functools.cache
+def catalogue(count: int) -> List[Dict[str, Any]]:
+    # Built on the warm-up run of the first case using it, so filtered out cases cost nothing
+    return Dataset(games=count, users=0).games()
+
+
+def render_cases() -> Iterator[Case]:
+    from app import App
+
+    app = App(HttpClient("http://localhost:0/api/v1"))
+    for count, repeat in ((10, 20), (1_000, 5), (100_000, 1)):
+        def render(count: int = count) -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                app._App__print_games(Page(catalogue(count)), [])
+        yield Case(f"render/{count:,} games", render, count, repeat)
+
+
+@contextlib.contextmanager
+def isolated_session(inputs: List[str]) -> Iterator[None]:
+    # A fresh cache directory per run, so every run syncs and caches from scratch
+    answers = iter(inputs)
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            patch.dict(os.environ, {"FIORDISPINO_CACHE_DIR": cache_dir}), \
+            patch.object(builtins, "input", lambda prompt="": next(answers)), \
+            patch.object(getpass, "getpass", lambda prompt="": Dataset.password), \
+            contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def flow_cases(backend: FakeBackend) -> Iterator[Case]:
+    from app import App
+    from batch import Batch
+
+    def app_flow(inputs: List[str]) -> Callable[[], None]:
+        def run() -> None:
+            with isolated_session(inputs):
+                app = App(HttpClient(backend.base_url, token=lambda: app._App__token))
+                with contextlib.suppress(SystemExit):
+                    app.run()
+        return run
+
+    # Login, a few screens and Exit, as a user would go through them
+    yield Case("flow/login and show lists", app_flow(["1", "user1@gmail.com", "3", "4", "2", "0"]))
+    yield Case("flow/login and search", app_flow(["1", "user1@gmail.com", "13", "legend pegi<=12", "0"]))
+
+    def batch_flow() -> None:
+        with isolated_session([]):
+            batch = Batch(backend.base_url, out=io.StringIO())
+            batch.login(email="user2@gmail.com", password=Dataset.password)
+            ids = ",".join(str(i) for i in range(1, 41))
+            for command in ("add-to-play", "remove-to-play"):
+                batch.execute(Batch.parser().parse_args([command, "--ids", ids]))
+            batch.close()
+    yield Case("flow/batch add and remove 40 games", batch_flow, 80)
+
+    def list_flow() -> None:
+        with isolated_session([]):
+            Batch.main(["--base-url", backend.base_url, "--format", "ndjson", "list-games"], io.StringIO())
+    games, _, _ = backend.dataset.stats()
+    yield Case(f"flow/batch list {games:,} games as ndjson", list_flow, games)
+
+
+def startup_cases() -> Iterator[Case]:
+    # A fresh interpreter per run, timed until it exits from the login menu's first prompt
+    for mode, production in (("typeguard", False), ("production", True)):
+        yield Case(f"startup/first prompt, {mode}", lambda production=production: first_prompt(production))
+
+
+def cases(backend: Optional[FakeBackend]) -> Iterator[Case]:
+    yield from startup_cases()
+    yield from primitive_cases()
+    yield from menu_cases()
+    yield from render_cases()
+    if backend is not None:
+        yield from flow_cases(backend)
+
+
+def run(only: Optional[str] = None, games: int = 2_000, latency: float = 0.002) -> Dict[str, Dict[str, float]]:
+    results = {}
+    print(f"{'CASE':40} | {'MEDIAN MS':>10} | {'OPS/S':>12}")
+    with FakeBackend(Dataset(games=games), latency=latency) as backend:
+        for case in cases(backend):
+            if only is not None and only not in case.name:
+                continue
+            results[case.name] = measure(case)
+            print(f"{case.name:40} | {results[case.name]['median'] * 1000:10.2f} | {results[case.name]['ops_per_s']:12,.0f}")
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    return {"python": platform.python_version(), "machine": platform.machine(), "production": PRODUCTION}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.suite", description="Run the benchmarks and check them against a baseline.")
+    parser.add_argument("--only", help="run only the cases whose name contains this text")
+    parser.add_argument("--save", help="write the results to this JSON file, e.g. to make a new baseline")
+    parser.add_argument("--compare", help="JSON baseline written by an earlier --save")
+    parser.add_argument("--threshold", type=float, default=float(os.environ.get("FIORDISPINO_BENCH_THRESHOLD") or 0.25),
+                        help="allowed slowdown as a fraction of the baseline, default 0.25")
+    parser.add_argument("--games", type=int, default=2_000, help="catalogue size of the local backend")
+    parser.add_argument("--latency", type=float, default=2.0, help="milliseconds added to each backend response")
+    args = parser.parse_args(argv)
+
+    results = run(args.only, args.games, args.latency / 1000)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "cases": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if not args.compare:
+        return 0
+    with open(args.compare, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("environment") != environment():
+        print(f"warning: baseline recorded on {baseline.get('environment')}, running on {environment()}", file=sys.stderr)
+
+    regressions = compare(results, baseline["cases"], args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression.name}: {regression.baseline * 1000:.2f}ms -> {regression.median * 1000:.2f}ms "
+              f"({regression.change:+.0%}, threshold {args.threshold:+.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
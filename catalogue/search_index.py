@@ -0,0 +1,223 @@
+import bisect
+import heapq
+import itertools
+import re
+from datetime import date
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from catalogue.title_index import TitleIndex
+from catalogue.words import words
+
+_filter = re.compile(r"^(genre|pegi|year|rating|released)(:|<=|>=|=)(.+)$", re.IGNORECASE)
+
+
+def _pegi(game: Dict[str, Any]) -> int:
+    return game.get("pegi") or 0
+
+
+def _released(game: Dict[str, Any]) -> str:
+    return str(game.get("release_date") or "")
+
+
+def _rating(game: Dict[str, Any]) -> float:
+    try:
+        return float(str(game.get("global_rating") or 0))
+    except ValueError:
+        return 0.0
+
+
+def _title(game: Dict[str, Any]) -> Tuple[str, int]:
+    return str(game.get("title") or "").casefold(), game["id"]
+
+
+@dataclass(frozen=True)
+class Query:
+    words: Tuple[str, ...] = field(default=())
+    genres: Tuple[str, ...] = field(default=())
+    pegi: Tuple[Optional[int], Optional[int]] = field(default=(None, None))
+    released: Tuple[Optional[str], Optional[str]] = field(default=(None, None))
+    rating: Tuple[Optional[float], Optional[float]] = field(default=(None, None))
+
+    @staticmethod
+    def parse(text: str) -> 'Query':
+        """Parses e.g. "zelda genre:adventure pegi<=12 rating>=7.5 year>=2010".
+
+        Plain words must all appear in the title. genre: takes a name, with underscores for spaces;
+        pegi, rating, year and released (an ISO date) accept :, =, <= and >=, bounds included.
+        """
+        query_words, genres = [], []
+        bounds: Dict[str, List[Any]] = {"pegi": [None, None], "released": [None, None], "rating": [None, None]}
+
+        for token in text.split():
+            match = _filter.match(token)
+            if match is None:
+                query_words.extend(words(token))
+                continue
+
+            key, operator, value = match.group(1).lower(), match.group(2), match.group(3)
+            if key == "genre":
+                genres.append(value.replace("_", " ").casefold())
+                continue
+
+            if key == "year":
+                key, low, high = "released", f"{int(value):04d}-00-00", f"{int(value):04d}-99-99"
+            elif key == "pegi":
+                low = high = int(value)
+            elif key == "rating":
+                low = high = float(value)
+            else:
+                low = high = date.fromisoformat(value).isoformat()
+
+            if operator != "<=":
+                bounds[key][0] = low
+            if operator != ">=":
+                bounds[key][1] = high
+
+        return Query(tuple(query_words), tuple(genres), tuple(bounds["pegi"]), tuple(bounds["released"]),
+                     tuple(bounds["rating"]))
+
+
+class _SortedIndex:
+    """One key per id, with the (key, id) pairs kept sorted for range lookups."""
+
+    def __init__(self) -> None:
+        self.__keys: Dict[int, Any] = {}
+        self.__entries: List[Tuple[Any, int]] = []
+
+    @property
+    def keys(self) -> Dict[int, Any]:
+        return self.__keys
+
+    def load(self, keys: Dict[int, Any]) -> None:
+        self.__keys = keys
+        self.__entries = sorted((key, id) for id, key in keys.items())
+
+    def add(self, id: int, key: Any) -> None:
+        self.remove(id)
+        self.__keys[id] = key
+        bisect.insort(self.__entries, (key, id))
+
+    def remove(self, id: int) -> None:
+        if id not in self.__keys:
+            return
+        entry = (self.__keys.pop(id), id)
+        i = bisect.bisect_left(self.__entries, entry)
+        if i < len(self.__entries) and self.__entries[i] == entry:
+            del self.__entries[i]
+
+    def __bounds(self, low: Any, high: Any) -> Tuple[int, int]:
+        start = 0 if low is None else bisect.bisect_left(self.__entries, (low, -1))
+        end = len(self.__entries) if high is None else bisect.bisect_left(self.__entries, (high, float("inf")))
+        return start, max(start, end)
+
+    def count(self, low: Any, high: Any) -> int:
+        start, end = self.__bounds(low, high)
+        return end - start
+
+    def between(self, low: Any, high: Any) -> Set[int]:
+        start, end = self.__bounds(low, high)
+        return {id for _, id in self.__entries[start:end]}
+
+    def within(self, ids: Iterable[int], low: Any, high: Any) -> Set[int]:
+        keys = self.__keys
+        return {id for id in ids if (low is None or keys[id] >= low) and (high is None or keys[id] <= high)}
+
+    def __iter__(self) -> Iterator[int]:
+        return (id for _, id in self.__entries)
+
+
+class SearchIndex:
+    """In-memory index over the games of the catalogue, as returned by /game/.
+
+    Title words and genre names go into inverted indexes, PEGI, release date and global rating into
+    sorted ones. Games are added, replaced and removed one at a time, so the index follows the
+    catalogue without being rebuilt.
+    """
+
+    def __init__(self, games: Iterable[Dict[str, Any]] = ()) -> None:
+        self.__games: Dict[int, Dict[str, Any]] = {}
+        self.__titles = TitleIndex()
+        self.__genres: Dict[str, Set[int]] = {}
+        self.__sorted = {"pegi": (_SortedIndex(), _pegi), "released": (_SortedIndex(), _released),
+                         "rating": (_SortedIndex(), _rating), "title": (_SortedIndex(), _title)}
+
+        for game in games:
+            self.__index(game)
+        for index, key in self.__sorted.values():
+            index.load({id: key(game) for id, game in self.__games.items()})
+
+    def __len__(self) -> int:
+        return len(self.__games)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.__games
+
+    def get(self, id: int) -> Optional[Dict[str, Any]]:
+        return self.__games.get(id)
+
+    @staticmethod
+    def __genre_names(game: Dict[str, Any]) -> Set[str]:
+        return {str(g.get("name", "")).casefold() for g in game.get("genres") or [] if isinstance(g, dict)}
+
+    def __index(self, game: Dict[str, Any]) -> None:
+        id = game["id"]
+        if id in self.__games:
+            self.remove(id)
+        self.__games[id] = game
+        self.__titles.add(id, str(game.get("title") or ""))
+        for genre in self.__genre_names(game):
+            self.__genres.setdefault(genre, set()).add(id)
+
+    def add(self, game: Dict[str, Any]) -> None:
+        """Adds a game, replacing the one with the same id if it is already indexed."""
+        self.__index(game)
+        for index, key in self.__sorted.values():
+            index.add(game["id"], key(game))
+
+    def remove(self, id: int) -> None:
+        game = self.__games.pop(id, None)
+        if game is None:
+            return
+        self.__titles.remove(id)
+        for genre in self.__genre_names(game):
+            ids = self.__genres[genre]
+            ids.discard(id)
+            if not ids:
+                del self.__genres[genre]
+        for index, _ in self.__sorted.values():
+            index.remove(id)
+
+    def search(self, query: Query, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Games matching every part of the query, ordered by title."""
+        sets = [self.__titles.word(word) for word in query.words]
+        sets.extend(self.__genres.get(genre, set()) for genre in query.genres)
+        ranges = [(self.__sorted[name][0], low, high) for name, (low, high) in (
+            ("pegi", query.pegi), ("released", query.released), ("rating", query.rating))
+            if low is not None or high is not None]
+        ranges.sort(key=lambda r: r[0].count(r[1], r[2]))
+
+        # Start from the smallest candidate set; the remaining ranges only filter it
+        if sets:
+            sets.sort(key=len)
+            ids = sets[0].intersection(*sets[1:])
+        elif ranges:
+            index, low, high = ranges.pop(0)
+            ids = index.between(low, high)
+        else:
+            ids = self.__games.keys()
+        for index, low, high in ranges:
+            ids = index.within(ids, low, high)
+
+        titles, _ = self.__sorted["title"]
+        if limit is not None and 2 * len(ids) > len(self.__games):
+            # Most games match: walking the titles in order stops at the limit without sorting
+            ordered = list(itertools.islice((id for id in titles if id in ids), limit))
+        else:
+            key = titles.keys.__getitem__
+            ordered = sorted(ids, key=key) if limit is None else heapq.nsmallest(limit, ids, key=key)
+        return [self.__games[id] for id in ordered]
+
+    def complete(self, text: str, k: int = 10) -> List[Dict[str, Any]]:
+        """The k games whose titles best match a prefix or fuzzy query, best first."""
+        return [self.__games[id] for id in self.__titles.matches(text, k)]
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+def game_hash(game: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(game, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class CatalogueStore:
+    """On-disk copy of the games of the catalogue, with the watermark of the last sync."""
+
+    def __init__(self, path: Path) -> None:
+        self.__path = path
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @staticmethod
+    def default() -> 'CatalogueStore':
+        cache_dir = os.environ.get("FIORDISPINO_CACHE_DIR")
+        if not cache_dir:
+            cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache"), "fiordispino")
+        return CatalogueStore(Path(cache_dir) / "games.sqlite3")
+
+    def __connect(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            self.__connection = sqlite3.connect(self.__path, check_same_thread=False)
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS games (id INTEGER PRIMARY KEY, hash TEXT NOT NULL, body TEXT NOT NULL)")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS sync (key TEXT PRIMARY KEY, value TEXT)")
+        return self.__connection
+
+    def watermark(self) -> Optional[str]:
+        with self.__lock:
+            row = self.__connect().execute("SELECT value FROM sync WHERE key = 'watermark'").fetchone()
+        return row[0] if row is not None else None
+
+    def hashes(self) -> Dict[int, str]:
+        with self.__lock:
+            return dict(self.__connect().execute("SELECT id, hash FROM games"))
+
+    def games(self) -> Iterator[Dict[str, Any]]:
+        with self.__lock:
+            rows = self.__connect().execute("SELECT body FROM games ORDER BY id").fetchall()
+        return (json.loads(body) for body, in rows)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connect().execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def apply(self, games: Iterable[Dict[str, Any]], deleted: Iterable[int], watermark: Optional[str]) -> None:
+        """Stores new and changed games, drops deleted ones and moves the watermark, all at once."""
+        rows = [(game["id"], game_hash(game), json.dumps(game)) for game in games]
+        with self.__lock, self.__connect() as connection:
+            connection.executemany("INSERT OR REPLACE INTO games (id, hash, body) VALUES (?, ?, ?)", rows)
+            connection.executemany("DELETE FROM games WHERE id = ?", ((id,) for id in deleted))
+            connection.execute("INSERT OR REPLACE INTO sync (key, value) VALUES ('watermark', ?)", (watermark,))
+
+    def clear(self) -> None:
+        with self.__lock, self.__connect() as connection:
+            connection.execute("DELETE FROM games")
+            connection.execute("DELETE FROM sync")
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
@@ -0,0 +1,76 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from catalogue.store import CatalogueStore, game_hash
+from client.http_client import HttpClient
+from client.pagination import Paginator
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    changed: Tuple[Dict[str, Any], ...] = field(default=())    # added or updated games
+    deleted: Tuple[int, ...] = field(default=())
+    incremental: bool = field(default=False)
+
+
+class CatalogueSync:
+    """Brings a CatalogueStore up to date with /game/.
+
+    After a sync that saw updated_at timestamps, only the games changed since the newest one are
+    requested with ?updated_since=, deleted games coming back as {"id": ..., "deleted": true}
+    tombstones. A backend without timestamps, or one that ignores the parameter and answers with the
+    whole catalogue, is diffed against the hashes of the stored games instead.
+    """
+
+    path = "/game/"
+    watermark_field = "updated_at"
+    since_param = "updated_since"
+
+    def __init__(self, client: HttpClient, store: CatalogueStore, page_size: int = 50) -> None:
+        self.__client = client
+        self.__store = store
+        self.__page_size = page_size
+
+    @property
+    def store(self) -> CatalogueStore:
+        return self.__store
+
+    def __watermark(self, games: List[Dict[str, Any]]) -> Optional[str]:
+        stamps = [game.get(self.watermark_field) for game in games]
+        if not stamps or None in stamps:
+            return None
+        return max(str(stamp) for stamp in stamps)
+
+    def sync(self) -> SyncResult:
+        watermark = self.__store.watermark()
+        if watermark is None:
+            games = self.__games(Paginator(self.__client, self.path, self.__page_size, cached=True))
+            return self.__diff(games)
+
+        games = self.__games(Paginator(self.__client, self.path, self.__page_size,
+                                       params={self.since_param: watermark}))
+        # A delta holds nothing older than the watermark; anything else is the full catalogue.
+        # Tombstones may carry no timestamp, so only the stamped games are compared.
+        if all(str(stamp) >= watermark for stamp in self.__stamps(game for game in games if not game.get("deleted"))):
+            return self.__merge(games, watermark)
+        return self.__diff(games)
+
+    def __stamps(self, games: Iterable[Dict[str, Any]]) -> List[Any]:
+        return [game[self.watermark_field] for game in games if game.get(self.watermark_field) is not None]
+
+    @staticmethod
+    def __games(paginator: Paginator) -> List[Dict[str, Any]]:
+        return [game for game in paginator.items() if isinstance(game, dict) and "id" in game]
+
+    def __merge(self, games: List[Dict[str, Any]], watermark: str) -> SyncResult:
+        changed = tuple(game for game in games if not game.get("deleted"))
+        deleted = tuple(game["id"] for game in games if game.get("deleted"))
+        self.__store.apply(changed, deleted, max([watermark, *(str(stamp) for stamp in self.__stamps(games))]))
+        return SyncResult(changed, deleted, incremental=True)
+
+    def __diff(self, games: List[Dict[str, Any]]) -> SyncResult:
+        hashes = self.__store.hashes()
+        changed = tuple(game for game in games if hashes.get(game["id"]) != game_hash(game))
+        deleted = tuple(hashes.keys() - {game["id"] for game in games})
+        self.__store.apply(changed, deleted, self.__watermark(games))
+        return SyncResult(changed, deleted)
@@ -0,0 +1,123 @@
+import bisect
+import heapq
+from collections import Counter
+from typing import Dict, List, Set
+
+from catalogue.words import words
+
+
+def _trigrams(word: str) -> Set[str]:
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleIndex:
+    """Prefix and fuzzy lookup of game titles.
+
+    Every word of a query is looked up as a prefix in the sorted vocabulary of title words, so
+    "zel bre" finds "The Legend of Zelda: Breath of the Wild". When that gives fewer than k titles,
+    misspelled words are matched to vocabulary words sharing enough trigrams.
+    """
+
+    min_similarity = 0.3
+
+    def __init__(self) -> None:
+        self.__titles: Dict[int, str] = {}
+        self.__postings: Dict[str, Set[int]] = {}    # word -> ids of the titles containing it
+        self.__vocabulary: List[str] = []
+        self.__unsorted: Set[str] = set()    # words added since the vocabulary was last sorted
+        self.__trigrams: Dict[str, Set[str]] = {}    # trigram -> vocabulary words containing it
+
+    def __len__(self) -> int:
+        return len(self.__titles)
+
+    def __sorted_vocabulary(self) -> List[str]:
+        # Sorting once after many additions is much cheaper than keeping the list sorted on every add
+        if self.__unsorted:
+            self.__vocabulary.extend(self.__unsorted)
+            self.__vocabulary.sort()
+            self.__unsorted.clear()
+        return self.__vocabulary
+
+    def add(self, id: int, title: str) -> None:
+        self.remove(id)
+        self.__titles[id] = title.casefold()
+        for word in set(words(title)):
+            if word not in self.__postings:
+                self.__postings[word] = set()
+                self.__unsorted.add(word)
+                for trigram in _trigrams(word):
+                    self.__trigrams.setdefault(trigram, set()).add(word)
+            self.__postings[word].add(id)
+
+    def remove(self, id: int) -> None:
+        title = self.__titles.pop(id, None)
+        if title is None:
+            return
+        for word in set(words(title)):
+            ids = self.__postings[word]
+            ids.discard(id)
+            if ids:
+                continue
+            del self.__postings[word]
+            if word in self.__unsorted:
+                self.__unsorted.discard(word)
+            else:
+                del self.__vocabulary[bisect.bisect_left(self.__vocabulary, word)]
+            for trigram in _trigrams(word):
+                self.__trigrams[trigram].discard(word)
+                if not self.__trigrams[trigram]:
+                    del self.__trigrams[trigram]
+
+    def word(self, word: str) -> Set[int]:
+        """Ids of the titles containing exactly this word."""
+        return self.__postings.get(word, set())
+
+    def prefixed(self, prefix: str) -> Set[int]:
+        """Ids of the titles with a word starting with prefix."""
+        vocabulary = self.__sorted_vocabulary()
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = bisect.bisect_left(vocabulary, prefix + "\U0010ffff", start)
+        if end - start == 1:
+            return self.__postings[vocabulary[start]]
+        return set().union(*(self.__postings[w] for w in vocabulary[start:end]))
+
+    def __similar(self, word: str) -> Dict[int, float]:
+        # Best similarity, per title, between word and the title's words
+        trigrams = _trigrams(word)
+        shared = Counter()
+        for trigram in trigrams:
+            shared.update(self.__trigrams.get(trigram, ()))
+
+        scores: Dict[int, float] = {}
+        for candidate, count in shared.items():
+            score = 2 * count / (len(trigrams) + len(candidate) + 1)
+            if score >= self.min_similarity:
+                for id in self.__postings[candidate]:
+                    if score > scores.get(id, 0.0):
+                        scores[id] = score
+        return scores
+
+    def matches(self, query: str, k: int = 10) -> List[int]:
+        """The k best titles for a prefix or fuzzy query, best first."""
+        query_words = words(query)
+        if not query_words:
+            return []
+
+        titles = self.__titles
+        text = " ".join(query_words)
+        sets = sorted((self.prefixed(w) for w in query_words), key=len)
+        found = sets[0].intersection(*sets[1:])
+        best = heapq.nsmallest(k, found, key=lambda id: (not titles[id].startswith(text), len(titles[id]), titles[id], id))
+        if len(best) == k:
+            return best
+
+        # A word counts as matched by its prefixes too, so only the misspelled words need to be close
+        scores = None
+        for word in query_words:
+            similar = self.__similar(word)
+            similar.update(dict.fromkeys(self.prefixed(word), 1.0))
+            scores = similar if scores is None else {id: s + similar[id] for id, s in scores.items() if id in similar}
+        for id in best:
+            scores.pop(id, None)
+        return best + heapq.nsmallest(k - len(best), scores, key=lambda id: (-scores[id], len(titles[id]), titles[id], id))
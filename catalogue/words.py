@@ -0,0 +1,9 @@
+import re
+from typing import List
+
+_word = re.compile(r"[^\W_]+")
+
+
+def words(text: str) -> List[str]:
+    """Lowercase words of a title or query, punctuation dropped."""
+    return _word.findall(text.casefold())
\ No newline at end of file
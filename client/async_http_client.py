@@ -0,0 +1,53 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Union
+
+import requests
+
+from client.request import Request
+
+
+class AsyncHttpClient:
+    """asyncio core that fans requests out over the pooled session with bounded concurrency.
+
+    The transport stays the blocking, pooled requests session: every request runs on a worker
+    thread and is awaited from the event loop, so independent requests overlap on the wire.
+    """
+
+    def __init__(self, send: Callable[[Request], requests.Response], max_concurrency: int = 8) -> None:
+        self.__send = send
+        self.__max_concurrency = max_concurrency
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="fiordispino-http")
+
+    @property
+    def max_concurrency(self) -> int:
+        return self.__max_concurrency
+
+    async def request(self, request: Request, semaphore: asyncio.Semaphore,
+                      on_done: Optional[Callable[[], None]] = None) -> requests.Response:
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(self.__executor, functools.partial(self.__send, request))
+            finally:
+                if on_done is not None:
+                    on_done()
+
+    async def gather(self, *calls: Request, return_exceptions: bool = False,
+                     on_done: Optional[Callable[[], None]] = None) -> List[Union[requests.Response, BaseException]]:
+        semaphore = asyncio.Semaphore(self.__max_concurrency)
+        return await asyncio.gather(*(self.request(r, semaphore, on_done) for r in calls),
+                                    return_exceptions=return_exceptions)
+
+    def run(self, *calls: Request, return_exceptions: bool = False,
+            on_done: Optional[Callable[[], None]] = None) -> List[Any]:
+        """Sends the calls and returns the responses in order; on_done is called as each one completes."""
+        if not calls:
+            return []
+        if len(calls) == 1 and not return_exceptions and on_done is None:
+            return [self.__send(calls[0])]
+        return asyncio.run(self.gather(*calls, return_exceptions=return_exceptions, on_done=on_done))
+
+    def close(self) -> None:
+        self.__executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,100 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    stored_at: float
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", "X-Cache": "revalidated"})
+        response._content = self.body
+        return response
+
+
+class CatalogueCache:
+    """On-disk store of catalogue responses, revalidated with ETag/Last-Modified conditional GETs."""
+
+    def __init__(self, path: Path) -> None:
+        self.__path = path
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @staticmethod
+    def default() -> 'CatalogueCache':
+        cache_dir = os.environ.get("FIORDISPINO_CACHE_DIR")
+        if not cache_dir:
+            cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache"), "fiordispino")
+        return CatalogueCache(Path(cache_dir) / "catalogue.sqlite3")
+
+    def __connect(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            self.__connection = sqlite3.connect(self.__path, check_same_thread=False)
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+        return self.__connection
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        try:
+            with self.__lock:
+                row = self.__connect().execute(
+                    "SELECT url, etag, last_modified, body, stored_at FROM responses WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return CachedResponse(*row) if row is not None else None
+
+    def store(self, url: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+        try:
+            with self.__lock, self.__connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (url, etag, last_modified, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, response.content, time.time())
+                )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        with self.__lock, self.__connect() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
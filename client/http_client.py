@@ -0,0 +1,236 @@
+import re
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+from client.async_http_client import AsyncHttpClient
+from client.catalogue_cache import CatalogueCache
+from client.json_stream import iter_items
+from client.request import Request
+from utils.metrics import METRICS, Metrics
+
+_id = re.compile(r"/\d+(?=/|$)")
+_owner = re.compile(r"/owner/[^/]+")
+
+
+class HttpClient:
+    """Keep-alive HTTP session shared by every call the App makes to the backend."""
+
+    def __init__(self, base_url: str, token: Callable[[], Any] = lambda: None,
+                 timeout: Tuple[float, float] = (3.05, 30.0), pool_connections: int = 4,
+                 pool_maxsize: int = 16, max_retries: int = 2, max_concurrency: int = 8,
+                 prefetch_ttl: float = 30.0, cache: Optional[CatalogueCache] = None,
+                 metrics: Optional[Metrics] = None) -> None:
+        self.__base_url = base_url.rstrip("/")
+        self.__metrics = metrics or METRICS
+        self.__cache = cache
+        self.__token = token
+        self.__timeout = timeout
+        self.__prefetch_ttl = prefetch_ttl
+        self.__prefetched: Dict[Tuple, Tuple[float, requests.Response]] = {}
+        self.__writes = 0    # Bumped by every POST and DELETE, so prefetches started before one are dropped
+        self.__prefetch_lock = threading.Lock()    # Held by a write and by a prefetch checking for one and storing
+        self.__flights: Dict[Tuple, Future] = {}    # GETs in progress, shared by identical concurrent calls
+        self.__flights_lock = threading.Lock()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=max(pool_maxsize, max_concurrency),
+            max_retries=Retry(total=max_retries, connect=max_retries, read=max_retries,
+                              status=0, backoff_factor=0.1),
+        )
+        self.__session = requests.Session()
+        self.__session.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+
+        self.__async = AsyncHttpClient(self.send, max_concurrency=max_concurrency)
+
+    @property
+    def base_url(self) -> str:
+        return self.__base_url
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return self.__timeout
+
+    @property
+    def metrics(self) -> Metrics:
+        return self.__metrics
+
+    def endpoint(self, url: str) -> str:
+        """Path of url below the base URL with ids and usernames replaced, e.g. /game/{id}/."""
+        path = urlsplit(url).path
+        base = urlsplit(self.__base_url).path
+        if path.startswith(base):
+            path = path[len(base):]
+        return _owner.sub("/owner/{username}", _id.sub("/{id}", path)) or "/"
+
+    def __request(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        with self.__metrics.timer("http", f"{method} {self.endpoint(url)}") as fields:
+            response = getattr(self.__session, method.lower())(url, **kwargs)
+            fields["status"] = response.status_code
+            # A streamed body is read by the caller, after the request is timed
+            if not kwargs.get("stream"):
+                fields["bytes"] = len(response.content)
+        return response
+
+    def json(self, response: requests.Response) -> Any:
+        """response.json(), timed as the decoding of its endpoint, e.g. ("json", "GET /game/{id}/")."""
+        # Responses rebuilt from the on-disk cache carry no request; they all answer GETs
+        method = response.request.method if response.request is not None else "GET"
+        with self.__metrics.timer("json", f"{method} {self.endpoint(response.url)}"):
+            return response.json()
+
+    def url(self, path: str) -> str:
+        # Absolute links, e.g. the next page of a paginated list, are used as they are
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.__base_url}/{path.lstrip('/')}"
+
+    def __kwargs(self, authenticated: bool, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        kwargs.setdefault("timeout", self.__timeout)
+        if authenticated:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Authorization": f"Token {str(self.__token())}"}
+        return kwargs
+
+    def __take_prefetched(self, request: Request) -> Optional[requests.Response]:
+        with self.__prefetch_lock:
+            fetched_at, response = self.__prefetched.pop(request.key(), (0.0, None))
+        if response is not None and time.monotonic() - fetched_at <= self.__prefetch_ttl:
+            return response
+        return None
+
+    def get(self, path: str, authenticated: bool = False, cached: bool = False, **kwargs: Any) -> requests.Response:
+        """Sends a GET; with cached=True the on-disk copy is revalidated and reused on 304 Not Modified.
+
+        Identical GETs made while one is in flight wait for it and share its response.
+        """
+        request = Request.get(path, authenticated, **(dict(kwargs, cached=True) if cached else kwargs))
+        response = self.__take_prefetched(request)
+        if response is not None:
+            return response
+
+        # Flights started before a write are not joined after it, as they may miss its effect
+        key = (*request.key(), str(self.__token()) if authenticated else None, self.__writes)
+        return self.__single_flight(key, lambda: self.__get(path, authenticated, cached, kwargs))
+
+    def __single_flight(self, key: Tuple, send: Callable[[], requests.Response]) -> requests.Response:
+        with self.__flights_lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = Future()
+        if not leader:
+            return flight.result()
+
+        try:
+            response = send()
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(response)
+            return response
+        finally:
+            with self.__flights_lock:
+                del self.__flights[key]
+
+    def __get(self, path: str, authenticated: bool, cached: bool, kwargs: Dict[str, Any]) -> requests.Response:
+        if not cached or self.__cache is None:
+            return self.__request("GET", self.url(path), self.__kwargs(authenticated, kwargs))
+
+        url = self.url(path)
+        cache_key = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        entry = self.__cache.lookup(cache_key)
+        if entry is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **entry.validators()}
+
+        response = self.__request("GET", url, self.__kwargs(authenticated, kwargs))
+        if response.status_code == 304 and entry is not None:
+            return entry.to_response()
+        if response.status_code == 200:
+            self.__cache.store(cache_key, response)
+        return response
+
+    def __written(self) -> None:
+        with self.__prefetch_lock:
+            self.__writes += 1
+            self.__prefetched.clear()
+
+    def post(self, path: str, authenticated: bool = False, **kwargs: Any) -> requests.Response:
+        self.__written()
+        return self.__request("POST", self.url(path), self.__kwargs(authenticated, kwargs))
+
+    def delete(self, path: str, authenticated: bool = False, **kwargs: Any) -> requests.Response:
+        self.__written()
+        return self.__request("DELETE", self.url(path), self.__kwargs(authenticated, kwargs))
+
+    def stream(self, request: Request) -> requests.Response:
+        """Sends a GET and returns before the body is read, for iter_content(); close the response after.
+
+        The on-disk cache, prefetched responses and in-flight GETs are bypassed, since a streamed body
+        is read only once.
+        """
+        kwargs = {name: value for name, value in request.kwargs.items() if name != "cached"}
+        return self.__request("GET", self.url(request.path), self.__kwargs(request.authenticated, {**kwargs, "stream": True}))
+
+    def items(self, request: Request, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+        """The elements of the JSON list a GET answers, decoded one at a time while the body downloads.
+
+        A response prefetched for the request is decoded from memory instead of being fetched again.
+        """
+        response = self.__take_prefetched(request)
+        if response is not None:
+            yield from iter_items(response.iter_content(chunk_size))
+            return
+        with self.stream(request) as response:
+            yield from iter_items(response.iter_content(chunk_size))
+
+    def send(self, request: Request) -> requests.Response:
+        method = getattr(self, request.method.lower())
+        return method(request.path, request.authenticated, **request.kwargs)
+
+    def gather(self, *calls: Request, return_exceptions: bool = False,
+               on_done: Optional[Callable[[], None]] = None) -> List[Union[requests.Response, BaseException]]:
+        """Sends independent requests concurrently and returns their responses in order.
+
+        With return_exceptions=True a failed request leaves its exception in place of the response;
+        on_done, if given, is called each time a request completes, e.g. to report progress.
+        """
+        return self.__async.run(*calls, return_exceptions=return_exceptions, on_done=on_done)
+
+    def prefetch(self, *calls: Request) -> List[Optional[requests.Response]]:
+        """Fetches independent GETs concurrently; the next matching get() is served from the result.
+
+        Failed prefetches are dropped, so the later get() repeats the request and surfaces the error.
+        The stored responses are returned, None in place of the dropped ones.
+        """
+        calls = tuple(r for r in calls if r.method.upper() == "GET")
+        writes = self.__writes
+        stored = []
+        for request, response in zip(calls, self.__async.run(*calls, return_exceptions=True)):
+            # A write made meanwhile may have changed what the response shows
+            with self.__prefetch_lock:
+                if isinstance(response, BaseException) or writes != self.__writes:
+                    stored.append(None)
+                    continue
+                self.__prefetched[request.key()] = (time.monotonic(), response)
+            stored.append(response)
+        return stored
+
+    def is_prefetched(self, request: Request) -> bool:
+        fetched_at, _ = self.__prefetched.get(request.key(), (None, None))
+        return fetched_at is not None and time.monotonic() - fetched_at <= self.__prefetch_ttl
+
+    def close(self) -> None:
+        if self.__cache is not None:
+            self.__cache.close()
+        self.__async.close()
+        self.__session.close()
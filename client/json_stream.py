@@ -0,0 +1,106 @@
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+_terminators = _whitespace + ",]}"
+
+
+class _Reader:
+    # Text decoded so far that is not consumed yet; consumed text is dropped whenever a chunk is added
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.__chunks = iter(chunks)
+        self.__decode = codecs.getincrementaldecoder("utf-8")().decode
+        self.__eof = False
+        self.buffer = ""
+        self.pos = 0
+
+    def more(self) -> bool:
+        for chunk in self.__chunks:
+            text = self.__decode(chunk)
+            if text:
+                self.buffer = self.buffer[self.pos:] + text
+                self.pos = 0
+                return True
+        if not self.__eof:
+            self.__eof = True
+            self.__decode(b"", final=True)    # raises on a truncated UTF-8 sequence
+        return False
+
+    def peek(self) -> str:
+        """The next character that is not whitespace, without consuming it; "" at the end."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _whitespace:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.more():
+                    continue
+                raise
+            # A number is only complete once what follows it is read: "-1." decodes as -1 until "5" arrives
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and \
+                    (end == len(self.buffer) or self.buffer[end] not in _terminators) and self.more():
+                continue
+            self.pos = end
+            return value
+
+
+def _array(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def iter_items(chunks: Iterable[bytes], key: str = "results", fields: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Yields the elements of a JSON array as its bytes arrive, e.g. from response.iter_content().
+
+    The document is either the array itself or an object holding it under key, as a paginated
+    list does; the other members of such an object are put into fields once they are read, so
+    members after the array are only there when the iteration is over. Only the element being
+    decoded and the current chunk are held, never the whole document.
+    """
+    reader = _Reader(chunks)
+    if reader.peek() == "[":
+        yield from _array(reader)
+    else:
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                name = reader.value()
+                if not isinstance(name, str):
+                    raise json.JSONDecodeError("Expecting property name", reader.buffer, reader.pos)
+                reader.expect(":")
+                if name == key and reader.peek() == "[":
+                    yield from _array(reader)
+                elif fields is not None:
+                    fields[name] = reader.value()
+                else:
+                    reader.value()
+                if reader.expect(",}") == "}":
+                    break
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buffer, reader.pos)
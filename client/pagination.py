@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from client.http_client import HttpClient
+from client.json_stream import iter_items
+from client.request import Request
+
+
+@dataclass(frozen=True)
+class Page:
+    items: List[Any]
+    start: int = field(default=1)
+    count: Optional[int] = field(default=None)
+    next: Optional[str] = field(default=None)
+    previous: Optional[str] = field(default=None)
+
+    @property
+    def is_paginated(self) -> bool:
+        return self.next is not None or self.previous is not None
+
+
+class Paginator:
+    """Walks a list endpoint page by page.
+
+    Pages are requested with limit/offset parameters and the backend's next/previous links are
+    followed as returned, so cursor pagination works too. A backend that ignores the parameters and
+    answers with a plain JSON list is treated as a single page.
+    """
+
+    def __init__(self, client: HttpClient, path: str, page_size: int = 50, authenticated: bool = False,
+                 cached: bool = False, params: Optional[Dict[str, Any]] = None) -> None:
+        self.__client = client
+        self.__path = path
+        self.__page_size = page_size
+        self.__authenticated = authenticated
+        self.__cached = cached
+        self.__params = params or {}
+
+    def request(self, link: Optional[str] = None) -> Request:
+        kwargs = {"cached": True} if self.__cached else {}
+        if link is None:
+            kwargs["params"] = {**self.__params, "limit": self.__page_size, "offset": 0}
+        return Request.get(link if link is not None else self.__path, self.__authenticated, **kwargs)
+
+    def __fetch(self, link: Optional[str], start: int) -> Page:
+        response = self.__client.send(self.request(link))
+        response.raise_for_status()
+        data = self.__client.json(response)
+
+        if isinstance(data, dict) and "results" in data:
+            return Page(data["results"], start, data.get("count"), data.get("next"), data.get("previous"))
+        return Page(data, start)
+
+    def first(self) -> Page:
+        return self.__fetch(None, 1)
+
+    def next(self, page: Page) -> Optional[Page]:
+        if page.next is None:
+            return None
+        return self.__fetch(page.next, page.start + len(page.items))
+
+    def previous(self, page: Page) -> Optional[Page]:
+        if page.previous is None:
+            return None
+        previous = self.__fetch(page.previous, 1)
+        return Page(previous.items, max(1, page.start - len(previous.items)), previous.count,
+                    previous.next, previous.previous)
+
+    def __iter__(self) -> Iterator[Page]:
+        page = self.first()
+        while page is not None:
+            yield page
+            page = self.next(page)
+
+    def items(self) -> Iterator[Any]:
+        for page in self:
+            yield from page.items
+
+    def stream(self, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+        """Like items(), but every page is decoded while it downloads, one item at a time.
+
+        Only the item being decoded is held, however large the pages, and the first items are
+        yielded before the rest of their page has arrived. Pages are not cached.
+        """
+        link = None
+        while True:
+            fields: Dict[str, Any] = {}
+            with self.__client.stream(self.request(link)) as response:
+                response.raise_for_status()
+                yield from iter_items(response.iter_content(chunk_size), "results", fields)
+            link = fields.get("next")
+            if link is None:
+                return
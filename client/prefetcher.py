@@ -0,0 +1,60 @@
+import threading
+from typing import Optional, Sequence
+
+from client.http_client import HttpClient
+from client.request import Request
+
+
+class Prefetcher:
+    """Warms an HttpClient with GETs on a background thread, e.g. while the user sits at a prompt.
+
+    A batch sends its requests one at a time, so it holds at most one connection next to the
+    foreground's. It stops after max_requests requests, once budget_bytes of response bodies have
+    been received, or at the first request after cancel() or a new start(). Requests whose prefetched
+    response is still fresh are skipped.
+    """
+
+    def __init__(self, client: HttpClient, max_requests: int = 8, budget_bytes: int = 2_000_000) -> None:
+        self.__client = client
+        self.__max_requests = max_requests
+        self.__budget_bytes = budget_bytes
+        self.__cancelled = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__received = 0
+
+    @property
+    def received(self) -> int:
+        """Bytes received by the last batch."""
+        return self.__received
+
+    def start(self, *calls: Request) -> None:
+        self.cancel()
+        if self.__budget_bytes <= 0 or not calls:
+            return
+
+        self.__cancelled = threading.Event()
+        self.__received = 0
+        self.__thread = threading.Thread(target=self.__run, args=(calls[:self.__max_requests], self.__cancelled),
+                                         name="fiordispino-prefetch", daemon=True)
+        self.__thread.start()
+
+    def __run(self, calls: Sequence[Request], cancelled: threading.Event) -> None:
+        for request in calls:
+            if cancelled.is_set() or self.__received >= self.__budget_bytes:
+                return
+            if self.__client.is_prefetched(request):
+                continue
+            response, = self.__client.prefetch(request) or [None]
+            if response is not None and not cancelled.is_set():
+                self.__received += len(response.content or b"")
+
+    def cancel(self) -> None:
+        self.__cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the running batch; False if it is still running after timeout seconds."""
+        thread = self.__thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple
+
+
+@dataclass(frozen=True)
+class Request:
+    method: str
+    path: str
+    authenticated: bool = field(default=False)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def key(self) -> Tuple[str, str, bool, str]:
+        return self.method.upper(), self.path, self.authenticated, repr(sorted(self.kwargs.items()))
+
+    @staticmethod
+    def get(path: str, authenticated: bool = False, **kwargs: Any) -> 'Request':
+        return Request("GET", path, authenticated, kwargs)
+
+    @staticmethod
+    def post(path: str, authenticated: bool = False, **kwargs: Any) -> 'Request':
+        return Request("POST", path, authenticated, kwargs)
+
+    @staticmethod
+    def delete(path: str, authenticated: bool = False, **kwargs: Any) -> 'Request':
+        return Request("DELETE", path, authenticated, kwargs)
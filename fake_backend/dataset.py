@@ -0,0 +1,217 @@
+import hashlib
+import random
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+GENRES = ["Action", "Adventure", "Role Playing", "Shooter", "Puzzle", "Platformer", "Racing", "Sports",
+          "Strategy", "Simulation", "Horror", "Fighting", "Stealth", "Survival", "Rhythm", "Sandbox"]
+WORDS = ["Legend", "Shadow", "Star", "Dragon", "Quest", "Night", "Iron", "Lost", "Crystal", "Storm",
+         "Kingdom", "Frontier", "Echo", "Rogue", "Tales", "Rising", "Origins", "Reloaded", "Eternal", "Wild"]
+
+
+class Conflict(Exception):
+    """The request cannot be applied to the current data, e.g. a game already in a list."""
+
+
+class Dataset:
+    """Deterministic, in-memory data of the stand-in backend, safe to use from many threads.
+
+    Users are user1..userN with emails userN@gmail.com, plus admin@gmail.com; every
+    account has the same password. Games carry an updated_at timestamp and deletions leave
+    tombstones, so ?updated_since= deltas can be answered.
+    """
+
+    password = "fiordispino"
+
+    def __init__(self, games: int = 1000, genres: int = 12, users: int = 10, list_size: int = 20,
+                 seed: int = 0) -> None:
+        rng = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__clock = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.__next_ids: Dict[str, int] = {}
+
+        self.__genres = {id: {"id": id, "name": name} for id, name in enumerate(GENRES[:genres], start=1)}
+        self.__next_ids["genre"] = len(self.__genres) + 1
+
+        self.__games: Dict[int, Dict[str, Any]] = {}
+        self.__deleted: Dict[int, str] = {}    # game id -> updated_at of its deletion
+        for _ in range(games):
+            self.__add_game(f"{rng.choice(WORDS)} {rng.choice(WORDS)} {len(self.__games) + 1}",
+                            f"A {rng.choice(WORDS).lower()} game, number {len(self.__games) + 1}.",
+                            rng.sample(sorted(self.__genres), k=min(len(self.__genres), rng.randint(1, 3))),
+                            rng.choice([3, 7, 12, 16, 18]),
+                            (date(1985, 1, 1) + timedelta(days=rng.randrange(14000))).isoformat(),
+                            f"{rng.randint(0, 9)}.{rng.randint(0, 99):02d}")
+
+        self.__users = {id: {"id": id, "username": f"user{id}", "email": f"user{id}@gmail.com",
+                             "is_superuser": False} for id in range(1, users + 1)}
+        self.__users[users + 1] = {"id": users + 1, "username": "admin", "email": "admin@gmail.com",
+                                   "is_superuser": True}
+        self.__next_ids["user"] = users + 2
+        self.__tokens: Dict[str, int] = {}
+
+        # List name -> entry id -> entry, holding the owner and game ids
+        self.__entries: Dict[str, Dict[int, Dict[str, Any]]] = {"games-to-play": {}, "games-played": {}}
+        game_ids = sorted(self.__games)
+        for user in range(1, users + 1):
+            for name in self.__entries:
+                for game in rng.sample(game_ids, k=min(list_size, len(game_ids))):
+                    self.__add_entry(name, user, game, rng.randint(1, 10))
+
+    def __now(self) -> str:
+        # A strictly increasing clock keeps updated_at unique, so watermarks never skip a change
+        self.__clock = max(datetime.now(timezone.utc), self.__clock + timedelta(microseconds=1))
+        return self.__clock.isoformat(timespec="microseconds")
+
+    def __id(self, kind: str) -> int:
+        id = self.__next_ids.get(kind, 1)
+        self.__next_ids[kind] = id + 1
+        return id
+
+    def __add_game(self, title: str, description: str, genres: List[int], pegi: int, release_date: str,
+                   global_rating: str = "0.0") -> Dict[str, Any]:
+        game = {"id": self.__id("game"), "title": title, "description": description,
+                "genres": [self.__genres[id] for id in genres], "pegi": pegi, "release_date": release_date,
+                "global_rating": global_rating, "updated_at": self.__now()}
+        self.__games[game["id"]] = game
+        return game
+
+    def __add_entry(self, name: str, user: int, game: int, rating: int) -> Dict[str, Any]:
+        entry = {"id": self.__id(name), "owner": user, "game": game}
+        if name == "games-played":
+            entry["rating"] = rating
+        self.__entries[name][entry["id"]] = entry
+        return entry
+
+    # Accounts
+
+    def login(self, email: str, password: str) -> Optional[str]:
+        with self.__lock:
+            user = next((u for u in self.__users.values() if u["email"] == email), None)
+            if user is None or password != self.password:
+                return None
+            return self.__token_for(user["id"])
+
+    def register(self, username: str, email: str, password: str) -> str:
+        with self.__lock:
+            if any(u["username"] == username or u["email"] == email for u in self.__users.values()):
+                raise Conflict("A user with that username or email already exists.")
+            id = self.__id("user")
+            self.__users[id] = {"id": id, "username": username, "email": email, "is_superuser": False}
+            return self.__token_for(id)
+
+    def __token_for(self, user: int) -> str:
+        token = hashlib.sha1(f"fiordispino-{user}".encode()).hexdigest()
+        self.__tokens[token] = user
+        return token
+
+    def user(self, token: Optional[str]) -> Optional[Dict[str, Any]]:
+        with self.__lock:
+            id = self.__tokens.get(token or "")
+            return dict(self.__users[id]) if id in self.__users else None
+
+    def users(self) -> List[Dict[str, Any]]:
+        with self.__lock:
+            return [{"id": u["id"], "username": u["username"], "email": u["email"]} for u in self.__users.values()]
+
+    def delete_user(self, id: int) -> bool:
+        with self.__lock:
+            for entries in self.__entries.values():
+                for entry_id in [e["id"] for e in entries.values() if e["owner"] == id]:
+                    del entries[entry_id]
+            return self.__users.pop(id, None) is not None
+
+    # Catalogue
+
+    def genres(self) -> List[Dict[str, Any]]:
+        with self.__lock:
+            return list(self.__genres.values())
+
+    def genre(self, id: int) -> Optional[Dict[str, Any]]:
+        with self.__lock:
+            return self.__genres.get(id)
+
+    def add_genre(self, name: str) -> Dict[str, Any]:
+        with self.__lock:
+            if any(g["name"].casefold() == name.casefold() for g in self.__genres.values()):
+                raise Conflict("genre with this name already exists.")
+            genre = {"id": self.__id("genre"), "name": name}
+            self.__genres[genre["id"]] = genre
+            return genre
+
+    def delete_genre(self, id: int) -> bool:
+        with self.__lock:
+            return self.__genres.pop(id, None) is not None
+
+    def games(self, updated_since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """The catalogue by id, or the games changed and deleted after updated_since, oldest change first."""
+        with self.__lock:
+            if updated_since is None:
+                return list(self.__games.values())
+            changed = [g for g in self.__games.values() if g["updated_at"] > updated_since]
+            changed.extend({"id": id, "deleted": True, "updated_at": at}
+                           for id, at in self.__deleted.items() if at > updated_since)
+            return sorted(changed, key=lambda g: g["updated_at"])
+
+    def game(self, id: int) -> Optional[Dict[str, Any]]:
+        with self.__lock:
+            return self.__games.get(id)
+
+    def add_game(self, title: str, description: str, genres: List[int], pegi: int, release_date: str) -> Dict[str, Any]:
+        with self.__lock:
+            unknown = [id for id in genres if id not in self.__genres]
+            if unknown:
+                raise Conflict(f"Invalid pk \"{unknown[0]}\" - object does not exist.")
+            return self.__add_game(title, description, genres, pegi, release_date)
+
+    def delete_game(self, id: int) -> bool:
+        with self.__lock:
+            if self.__games.pop(id, None) is None:
+                return False
+            self.__deleted[id] = self.__now()
+            for entries in self.__entries.values():
+                for entry_id in [e["id"] for e in entries.values() if e["game"] == id]:
+                    del entries[entry_id]
+            return True
+
+    # Personal lists
+
+    def __entry_view(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        view = {"id": entry["id"], "game": self.__games[entry["game"]]}
+        if "rating" in entry:
+            view["rating"] = entry["rating"]
+        return view
+
+    def entries(self, name: str, user: int) -> List[Dict[str, Any]]:
+        with self.__lock:
+            return [self.__entry_view(e) for e in self.__entries[name].values() if e["owner"] == user]
+
+    def entries_of(self, name: str, username: str) -> Optional[List[Dict[str, Any]]]:
+        with self.__lock:
+            user = next((u["id"] for u in self.__users.values() if u["username"] == username), None)
+            if user is None:
+                return None
+            return [self.__entry_view(e) for e in self.__entries[name].values() if e["owner"] == user]
+
+    def add_entry(self, name: str, user: int, game: int, rating: Optional[int] = None) -> Dict[str, Any]:
+        with self.__lock:
+            if game not in self.__games:
+                raise Conflict(f"Invalid pk \"{game}\" - object does not exist.")
+            if any(e["owner"] == user and e["game"] == game for e in self.__entries[name].values()):
+                raise Conflict("The game is already in the list.")
+            if name == "games-played" and not (isinstance(rating, int) and 1 <= rating <= 10):
+                raise Conflict("rating must be between 1 and 10.")
+            return self.__entry_view(self.__add_entry(name, user, game, rating))
+
+    def delete_entry(self, name: str, user: int, id: int) -> bool:
+        with self.__lock:
+            entry = self.__entries[name].get(id)
+            if entry is None or entry["owner"] != user:
+                return False
+            del self.__entries[name][id]
+            return True
+
+    def stats(self) -> Tuple[int, int, int]:
+        with self.__lock:
+            return len(self.__games), len(self.__genres), len(self.__users)
@@ -0,0 +1,251 @@
+"""Stand-in Fiordispino backend over real sockets, for benchmarks and integration tests.
+
+Run with ``python -m fake_backend.server [--games N] [--latency MS] ...`` and point the client at the
+printed base URL.
+"""
+import argparse
+import email.parser
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from fake_backend.dataset import Conflict, Dataset
+
+_item = re.compile(r"^/(game|genre|user|games-to-play|games-played)/(\d+)/$")
+_owner = re.compile(r"^/(games-to-play|games-played)/owner/([^/]+)/$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, so the client's pooled sessions behave as against the real backend
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, each response waits for a delayed ACK
+    disable_nagle_algorithm = True
+    server: '_Server'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def __reply(self, status: int, data: Any = None) -> None:
+        body = b"" if data is None else json.dumps(data).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if self.command == "GET" and status == 200 and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.command == "GET" and status in (200, 304):
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def __error(self, status: int, message: str, field: str = "detail") -> None:
+        self.__reply(status, {field: [message] if field != "detail" else message})
+
+    def __body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("application/json"):
+            return json.loads(raw or b"{}")
+        if content_type.startswith("multipart/form-data"):
+            message = email.parser.BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + raw)
+            form: Dict[str, Any] = {}
+            for part in message.get_payload():
+                name = part.get_param("name", header="content-disposition")
+                if part.get_filename() is None:
+                    form.setdefault(name, []).append(part.get_payload(decode=True).decode())
+            return {name: values if name == "genres" else values[0] for name, values in form.items()}
+        return {name: values if name == "genres" else values[0] for name, values in parse_qs(raw.decode()).items()}
+
+    def __user(self) -> Optional[Dict[str, Any]]:
+        authorization = self.headers.get("Authorization", "")
+        return self.server.dataset.user(authorization[len("Token "):] if authorization.startswith("Token ") else None)
+
+    def __page(self, items: List[Any], path: str, query: Dict[str, List[str]]) -> Any:
+        # Limit/offset pagination as Django REST framework does it, only when a limit is asked for
+        if "limit" not in query:
+            return items
+        limit = max(1, int(query["limit"][0]))
+        offset = max(0, int(query.get("offset", ["0"])[0]))
+        rest = {k: v[0] for k, v in query.items() if k not in ("limit", "offset")}
+
+        def link(at: int) -> str:
+            return f"{self.server.base_url}{path}?{urlencode({**rest, 'limit': limit, 'offset': at})}"
+
+        return {"count": len(items), "results": items[offset:offset + limit],
+                "next": link(offset + limit) if offset + limit < len(items) else None,
+                "previous": link(max(0, offset - limit)) if offset > 0 else None}
+
+    def __handle(self) -> None:
+        self.server.delay()
+        url = urlsplit(self.path)
+        path = url.path[len(self.server.prefix):] if url.path.startswith(self.server.prefix) else url.path
+        query = parse_qs(url.query)
+        dataset = self.server.dataset
+        body = self.__body() if self.command == "POST" else {}
+
+        if (self.command, path) == ("POST", "/auth/login/"):
+            token = dataset.login(body.get("email", ""), body.get("password", ""))
+            if token is None:
+                return self.__error(400, "Unable to log in with provided credentials.", "non_field_errors")
+            return self.__reply(200, {"key": token})
+        if (self.command, path) == ("POST", "/auth/registration/"):
+            if body.get("password") != body.get("password2"):
+                return self.__error(400, "The two password fields didn't match.", "password")
+            return self.__reply(201, {"key": dataset.register(body.get("username", ""), body.get("email", ""),
+                                                              body.get("password", ""))})
+
+        if (self.command, path) == ("GET", "/genre/"):
+            return self.__reply(200, dataset.genres())
+        if (self.command, path) == ("GET", "/game/"):
+            return self.__reply(200, self.__page(dataset.games(query.get("updated_since", [None])[0]), path, query))
+        item = _item.match(path)
+        if self.command == "GET" and item is not None and item.group(1) in ("game", "genre"):
+            found = (dataset.game if item.group(1) == "game" else dataset.genre)(int(item.group(2)))
+            return self.__reply(200, found) if found is not None else self.__error(404, "Not found.")
+
+        user = self.__user()
+        if user is None:
+            return self.__error(401, "Invalid token.")
+        owner = _owner.match(path)
+
+        if (self.command, path) == ("GET", "/user/me/"):
+            return self.__reply(200, user)
+        if self.command == "GET" and owner is not None:
+            entries = dataset.entries_of(owner.group(1), owner.group(2))
+            return self.__reply(200, self.__page(entries, path, query)) if entries is not None else self.__error(404, "Not found.")
+        if self.command == "GET" and path in ("/games-to-play/", "/games-played/"):
+            return self.__reply(200, dataset.entries(path.strip("/"), user["id"]))
+        if self.command == "POST" and path in ("/games-to-play/", "/games-played/"):
+            rating = body.get("rating")
+            return self.__reply(201, dataset.add_entry(path.strip("/"), user["id"], int(body.get("game", 0)),
+                                                       int(rating) if rating is not None else None))
+        if self.command == "DELETE" and item is not None and item.group(1) in ("games-to-play", "games-played"):
+            if dataset.delete_entry(item.group(1), user["id"], int(item.group(2))):
+                return self.__reply(204)
+            return self.__error(404, "Not found.")
+
+        if not user["is_superuser"]:
+            return self.__error(403, "You do not have permission to perform this action.")
+        if (self.command, path) == ("GET", "/user/"):
+            return self.__reply(200, dataset.users())
+        if (self.command, path) == ("POST", "/genre/"):
+            return self.__reply(201, dataset.add_genre(str(body.get("name", ""))))
+        if (self.command, path) == ("POST", "/game/"):
+            genres = body.get("genres") or []
+            return self.__reply(201, dataset.add_game(str(body.get("title", "")), str(body.get("description", "")),
+                                                      [int(g) for g in (genres if isinstance(genres, list) else [genres])],
+                                                      int(body.get("pegi", 0)), str(body.get("release_date", ""))))
+        if self.command == "DELETE" and item is not None and item.group(1) in ("game", "genre", "user"):
+            delete = {"game": dataset.delete_game, "genre": dataset.delete_genre, "user": dataset.delete_user}[item.group(1)]
+            return self.__reply(204) if delete(int(item.group(2))) else self.__error(404, "Not found.")
+        return self.__error(404, "Not found.")
+
+    def __dispatch(self) -> None:
+        try:
+            self.__handle()
+        except Conflict as e:
+            self.__error(400, str(e), "non_field_errors")
+        except (ValueError, KeyError, TypeError) as e:
+            self.__error(400, f"Malformed request: {e}")
+
+    def do_GET(self) -> None:
+        self.__dispatch()
+
+    def do_POST(self) -> None:
+        self.__dispatch()
+
+    def do_DELETE(self) -> None:
+        self.__dispatch()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    prefix = "/api/v1"
+
+    def __init__(self, address: Tuple[str, int], dataset: Dataset, latency: float, jitter: float) -> None:
+        super().__init__(address, _Handler)
+        self.dataset = dataset
+        self.latency = latency
+        self.jitter = jitter
+        self.base_url = f"http://{self.server_address[0]}:{self.server_address[1]}{self.prefix}"
+
+    def delay(self) -> None:
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+
+class FakeBackend:
+    """Serves a generated Dataset on a local port, with latency injected into every response.
+
+    Use it as a context manager, or start() and stop() it; base_url is what HttpClient and Batch take.
+    Port 0 picks a free port.
+    """
+
+    def __init__(self, dataset: Optional[Dataset] = None, latency: float = 0.0, jitter: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0) -> None:
+        self.__server = _Server((host, port), dataset or Dataset(), latency, jitter)
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return self.__server.base_url
+
+    @property
+    def dataset(self) -> Dataset:
+        return self.__server.dataset
+
+    def start(self) -> 'FakeBackend':
+        self.__thread = threading.Thread(target=self.__server.serve_forever, kwargs={"poll_interval": 0.05},
+                                         name="fake-backend", daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __enter__(self) -> 'FakeBackend':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="fake_backend", description="Serve a stand-in Fiordispino backend.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--genres", type=int, default=12)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--list-size", type=int, default=20, help="games in each list of each user")
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra milliseconds, up to this many")
+    args = parser.parse_args(argv)
+
+    dataset = Dataset(args.games, args.genres, args.users, args.list_size)
+    backend = FakeBackend(dataset, args.latency / 1000, args.jitter / 1000, args.host, args.port)
+    games, genres, users = dataset.stats()
+    print(f"Serving {games} games, {genres} genres and {users} users at {backend.base_url}; "
+          f"log in as user1@gmail.com or admin@gmail.com with password {Dataset.password}",
+          file=sys.stderr)
+    with backend:
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
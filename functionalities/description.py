@@ -1,20 +1,23 @@
 from dataclasses import dataclass
 
-from typeguard import typechecked
-from valid8 import validate, ValidationError
+from valid8 import Validator, ValidationError
+from valid8.validation_lib import minlen, maxlen
 
 from exceptions.functionalities.description_exception import DescriptionException
 from utils.regex import pattern
+from utils.typechecking import typechecked
+
+_validator = Validator(minlen(1), maxlen(1000), pattern(r'[a-zA-Z0-9 ;.,_-]*'))
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Description:
     value: str
 
     def __post_init__(self):
         try:
-            validate("value", self.value, min_len=1, max_len=1000, custom=pattern(r'[a-zA-Z0-9 ;.,_-]*'))
+            _validator.assert_valid("value", self.value)
         except ValidationError:
             raise DescriptionException
 
@@ -1,12 +1,11 @@
 from dataclasses import dataclass, field
 from typing import Callable
 
-from typeguard import typechecked
-
 from exceptions.functionalities.entry_exception import EntryException
 from functionalities.description import Description
 from functionalities.key import Key
 from utils.dataclasses import validate_dataclass
+from utils.typechecking import typechecked
 
 
 @typechecked
@@ -16,6 +15,7 @@ class Entry:
     description: Description
     on_selected: Callable[[], None] = field(default=lambda: None)
     is_exit: bool = field(default=False)
+    is_hidden: bool = field(default=False)    # selectable by key but not listed
 
     def __post_init__(self):
         try:
@@ -24,5 +24,6 @@ class Entry:
             raise EntryException
 
     @staticmethod
-    def create(key: str, description: str, on_selected: Callable[[], None] = lambda: None, is_exit: bool = False) -> 'Entry':
-        return Entry(Key(key), Description(description), on_selected, is_exit)
\ No newline at end of file
+    def create(key: str, description: str, on_selected: Callable[[], None] = lambda: None, is_exit: bool = False,
+               is_hidden: bool = False) -> 'Entry':
+        return Entry(Key(key), Description(description), on_selected, is_exit, is_hidden)
\ No newline at end of file
@@ -1,13 +1,13 @@
 from dataclasses import dataclass, field, InitVar
 from typing import Callable, List, Dict, Any, Optional
 
-from typeguard import typechecked
 from valid8 import validate
 
 from functionalities.description import Description
 from functionalities.entry import Entry
 from functionalities.key import Key
 from utils.dataclasses import validate_dataclass
+from utils.typechecking import typechecked
 
 
 @typechecked
@@ -42,7 +42,8 @@ class Menu:
         print(fmt.format('*', '*' * length, '*'))
         self.auto_select()
         for entry in self.__entries:
-            print(f"{entry.key}:\t{entry.description}")
+            if not entry.is_hidden:
+                print(f"{entry.key}:\t{entry.description}")
 
     def __select_from_input(self) -> bool:
         while True:
@@ -1,7 +1,25 @@
-from app import App
+import argparse
+import sys
+from typing import List, Optional
 
+from utils.table import FORMATS
 
-def main():
-    App().run()
 
-main()
\ No newline at end of file
+def main(argv: Optional[List[str]] = None) -> Optional[int]:
+    argv = sys.argv[1:] if argv is None else argv
+    # --format alone opens the menus with that output; anything else, --format included, is a batch command
+    menus = not argv or (len(argv) == 2 and argv[0] == "--format") or \
+        (len(argv) == 1 and argv[0].startswith("--format="))
+
+    # Each mode imports only its own modules, the menus start without the batch commands and vice versa
+    if not menus:
+        from batch import Batch
+        return Batch.main(argv)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--format", choices=FORMATS, default="table")
+    args = parser.parse_args(argv)
+    from app import App
+    App(output_format=args.format).run()
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
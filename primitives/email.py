@@ -1,15 +1,43 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, InitVar, field
+
+import email_validator
+from email_validator import validate_email, EmailUndeliverableError
+
+from utils.ttl_cache import TTLCache
+from utils.typechecking import typechecked
+
+# Deliverability by domain; unknown outcomes (no nameserver, timeout) are retried sooner
+_deliverability = TTLCache(maxsize=1024, ttl=3600.0)
+_unknown_deliverability_ttl = 60.0
+
+
+def _check_deliverability(ascii_domain: str, domain: str) -> None:
+    outcome = _deliverability.get(ascii_domain)
+    if outcome is None:
+        from email_validator.deliverability import validate_email_deliverability
+        try:
+            info = validate_email_deliverability(ascii_domain, domain)
+            outcome = True
+            _deliverability.put(ascii_domain, outcome,
+                                _unknown_deliverability_ttl if "unknown-deliverability" in info else None)
+        except EmailUndeliverableError as e:
+            outcome = e
+            _deliverability.put(ascii_domain, outcome)
+    if isinstance(outcome, EmailUndeliverableError):
+        raise EmailUndeliverableError(str(outcome))
 
-from typeguard import typechecked
-from email_validator import validate_email
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Email:
     email: str
+    check_deliverability: InitVar[bool] = field(default=True)
 
-    def __post_init__(self):
-        validate_email(self.email)
+    def __post_init__(self, check_deliverability: bool):
+        # Syntax is always checked offline; the DNS lookups are left to addresses typed by the user
+        validated = validate_email(self.email, check_deliverability=False)
+        if check_deliverability and email_validator.CHECK_DELIVERABILITY and not email_validator.TEST_ENVIRONMENT:
+            _check_deliverability(validated.ascii_domain, validated.domain)
 
     def __str__(self):
         return self.email
\ No newline at end of file
@@ -1,20 +1,23 @@
 from dataclasses import dataclass
 
-from typeguard import typechecked
-from valid8 import validate, ValidationError
+from valid8 import Validator, ValidationError
+from valid8.validation_lib import minlen, maxlen
 
 from exceptions.primitives.game_description_exception import GameDescriptionException
 from utils.regex import pattern
+from utils.typechecking import typechecked
+
+_validator = Validator(minlen(1), maxlen(200), pattern(r'^[\w\s!,;:.?\'"()-]*$'))
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class GameDescription:
     description: str
 
     def __post_init__(self):
         try:
-            validate("description", self.description, min_len=1, max_len=200, custom=pattern(r'^[\w\s!,;:.?\'"()-]*$'))
+            _validator.assert_valid("description", self.description)
         except ValidationError:
             raise GameDescriptionException
 
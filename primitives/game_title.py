@@ -1,20 +1,23 @@
 from dataclasses import dataclass
 
-from typeguard import typechecked
-from valid8 import validate, ValidationError
+from valid8 import Validator, ValidationError
+from valid8.validation_lib import minlen, maxlen
 
 from exceptions.primitives.game_title_exception import GameTitleException
 from utils.regex import pattern
+from utils.typechecking import typechecked
+
+_validator = Validator(minlen(1), maxlen(100), pattern(r'[a-zA-Z0-9\s:]*'))
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class GameTitle:
     title: str
 
     def __post_init__(self):
         try:
-            validate("title", self.title, min_len=1, max_len=100, custom=pattern(r'[a-zA-Z0-9\s:]*'))
+            _validator.assert_valid("title", self.title)
         except ValidationError:
             raise GameTitleException
 
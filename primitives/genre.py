@@ -1,22 +1,31 @@
+import functools
 from dataclasses import dataclass
 
-from typeguard import typechecked
-from valid8 import validate, ValidationError
+from valid8 import Validator, ValidationError
+from valid8.validation_lib import minlen, maxlen
 
 from exceptions.primitives.genre_exception import GenreException
 from utils.regex import pattern
+from utils.typechecking import typechecked
+
+_validator = Validator(minlen(1), maxlen(100), pattern(r'[a-zA-Z\s]*'))
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Genre:
     genre: str
 
     def __post_init__(self):
         try:
-            validate("genre", self.genre, min_len=1, max_len=100, custom=pattern(r'[a-zA-Z\s]*'))
+            _validator.assert_valid("genre", self.genre)
         except ValidationError:
             raise GenreException
 
     def __str__(self):
-        return self.genre
\ No newline at end of file
+        return self.genre
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256, typed=True)
+    def of(genre: str) -> 'Genre':
+        return Genre(genre)
\ No newline at end of file
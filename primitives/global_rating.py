@@ -1,14 +1,14 @@
 from dataclasses import dataclass, InitVar, field
 from typing import Any
 
-from typeguard import typechecked
 from valid8 import validate, ValidationError
 
 from exceptions.primitives.global_rating_exception import GlobalRatingException
+from utils.typechecking import typechecked
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class GlobalRating:
     value_in_decimals: int
     create_key: InitVar[Any] = field(default=None)
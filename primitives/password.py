@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from typeguard import typechecked
 from valid8 import validate
 
 from exceptions.primitives.password_exception import PasswordException
+from utils.typechecking import typechecked
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Password:
     password: str
 
@@ -1,13 +1,14 @@
+import functools
 from dataclasses import dataclass
 
-from typeguard import typechecked
 from valid8 import validate, ValidationError
 
 from exceptions.primitives.pegi_ranking_exception import PegiRankingException
+from utils.typechecking import typechecked
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Pegi:
     pegi_ranking_int: int
 
@@ -20,3 +21,8 @@ class Pegi:
 
     def __str__(self):
         return f'PEGI {self.pegi_ranking_int}'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None, typed=True)
+    def of(pegi_ranking_int: int) -> 'Pegi':
+        return Pegi(pegi_ranking_int)
@@ -1,13 +1,13 @@
 from dataclasses import dataclass
 
 from valid8 import validate, ValidationError
-from typeguard import typechecked
 
 from exceptions.primitives.rating_count_exception import RatingCountException
+from utils.typechecking import typechecked
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class RatingCount:
     count: int
 
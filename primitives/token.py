@@ -1,19 +1,22 @@
 from dataclasses import dataclass
-from typeguard import typechecked
-from valid8 import validate, ValidationError
+from valid8 import Validator, ValidationError
+from valid8.validation_lib import minlen, maxlen
 
 from exceptions.primitives.token_exception import TokenException
 from utils.regex import pattern
+from utils.typechecking import typechecked
+
+_validator = Validator(minlen(40), maxlen(40), pattern(r'[a-zA-Z0-9]*'))
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Token:
     token: str
 
     def __post_init__(self):
         try:
-            validate("token", self.token, min_len=40, max_len=40, custom=pattern(r'[a-zA-Z0-9]*'))
+            _validator.assert_valid("token", self.token)
         except ValidationError:
             raise TokenException
 
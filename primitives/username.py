@@ -1,20 +1,23 @@
 from dataclasses import dataclass
 
-from typeguard import typechecked
-from valid8 import validate, ValidationError
+from valid8 import Validator, ValidationError
+from valid8.validation_lib import minlen, maxlen
 
 from exceptions.primitives.username_exception import UsernameException
 from utils.regex import pattern
+from utils.typechecking import typechecked
+
+_validator = Validator(minlen(1), maxlen(150), pattern(r'[a-zA-Z0-9_@+.-]*'))
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Username:
     username: str
 
     def __post_init__(self):
         try:
-            validate("username", self.username, min_len=1, max_len=150, custom=pattern(r'[a-zA-Z0-9_@+.-]*'))
+            _validator.assert_valid("username", self.username)
         except ValidationError:
             raise UsernameException
 
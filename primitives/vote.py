@@ -1,13 +1,14 @@
+import functools
 from dataclasses import dataclass
 
-from typeguard import typechecked
 from valid8 import validate, ValidationError
 
 from exceptions.primitives.vote_exception import VoteException
+from utils.typechecking import typechecked
 
 
 @typechecked
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Vote:
     vote: int
 
@@ -18,4 +19,9 @@ class Vote:
             raise VoteException
 
     def __str__(self):
-        return str(self.vote)
\ No newline at end of file
+        return str(self.vote)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None, typed=True)
+    def of(vote: int) -> 'Vote':
+        return Vote(vote)
\ No newline at end of file
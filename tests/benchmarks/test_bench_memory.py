@@ -0,0 +1,16 @@
+import pytest
+
+from benchmarks.bench_memory import unslotted
+from exceptions.primitives.game_title_exception import GameTitleException
+from primitives.game_title import GameTitle
+from primitives.global_rating import GlobalRating
+
+
+def test_unslotted_primitives_are_plain_dataclasses_with_the_same_validation():
+    title = unslotted(GameTitle)("Zelda")
+    rating = unslotted(GlobalRating)(950, GlobalRating._GlobalRating__create_key)
+
+    assert not isinstance(title, GameTitle) and vars(title) == {"title": "Zelda"}
+    assert str(rating) == "9.50" and vars(rating) == {"value_in_decimals": 950}
+    with pytest.raises(GameTitleException):
+        unslotted(GameTitle)("")
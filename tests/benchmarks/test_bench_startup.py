@@ -0,0 +1,21 @@
+from benchmarks.bench_startup import first_prompt, parse_importtime
+
+
+def test_parse_importtime_reads_self_and_cumulative_times():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   functionalities.key",
+        "import time:      3046 |       3166 | functionalities.menu",
+        "Goodbye!",
+    ])
+
+    assert parse_importtime(stderr) == [("functionalities.key", 120, 120), ("functionalities.menu", 3046, 3166)]
+
+
+def test_first_prompt_is_reached_without_the_http_stack():
+    elapsed, stderr = first_prompt(production=True, importtime=True)
+
+    modules = [name for name, _, _ in parse_importtime(stderr)]
+    assert elapsed > 0
+    assert "app" in modules and "functionalities.menu" in modules
+    assert not {"requests", "email_validator", "typeguard", "catalogue.sync"} & set(modules)
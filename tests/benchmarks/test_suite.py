@@ -0,0 +1,34 @@
+import json
+
+from benchmarks.suite import Case, compare, main, measure
+
+
+def test_measure_reports_median_and_throughput():
+    calls = []
+    result = measure(Case("noop", lambda: calls.append(1), operations=10, repeat=3))
+
+    assert len(calls) == 4    # one warm-up run, then the timed ones
+    assert result["min"] <= result["median"]
+    assert result["ops_per_s"] > 0
+
+
+def test_compare_flags_only_slowdowns_beyond_the_threshold():
+    baseline = {"a": {"median": 1.0}, "b": {"median": 1.0}, "gone": {"median": 1.0}}
+    results = {"a": {"median": 1.2}, "b": {"median": 1.3}, "new": {"median": 9.0}}
+
+    regressions = compare(results, baseline, threshold=0.25)
+
+    assert [r.name for r in regressions] == ["b"]
+    assert round(regressions[0].change, 2) == 0.3
+
+
+def test_main_saves_a_baseline_and_fails_on_regressions(tmp_path, capsys):
+    saved = tmp_path / "baseline.json"
+    assert main(["--only", "primitives/Pegi.of", "--save", str(saved)]) == 0
+    baseline = json.loads(saved.read_text())
+    assert list(baseline["cases"]) == ["primitives/Pegi.of"]
+
+    baseline["cases"]["primitives/Pegi.of"]["median"] /= 100
+    saved.write_text(json.dumps(baseline))
+    assert main(["--only", "primitives/Pegi.of", "--compare", str(saved), "--threshold", "0.5"]) == 1
+    assert "REGRESSION primitives/Pegi.of" in capsys.readouterr().out
@@ -0,0 +1,77 @@
+import pytest
+
+from catalogue.search_index import Query, SearchIndex
+
+
+def game(id, title, genres=("Adventure",), pegi=12, release_date="2017-03-03", global_rating=7.5):
+    return {"id": id, "title": title, "genres": [{"id": i, "name": g} for i, g in enumerate(genres)],
+            "pegi": pegi, "release_date": release_date, "global_rating": global_rating}
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([
+        game(1, "The Legend of Zelda: Breath of the Wild"),
+        game(2, "Zelda II: The Adventure of Link", pegi=7, release_date="1987-01-14", global_rating=6.1),
+        game(3, "DOOM", genres=("Shooter",), pegi=18, release_date="1993-12-10", global_rating=9.0),
+        game(4, "Doom Eternal", genres=("Shooter", "Action"), pegi=18, release_date="2020-03-20", global_rating=0.0),
+    ])
+
+
+def titles(games):
+    return [g["title"] for g in games]
+
+
+def test_query_parse():
+    query = Query.parse("Zelda genre:role_playing pegi<=12 rating>=7.5 year:2017")
+
+    assert query.words == ("zelda",)
+    assert query.genres == ("role playing",)
+    assert query.pegi == (None, 12)
+    assert query.rating == (7.5, None)
+    assert query.released == ("2017-00-00", "2017-99-99")
+
+
+@pytest.mark.parametrize("text", ["pegi:old", "released>=yesterday", "rating=high"])
+def test_query_parse_invalid_filter(text):
+    with pytest.raises(ValueError):
+        Query.parse(text)
+
+
+def test_search_by_title_words(index):
+    assert titles(index.search(Query.parse("zelda"))) == ["The Legend of Zelda: Breath of the Wild", "Zelda II: The Adventure of Link"]
+    assert titles(index.search(Query.parse("doom"))) == ["DOOM", "Doom Eternal"]
+    assert titles(index.search(Query.parse("zelda link"))) == ["Zelda II: The Adventure of Link"]
+    assert index.search(Query.parse("mario")) == []
+
+
+def test_search_by_genre_and_ranges(index):
+    assert titles(index.search(Query.parse("genre:action"))) == ["Doom Eternal"]
+    assert titles(index.search(Query.parse("pegi<=12"))) == ["The Legend of Zelda: Breath of the Wild", "Zelda II: The Adventure of Link"]
+    assert titles(index.search(Query.parse("year<=1995"))) == ["DOOM", "Zelda II: The Adventure of Link"]
+    assert titles(index.search(Query.parse("released>=2017-03-03 rating>=7"))) == ["The Legend of Zelda: Breath of the Wild"]
+    assert titles(index.search(Query.parse("doom rating>=1"))) == ["DOOM"]
+
+
+def test_search_without_filters_lists_everything_by_title(index):
+    assert titles(index.search(Query(), limit=2)) == ["DOOM", "Doom Eternal"]
+
+
+def test_search_limit_over_a_large_catalogue():
+    index = SearchIndex(game(i, f"Game {i:05d}", pegi=(3, 18)[i % 2]) for i in range(5000))
+
+    assert titles(index.search(Query.parse("game pegi:18"), limit=3)) == ["Game 00001", "Game 00003", "Game 00005"]
+
+
+def test_index_updates_incrementally(index):
+    index.add(game(5, "Zelda: Tears of the Kingdom", release_date="2023-05-12"))
+    index.add(game(3, "DOOM (1993)", genres=("Shooter",), pegi=16, release_date="1993-12-10"))
+    index.remove(1)
+    index.remove(42)
+
+    assert len(index) == 4
+    assert 1 not in index
+    assert titles(index.search(Query.parse("zelda"))) == ["Zelda II: The Adventure of Link", "Zelda: Tears of the Kingdom"]
+    assert titles(index.search(Query.parse("pegi:16"))) == ["DOOM (1993)"]
+    assert index.search(Query.parse("pegi:18"))[0]["id"] == 4
+    assert index.search(Query.parse("wild")) == []
@@ -0,0 +1,32 @@
+from catalogue.store import CatalogueStore, game_hash
+
+
+def test_store_applies_changes_and_watermark(tmp_path):
+    store = CatalogueStore(tmp_path / "games.sqlite3")
+    store.apply([{"id": 1, "title": "Zelda"}, {"id": 2, "title": "Doom"}], [], "2025-01-01T00:00:00Z")
+    store.apply([{"id": 2, "title": "Doom Eternal"}], [1], "2025-02-01T00:00:00Z")
+
+    assert list(store.games()) == [{"id": 2, "title": "Doom Eternal"}]
+    assert store.hashes() == {2: game_hash({"title": "Doom Eternal", "id": 2})}
+    assert store.watermark() == "2025-02-01T00:00:00Z"
+    assert len(store) == 1
+    store.close()
+
+
+def test_store_survives_reopening(tmp_path):
+    store = CatalogueStore(tmp_path / "games.sqlite3")
+    store.apply([{"id": 1, "title": "Zelda"}], [], None)
+    store.close()
+
+    reopened = CatalogueStore(tmp_path / "games.sqlite3")
+    assert list(reopened.games()) == [{"id": 1, "title": "Zelda"}]
+    assert reopened.watermark() is None
+    reopened.clear()
+    assert len(reopened) == 0
+    reopened.close()
+
+
+def test_store_default_honours_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("FIORDISPINO_CACHE_DIR", str(tmp_path))
+
+    assert CatalogueStore.default().path == tmp_path / "games.sqlite3"
@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+import pytest
+
+from catalogue.store import CatalogueStore
+from catalogue.sync import CatalogueSync
+from client.http_client import HttpClient
+from tests.helpers import response
+
+
+def game(id, title, updated_at=None):
+    data = {"id": id, "title": title}
+    if updated_at is not None:
+        data["updated_at"] = updated_at
+    return data
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CatalogueStore(tmp_path / "games.sqlite3")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def sync(store):
+    return CatalogueSync(HttpClient("http://localhost:8000/api/v1"), store, page_size=10)
+
+
+@patch("requests.Session.get")
+def test_first_sync_downloads_the_catalogue(mocked_get, sync, store):
+    mocked_get.return_value = response([game(1, "Zelda", "2025-01-01"), game(2, "Doom", "2025-01-02")])
+
+    result = sync.sync()
+
+    assert [g["id"] for g in result.changed] == [1, 2]
+    assert not result.incremental
+    assert store.watermark() == "2025-01-02"
+    assert "updated_since" not in mocked_get.call_args.kwargs["params"]
+
+
+@patch("requests.Session.get")
+def test_sync_asks_only_for_changes_since_the_watermark(mocked_get, sync, store):
+    store.apply([game(1, "Zelda", "2025-01-01"), game(2, "Doom", "2025-01-02")], [], "2025-01-02")
+    mocked_get.return_value = response({"count": 2, "next": None, "previous": None, "results": [
+        game(2, "Doom Eternal", "2025-02-01"),
+        {"id": 1, "deleted": True, "updated_at": "2025-02-02"},
+    ]})
+
+    result = sync.sync()
+
+    assert mocked_get.call_args.kwargs["params"]["updated_since"] == "2025-01-02"
+    assert result.incremental
+    assert [g["title"] for g in result.changed] == ["Doom Eternal"]
+    assert result.deleted == (1,)
+    assert list(store.games()) == [game(2, "Doom Eternal", "2025-02-01")]
+    assert store.watermark() == "2025-02-02"
+
+
+@patch("requests.Session.get")
+def test_sync_diffs_hashes_when_the_backend_ignores_the_watermark(mocked_get, sync, store):
+    store.apply([game(1, "Zelda", "2025-01-01"), game(2, "Doom", "2025-01-02")], [], "2025-01-02")
+    mocked_get.return_value = response([game(1, "Zelda", "2025-01-01"), game(3, "Portal", "2025-03-01")])
+
+    result = sync.sync()
+
+    assert not result.incremental
+    assert [g["id"] for g in result.changed] == [3]
+    assert result.deleted == (2,)
+    assert store.watermark() == "2025-03-01"
+
+
+@patch("requests.Session.get")
+def test_sync_without_timestamps_always_diffs(mocked_get, sync, store):
+    mocked_get.return_value = response([game(1, "Zelda"), game(2, "Doom")])
+    sync.sync()
+    mocked_get.return_value = response([game(1, "Zelda"), game(2, "Doom 64")])
+
+    result = sync.sync()
+
+    assert [g["title"] for g in result.changed] == ["Doom 64"]
+    assert result.deleted == ()
+    assert store.watermark() is None
+
+
+@patch("requests.Session.get")
+def test_sync_merges_a_delta_of_tombstones_without_timestamps(mocked_get, sync, store):
+    store.apply([game(1, "Zelda", "2025-01-01"), game(2, "Doom", "2025-01-02")], [], "2025-01-02")
+    mocked_get.return_value = response([{"id": 1, "deleted": True}])
+
+    result = sync.sync()
+
+    assert result.incremental
+    assert result.deleted == (1,)
+    assert list(store.games()) == [game(2, "Doom", "2025-01-02")]
+    assert store.watermark() == "2025-01-02"
@@ -0,0 +1,54 @@
+import pytest
+
+from catalogue.title_index import TitleIndex
+from catalogue.words import words
+
+
+@pytest.fixture
+def index():
+    index = TitleIndex()
+    for id, title in enumerate(["The Legend of Zelda: Breath of the Wild", "Zelda II: The Adventure of Link",
+                                "DOOM", "Doom Eternal", "Portal 2"], start=1):
+        index.add(id, title)
+    return index
+
+
+def test_words():
+    assert words("Zelda II: The_Adventure-of LINK") == ["zelda", "ii", "the", "adventure", "of", "link"]
+
+
+def test_prefixed(index):
+    assert index.prefixed("zel") == {1, 2}
+    assert index.prefixed("do") == {3, 4}
+    assert index.prefixed("x") == set()
+
+
+def test_matches_prefixes_of_every_word(index):
+    assert index.matches("zel bre") == [1]
+    assert index.matches("the") == [1, 2]
+
+
+def test_matches_prefers_titles_starting_with_the_query(index):
+    assert index.matches("doom") == [3, 4]
+    assert index.matches("zelda", k=1) == [2]
+
+
+def test_matches_misspelled_words(index):
+    assert index.matches("zleda")[:2] == [2, 1]
+    assert index.matches("doom eternl") == [4]
+    assert index.matches("portla") == [5]
+
+
+def test_matches_nothing(index):
+    assert index.matches("tetris") == []
+    assert index.matches("   ") == []
+
+
+def test_add_and_remove_keep_the_vocabulary(index):
+    index.add(3, "Doom 64")
+    index.remove(4)
+
+    assert index.matches("doom") == [3]
+    assert index.prefixed("eternal") == set()
+    assert index.prefixed("64") == {3}
+    assert len(index) == 4
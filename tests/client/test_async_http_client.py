@@ -0,0 +1,59 @@
+import threading
+import time
+
+from client.async_http_client import AsyncHttpClient
+from client.request import Request
+
+
+def test_async_http_client_runs_requests_concurrently():
+    barrier = threading.Barrier(3, timeout=2)
+
+    def send(request):
+        barrier.wait()
+        return request.path
+
+    client = AsyncHttpClient(send, max_concurrency=3)
+
+    assert client.run(Request.get("/a/"), Request.get("/b/"), Request.get("/c/")) == ["/a/", "/b/", "/c/"]
+    client.close()
+
+
+def test_async_http_client_bounds_concurrency():
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def send(request):
+        with lock:
+            running.append(request)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(request)
+
+    client = AsyncHttpClient(send, max_concurrency=2)
+    client.run(*(Request.get(f"/game/{i}/") for i in range(8)))
+
+    assert max(peak) == 2
+    client.close()
+
+
+def test_async_http_client_returns_exceptions_when_asked():
+    def send(request):
+        raise ValueError(request.path)
+
+    client = AsyncHttpClient(send)
+    result = client.run(Request.get("/a/"), Request.get("/b/"), return_exceptions=True)
+
+    assert [str(e) for e in result] == ["/a/", "/b/"]
+    client.close()
+
+
+def test_async_http_client_reports_each_completed_request():
+    done = []
+    client = AsyncHttpClient(lambda request: request.path, max_concurrency=2)
+
+    client.run(*(Request.get(f"/game/{i}/") for i in range(5)), on_done=lambda: done.append(1))
+
+    assert len(done) == 5
+    client.close()
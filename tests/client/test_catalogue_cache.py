@@ -0,0 +1,72 @@
+import json
+from unittest.mock import patch
+
+import requests
+
+from client.catalogue_cache import CatalogueCache
+from client.http_client import HttpClient
+
+
+def make_response(status_code, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = body
+    return response
+
+
+def test_catalogue_cache_stores_and_looks_up(tmp_path):
+    cache = CatalogueCache(tmp_path / "cache.sqlite3")
+    cache.store("http://x/game/", make_response(200, b"[1, 2]", {"ETag": '"v1"'}))
+
+    entry = cache.lookup("http://x/game/")
+    assert entry.etag == '"v1"'
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+    assert entry.to_response().json() == [1, 2]
+    cache.close()
+
+
+def test_catalogue_cache_skips_responses_without_validators(tmp_path):
+    cache = CatalogueCache(tmp_path / "cache.sqlite3")
+    cache.store("http://x/game/", make_response(200, b"[]"))
+
+    assert cache.lookup("http://x/game/") is None
+    cache.close()
+
+
+def test_catalogue_cache_default_honours_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("FIORDISPINO_CACHE_DIR", str(tmp_path))
+
+    assert CatalogueCache.default().path == tmp_path / "catalogue.sqlite3"
+
+
+@patch("requests.Session.get")
+def test_http_client_revalidates_cached_catalogue(mocked_get, tmp_path):
+    games = [{"id": 1, "title": "GoodGame"}]
+    mocked_get.side_effect = [
+        make_response(200, json.dumps(games).encode(), {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+        make_response(304),
+    ]
+    client = HttpClient("http://localhost:8000/api/v1", cache=CatalogueCache(tmp_path / "cache.sqlite3"))
+
+    assert client.get("/game/", cached=True).json() == games
+    assert client.get("/game/", cached=True).json() == games
+
+    _, kwargs = mocked_get.call_args
+    assert kwargs["headers"] == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    client.close()
+
+
+@patch("requests.Session.get")
+def test_http_client_replaces_cached_catalogue_when_modified(mocked_get, tmp_path):
+    mocked_get.side_effect = [
+        make_response(200, b"[1]", {"ETag": '"v1"'}),
+        make_response(200, b"[1, 2]", {"ETag": '"v2"'}),
+    ]
+    cache = CatalogueCache(tmp_path / "cache.sqlite3")
+    client = HttpClient("http://localhost:8000/api/v1", cache=cache)
+
+    client.get("/game/", cached=True)
+    assert client.get("/game/", cached=True).json() == [1, 2]
+    assert cache.lookup("http://localhost:8000/api/v1/game/").etag == '"v2"'
+    client.close()
@@ -0,0 +1,291 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, Mock
+
+import requests
+
+from client.http_client import HttpClient
+from client.request import Request
+from primitives.token import Token
+from tests.helpers import response, streamed
+from utils.metrics import Metrics
+
+
+@patch("requests.Session.get")
+def test_http_client_get_joins_base_url(mocked_get):
+    mocked_get.return_value = response()
+    client = HttpClient("http://localhost:8000/api/v1/")
+
+    client.get("/game/")
+
+    args, kwargs = mocked_get.call_args
+    assert args[0] == "http://localhost:8000/api/v1/game/"
+    assert "headers" not in kwargs
+
+
+@patch("requests.Session.get")
+def test_http_client_injects_token_when_authenticated(mocked_get):
+    client = HttpClient("http://localhost:8000/api/v1", token=lambda: Token("b" * 40))
+
+    client.get("/games-to-play/", authenticated=True)
+
+    _, kwargs = mocked_get.call_args
+    assert kwargs["headers"]["Authorization"] == f"Token {'b' * 40}"
+
+
+@patch("requests.Session.post")
+def test_http_client_applies_default_timeout(mocked_post):
+    client = HttpClient("http://localhost:8000/api/v1", timeout=(1.0, 2.0))
+
+    client.post("/genre/", json={"name": "RPG"})
+
+    _, kwargs = mocked_post.call_args
+    assert kwargs["timeout"] == (1.0, 2.0)
+    assert kwargs["json"] == {"name": "RPG"}
+
+
+@patch("requests.Session.delete")
+def test_http_client_keeps_explicit_timeout(mocked_delete):
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    client.delete("/genre/1/", authenticated=True, timeout=5)
+
+    _, kwargs = mocked_delete.call_args
+    assert kwargs["timeout"] == 5
+
+
+def test_http_client_reuses_one_session():
+    client = HttpClient("http://localhost:8000/api/v1", pool_maxsize=4, max_concurrency=2)
+    session = client._HttpClient__session
+
+    assert session.get_adapter("http://localhost:8000/") is session.get_adapter("http://localhost:8000/api/v1/game/")
+    assert session.get_adapter("http://localhost:8000/")._pool_maxsize == 4
+    client.close()
+
+
+@patch("requests.Session.get")
+def test_http_client_gather_keeps_request_order(mocked_get):
+    mocked_get.side_effect = lambda url, **kwargs: response(url=url)
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    responses = client.gather(Request.get("/game/"), Request.get("/genre/"))
+
+    assert [r.url for r in responses] == ["http://localhost:8000/api/v1/game/", "http://localhost:8000/api/v1/genre/"]
+
+
+@patch("requests.Session.get")
+def test_http_client_prefetch_serves_next_get(mocked_get):
+    mocked_get.side_effect = lambda url, **kwargs: response(url=url)
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    client.prefetch(Request.get("/game/"), Request.get("/games-to-play/", authenticated=True))
+    assert mocked_get.call_count == 2
+
+    client.get("/game/")
+    client.get("/games-to-play/", authenticated=True)
+    assert mocked_get.call_count == 2
+
+    client.get("/game/")
+    assert mocked_get.call_count == 3
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_http_client_prefetch_dropped_after_write(mocked_get, mocked_post):
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    client.prefetch(Request.get("/games-to-play/", authenticated=True))
+    client.post("/games-to-play/", authenticated=True, json={"game": 1})
+    client.get("/games-to-play/", authenticated=True)
+
+    assert mocked_get.call_count == 2
+
+
+def test_http_client_prefetch_ignores_failures():
+    client = HttpClient("http://localhost:8000/api/v1", max_retries=0)
+
+    client.prefetch(Request.get("/game/"))
+
+    assert client._HttpClient__prefetched == {}
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_http_client_drops_prefetches_overtaken_by_a_write(mocked_get, mocked_post):
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    def write_meanwhile(url, **kwargs):
+        client.post("/games-to-play/", json={"game": 1})
+        return response(url=url)
+    mocked_get.side_effect = write_meanwhile
+
+    assert client.prefetch(Request.get("/games-to-play/")) == [None]
+    assert not client.is_prefetched(Request.get("/games-to-play/"))
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_http_client_write_waits_for_a_prefetch_being_stored(mocked_get, mocked_post):
+    client = HttpClient("http://localhost:8000/api/v1")
+    mocked_get.return_value = response()
+    writer = threading.Thread(target=lambda: client.post("/games-to-play/", json={"game": 1}))
+    monotonic = time.monotonic
+
+    def write_while_storing():
+        # Called by prefetch() after it checked for writes and before it stores the response
+        if sys._getframe(1).f_code.co_name == "prefetch" and writer.ident is None:
+            writer.start()
+            writer.join(timeout=0.2)
+        return monotonic()
+
+    with patch("client.http_client.time.monotonic", write_while_storing):
+        client.prefetch(Request.get("/games-to-play/"))
+    writer.join()
+
+    assert mocked_post.call_count == 1
+    assert not client.is_prefetched(Request.get("/games-to-play/"))
+
+
+def concurrently(*calls):
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [f.result() if f.exception() is None else f.exception() for f in futures]
+
+
+@patch("requests.Session.get")
+def test_http_client_coalesces_identical_concurrent_gets(mocked_get):
+    arrived = threading.Barrier(3)
+    release = threading.Event()
+
+    def slow(url, **kwargs):
+        release.wait(5)
+        return response(url=url)
+    mocked_get.side_effect = slow
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    def get():
+        arrived.wait(5)
+        return client.get("/game/", params={"limit": 50})
+
+    def release_later():
+        arrived.wait(5)
+        time.sleep(0.05)
+        release.set()
+
+    first, second, _ = concurrently(get, get, release_later)
+
+    assert first is second
+    assert mocked_get.call_count == 1
+    client.get("/game/", params={"limit": 50})
+    assert mocked_get.call_count == 2
+
+
+@patch("requests.Session.get")
+def test_http_client_shares_errors_of_coalesced_gets(mocked_get):
+    arrived = threading.Barrier(3)
+    release = threading.Event()
+
+    def failing(url, **kwargs):
+        release.wait(5)
+        raise requests.ConnectionError("down")
+    mocked_get.side_effect = failing
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    def get():
+        arrived.wait(5)
+        return client.get("/genre/")
+
+    def release_later():
+        arrived.wait(5)
+        time.sleep(0.05)
+        release.set()
+
+    results = concurrently(get, get, release_later)
+
+    assert all(isinstance(r, requests.ConnectionError) for r in results[:2])
+    assert mocked_get.call_count == 1
+
+
+@patch("requests.Session.get")
+def test_http_client_does_not_coalesce_different_gets(mocked_get):
+    release = threading.Event()
+
+    def slow(url, **kwargs):
+        release.wait(0.2)
+        return response(url=url)
+    mocked_get.side_effect = slow
+    client = HttpClient("http://localhost:8000/api/v1", token=lambda: Token("a" * 40))
+
+    concurrently(lambda: client.get("/games-to-play/", authenticated=True),
+                 lambda: client.get("/games-to-play/"),
+                 lambda: client.get("/games-to-play/", params={"limit": 10}))
+
+    assert mocked_get.call_count == 3
+
+
+def test_http_client_endpoint_hides_ids_and_usernames():
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    assert client.endpoint("http://localhost:8000/api/v1/game/12/") == "/game/{id}/"
+    assert client.endpoint("http://localhost:8000/api/v1/games-played/owner/mario/?limit=5") == \
+        "/games-played/owner/{username}/"
+
+
+@patch("requests.Session.get")
+def test_http_client_records_request_timings(mocked_get):
+    mocked_get.return_value = response()
+    client = HttpClient("http://localhost:8000/api/v1", metrics=Metrics())
+
+    client.get("/game/1/")
+    client.get("/game/2/")
+
+    (kind, name, histogram), = client.metrics.summary()
+    assert (kind, name, histogram.count) == ("http", "GET /game/{id}/", 2)
+
+
+def test_http_client_times_json_decoding():
+    client = HttpClient("http://localhost:8000/api/v1", metrics=Metrics())
+
+    with patch("requests.Session.get", return_value=response([{"id": 1}], url="http://localhost:8000/api/v1/game/")):
+        assert client.json(client.get("/game/")) == [{"id": 1}]
+
+    assert [(kind, name) for kind, name, _ in client.metrics.summary()] == [("http", "GET /game/"), ("json", "GET /game/")]
+
+
+@patch("requests.Session.get")
+def test_http_client_stream_leaves_the_body_unread(mocked_get):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = Mock(read=Mock(side_effect=AssertionError("body read")))
+    mocked_get.return_value = response
+    client = HttpClient("http://localhost:8000/api/v1", cache=Mock(), metrics=Metrics())
+
+    assert client.stream(Request.get("/game/", True, cached=True, params={"limit": 10})) is response
+
+    args, kwargs = mocked_get.call_args
+    assert args[0] == "http://localhost:8000/api/v1/game/"
+    assert kwargs["stream"] is True and kwargs["params"] == {"limit": 10} and "cached" not in kwargs
+    assert "Authorization" in kwargs["headers"]
+
+
+@patch("requests.Session.get")
+def test_http_client_items_streams_the_list(mocked_get):
+    mocked_get.return_value = streamed([{"id": 1}, {"id": 2}])
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    items = client.items(Request.get("/games-played/"), chunk_size=4)
+    assert next(items) == {"id": 1}
+    assert list(items) == [{"id": 2}]
+    assert mocked_get.call_args.kwargs["stream"] is True
+
+
+@patch("requests.Session.get")
+def test_http_client_items_decodes_a_prefetched_list(mocked_get):
+    mocked_get.return_value = response([{"id": 1}, {"id": 2}])
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    client.prefetch(Request.get("/games-to-play/"))
+    assert list(client.items(Request.get("/games-to-play/"), chunk_size=4)) == [{"id": 1}, {"id": 2}]
+    assert mocked_get.call_count == 1
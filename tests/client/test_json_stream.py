@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from client.json_stream import iter_items
+
+
+def chunked(data: bytes, size: int):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+def test_iter_items_of_a_plain_array():
+    assert list(iter_items([b' [ {"id": 1} , {"id": 2} ] '])) == [{"id": 1}, {"id": 2}]
+
+
+def test_iter_items_of_a_page_fills_the_other_fields():
+    page = {"count": 2, "results": [{"id": 1}, {"id": 2}], "next": "http://localhost/game/?offset=2", "previous": None}
+    fields = {}
+
+    assert list(iter_items([json.dumps(page).encode()], fields=fields)) == page["results"]
+    assert fields == {"count": 2, "next": "http://localhost/game/?offset=2", "previous": None}
+
+
+def test_iter_items_across_every_chunk_boundary():
+    items = [{"title": "Pokémon", "rating": -1.5e3}, 12345, [1, 2], None, True, "x", 0.25]
+    data = json.dumps({"results": items}, ensure_ascii=False).encode()
+
+    for size in range(1, len(data) + 1):
+        assert list(iter_items(chunked(data, size))) == items
+
+
+def test_iter_items_yields_before_the_end_of_the_document():
+    def chunks():
+        yield b'[{"id": 1}, '
+        raise AssertionError("read past the first item")
+
+    assert next(iter_items(chunks())) == {"id": 1}
+
+
+def test_iter_items_of_empty_documents():
+    assert list(iter_items([b"[]"])) == []
+    assert list(iter_items([b"{}"])) == []
+
+
+@pytest.mark.parametrize("data", [b"", b"[1, 2", b"[1 2]", b"[1,]", b"[1.]", b"[1] x", b'{"results" []}', b'["\xc3"]'])
+def test_iter_items_rejects_malformed_documents(data):
+    with pytest.raises(ValueError):
+        list(iter_items(chunked(data, 1)))
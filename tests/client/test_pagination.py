@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from client.http_client import HttpClient
+from client.pagination import Paginator
+from tests.helpers import response, streamed
+
+
+@patch("requests.Session.get")
+def test_paginator_treats_plain_list_as_single_page(mocked_get):
+    mocked_get.return_value = response([{"id": 1}, {"id": 2}])
+    pages = Paginator(HttpClient("http://localhost:8000/api/v1"), "/game/", page_size=10)
+
+    page = pages.first()
+
+    assert page.items == [{"id": 1}, {"id": 2}]
+    assert not page.is_paginated
+    assert pages.next(page) is None
+    _, kwargs = mocked_get.call_args
+    assert kwargs["params"] == {"limit": 10, "offset": 0}
+
+
+@patch("requests.Session.get")
+def test_paginator_follows_next_and_previous_links(mocked_get):
+    first = "http://localhost:8000/api/v1/game/?limit=2&offset=2"
+    mocked_get.side_effect = [
+        response({"count": 3, "next": first, "previous": None, "results": [{"id": 1}, {"id": 2}]}),
+        response({"count": 3, "next": None, "previous": "http://localhost:8000/api/v1/game/?limit=2",
+                  "results": [{"id": 3}]}),
+        response({"count": 3, "next": first, "previous": None, "results": [{"id": 1}, {"id": 2}]}),
+    ]
+    pages = Paginator(HttpClient("http://localhost:8000/api/v1"), "/game/", page_size=2)
+
+    page = pages.first()
+    second = pages.next(page)
+    assert second.start == 3
+    assert second.items == [{"id": 3}]
+    assert mocked_get.call_args.args[0] == first
+
+    back = pages.previous(second)
+    assert back.start == 1
+    assert back.count == 3
+
+
+@patch("requests.Session.get")
+def test_paginator_iterates_items_lazily(mocked_get):
+    mocked_get.side_effect = [
+        response({"next": "http://localhost:8000/api/v1/game/?cursor=abc", "previous": None, "results": [1, 2]}),
+        response({"next": None, "previous": "http://localhost:8000/api/v1/game/", "results": [3]}),
+    ]
+    items = Paginator(HttpClient("http://localhost:8000/api/v1"), "/game/").items()
+
+    assert next(items) == 1
+    assert mocked_get.call_count == 1
+    assert list(items) == [2, 3]
+
+
+@patch("requests.Session.get")
+def test_paginator_sends_extra_params_with_the_first_page(mocked_get):
+    mocked_get.return_value = response([])
+    Paginator(HttpClient("http://localhost:8000/api/v1"), "/game/", page_size=10, params={"updated_since": "t"}).first()
+
+    _, kwargs = mocked_get.call_args
+    assert kwargs["params"] == {"updated_since": "t", "limit": 10, "offset": 0}
+
+
+@patch("requests.Session.get")
+def test_paginator_streams_items_across_pages(mocked_get):
+    mocked_get.side_effect = [
+        streamed({"count": 3, "results": [{"id": 1}, {"id": 2}], "next": "http://localhost:8000/api/v1/game/?offset=2"}),
+        streamed({"count": 3, "next": None, "results": [{"id": 3}]}),
+    ]
+    pages = Paginator(HttpClient("http://localhost:8000/api/v1"), "/game/", page_size=2, cached=True)
+
+    assert list(pages.stream()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert mocked_get.call_args_list[1].args[0] == "http://localhost:8000/api/v1/game/?offset=2"
+    assert all(call.kwargs["stream"] is True for call in mocked_get.call_args_list)
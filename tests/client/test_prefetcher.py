@@ -0,0 +1,84 @@
+import threading
+from unittest.mock import Mock, patch
+
+from client.http_client import HttpClient
+from client.prefetcher import Prefetcher
+from client.request import Request
+from tests.helpers import response
+
+
+def body(size):
+    return lambda url, **kwargs: response(text="x" * size, url=url)
+
+
+@patch("requests.Session.get")
+def test_prefetcher_warms_the_client_in_the_background(mocked_get):
+    mocked_get.side_effect = body(10)
+    client = HttpClient("http://localhost:8000/api/v1")
+    prefetcher = Prefetcher(client)
+
+    prefetcher.start(Request.get("/game/"), Request.get("/genre/", cached=True))
+    assert prefetcher.wait(5)
+
+    assert prefetcher.received == 20
+    client.get("/game/")
+    client.get("/genre/", cached=True)
+    assert mocked_get.call_count == 2
+
+
+@patch("requests.Session.get")
+def test_prefetcher_skips_fresh_responses(mocked_get):
+    mocked_get.side_effect = body(10)
+    client = HttpClient("http://localhost:8000/api/v1")
+    prefetcher = Prefetcher(client)
+
+    prefetcher.start(Request.get("/game/"))
+    prefetcher.wait(5)
+    prefetcher.start(Request.get("/game/"))
+    prefetcher.wait(5)
+
+    assert mocked_get.call_count == 1
+
+
+@patch("requests.Session.get")
+def test_prefetcher_stops_at_the_budget_and_request_bound(mocked_get):
+    mocked_get.side_effect = body(100)
+    client = HttpClient("http://localhost:8000/api/v1")
+
+    prefetcher = Prefetcher(client, budget_bytes=150)
+    prefetcher.start(*(Request.get(f"/game/{id}/") for id in range(5)))
+    prefetcher.wait(5)
+    assert mocked_get.call_count == 2
+
+    prefetcher = Prefetcher(client, max_requests=1)
+    prefetcher.start(*(Request.get(f"/genre/{id}/") for id in range(5)))
+    prefetcher.wait(5)
+    assert mocked_get.call_count == 3
+
+
+@patch("requests.Session.get")
+def test_prefetcher_can_be_cancelled(mocked_get):
+    release = threading.Event()
+
+    def slow(url, **kwargs):
+        release.wait(5)
+        return response(text="", url=url)
+    mocked_get.side_effect = slow
+    prefetcher = Prefetcher(HttpClient("http://localhost:8000/api/v1"))
+
+    prefetcher.start(Request.get("/game/"), Request.get("/genre/"), Request.get("/games-played/"))
+    prefetcher.cancel()
+    release.set()
+    prefetcher.wait(5)
+
+    assert mocked_get.call_count <= 1
+
+
+def test_prefetcher_with_no_budget_does_nothing():
+    client = Mock()
+    prefetcher = Prefetcher(client, budget_bytes=0)
+
+    prefetcher.start(Request.get("/game/"))
+
+    assert prefetcher.wait(0)
+    client.prefetch.assert_not_called()
@@ -0,0 +1,23 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+
+@pytest.fixture(autouse=True)
+def no_network():
+    # Requests that are not mocked by a test fail fast instead of reaching for a real backend
+    with patch("requests.adapters.HTTPAdapter.send", side_effect=requests.ConnectionError("network disabled in tests")):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("FIORDISPINO_CACHE_DIR", str(tmp_path / "cache"))
+
+
+
+@pytest.fixture
+def offline_email(monkeypatch):
+    # Typed addresses are checked for deliverability with a DNS lookup, which needs a network
+    monkeypatch.setattr("email_validator.CHECK_DELIVERABILITY", False)
@@ -0,0 +1,112 @@
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from batch import Batch
+from catalogue.store import CatalogueStore
+from catalogue.sync import CatalogueSync
+from client.http_client import HttpClient
+from client.pagination import Paginator
+from fake_backend.dataset import Dataset
+from fake_backend.server import FakeBackend
+
+_send = HTTPAdapter.send
+
+
+@pytest.fixture
+def backend():
+    # These tests only talk to the local server, so the real transport is put back
+    with patch.object(HTTPAdapter, "send", _send), FakeBackend(Dataset(games=120, users=3, list_size=5)) as backend:
+        yield backend
+
+
+def login(client, email="user1@gmail.com"):
+    response = client.post("/auth/login/", json={"email": email, "password": Dataset.password})
+    assert response.status_code == 200
+    return response.json()["key"]
+
+
+def test_login_and_personal_lists(backend):
+    token = None
+    client = HttpClient(backend.base_url, token=lambda: token)
+    token = login(client)
+
+    assert client.get("/user/me/", authenticated=True).json()["username"] == "user1"
+    entries = client.get("/games-to-play/", authenticated=True).json()
+    assert len(entries) == 5 and {"id", "game"} <= entries[0].keys()
+
+    response = client.post("/games-to-play/", authenticated=True, json={"game": entries[0]["game"]["id"]})
+    assert response.status_code == 400
+    assert client.get("/user/", authenticated=True).status_code == 403
+    client.close()
+
+
+def test_wrong_credentials_are_rejected(backend):
+    client = HttpClient(backend.base_url)
+
+    response = client.post("/auth/login/", json={"email": "user1@gmail.com", "password": "wrong password"})
+
+    assert response.status_code == 400
+    assert "non_field_errors" in response.json()
+    assert client.get("/games-played/", authenticated=True).status_code == 401
+    client.close()
+
+
+def test_catalogue_pages_and_etags(backend):
+    client = HttpClient(backend.base_url)
+
+    games = list(Paginator(client, "/game/", page_size=50).items())
+    first = client.get("/game/", params={"limit": 50, "offset": 0})
+    again = client.get("/game/", params={"limit": 50, "offset": 0}, headers={"If-None-Match": first.headers["ETag"]})
+
+    assert [g["id"] for g in games] == list(range(1, 121))
+    assert again.status_code == 304
+    client.close()
+
+
+def test_sync_follows_changes_with_deltas(backend, tmp_path):
+    client = HttpClient(backend.base_url)
+    store = CatalogueStore(tmp_path / "games.sqlite3")
+    sync = CatalogueSync(client, store)
+    sync.sync()
+
+    backend.dataset.delete_game(7)
+    backend.dataset.add_game("Brand New", "A brand new game.", [1], 12, "2025-05-05")
+    result = sync.sync()
+
+    assert result.incremental
+    assert [g["title"] for g in result.changed] == ["Brand New"]
+    assert result.deleted == (7,)
+    assert len(store) == 120
+    store.close()
+    client.close()
+
+
+def test_batch_runs_against_the_backend(backend, tmp_path):
+    token = HttpClient(backend.base_url).post("/auth/login/", json={
+        "email": "admin@gmail.com", "password": Dataset.password}).json()["key"]
+    games = tmp_path / "games.jsonl"
+    games.write_text(json.dumps({"title": "Imported", "description": "A game.", "genres": ["Action"],
+                                 "pegi": 7, "release_date": "2020-01-01"}) + "\n")
+    out = []
+
+    class Out:
+        def write(self, text):
+            out.append(text)
+
+    status = Batch.main(["--base-url", backend.base_url, "--token", token, "import-games", str(games),
+                         "--box-art", "placeholder_images/useful_formula.jpg"], Out())
+
+    assert status == 0
+    assert backend.dataset.games()[-1]["title"] == "Imported"
+
+
+def test_latency_is_injected():
+    with patch.object(HTTPAdapter, "send", _send), FakeBackend(Dataset(games=1), latency=0.05) as backend:
+        start = time.perf_counter()
+        requests.get(f"{backend.base_url}/genre/", timeout=5)
+        assert time.perf_counter() - start >= 0.05
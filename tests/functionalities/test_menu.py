@@ -27,4 +27,16 @@ def test_menu_selection_on_wrong_key(mocked_print, mocked_input):
 
     menu.run()
     mocked_print.assert_any_call("Invalid key, please try again")
-    mocked_input.assert_called()
\ No newline at end of file
+    mocked_input.assert_called()
+
+@patch('builtins.input', side_effect=['diag', '0'])
+@patch('builtins.print')
+def test_menu_hidden_entry_is_selectable_but_not_listed(mocked_print, mocked_input):
+    menu = (Menu.Builder(Description("A totally normal description")).
+            with_entry(Entry.create("diag", "Secret", on_selected=lambda: print("Found it"), is_hidden=True)).
+            with_entry(Entry.create("0", "Exit", is_exit=True)).
+            build())
+
+    menu.run()
+    mocked_print.assert_any_call("Found it")
+    assert all("Secret" not in str(call) for call in mocked_print.call_args_list)
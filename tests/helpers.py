@@ -0,0 +1,27 @@
+import io
+import json as jsonlib
+from typing import Any, Optional
+
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1/"
+
+
+def response(json: Any = None, status_code: int = 200, text: Optional[str] = None, url: str = BASE_URL) -> requests.Response:
+    """A real response with json, or text, as its already read body."""
+    res = requests.Response()
+    res.status_code = status_code
+    res.url = url
+    res.encoding = "utf-8"
+    res._content = (text if text is not None else jsonlib.dumps(json)).encode()
+    res._content_consumed = True
+    return res
+
+
+def streamed(json: Any, status_code: int = 200, url: str = BASE_URL) -> requests.Response:
+    """A real response with json as its body, for code reading it with iter_content()."""
+    res = requests.Response()
+    res.status_code = status_code
+    res.url = url
+    res.raw = io.BytesIO(jsonlib.dumps(json).encode())
+    return res
@@ -1,7 +1,22 @@
+from unittest.mock import patch
+
+import email_validator
 import pytest
-from email_validator import EmailNotValidError
+from email_validator import EmailNotValidError, EmailUndeliverableError
 
+import primitives.email
 from primitives.email import Email
+from utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def deliverability(monkeypatch):
+    monkeypatch.setattr(email_validator, "CHECK_DELIVERABILITY", True)
+    primitives.email._deliverability.clear()
+    with patch("email_validator.deliverability.validate_email_deliverability") as mocked:
+        mocked.return_value = {"mx": [(10, "mx.gmail.com")]}
+        yield mocked
+    primitives.email._deliverability.clear()
 
 def test_email_creation_failure_on_min_length():
     with pytest.raises(EmailNotValidError):
@@ -35,4 +50,39 @@ def test_email_creation_successful():
     Email("domenico@gmail.com")
 
 def test_email_str():
-    assert str(Email("domenico@gmail.com")) == "domenico@gmail.com"
\ No newline at end of file
+    assert str(Email("domenico@gmail.com")) == "domenico@gmail.com"
+
+def test_email_from_backend_skips_deliverability(deliverability):
+    Email("domenico@gmail.com", check_deliverability=False)
+    deliverability.assert_not_called()
+
+def test_email_from_backend_still_checks_syntax(deliverability):
+    with pytest.raises(EmailNotValidError):
+        Email("test@@example.com", check_deliverability=False)
+
+def test_email_deliverability_cached_by_domain(deliverability):
+    Email("domenico@gmail.com")
+    Email("mario@gmail.com")
+    Email("mario@GMAIL.com")
+    deliverability.assert_called_once_with("gmail.com", "gmail.com")
+
+def test_email_undeliverable_domain_cached(deliverability):
+    deliverability.side_effect = EmailUndeliverableError("The domain name nowhere.com does not exist.")
+    for email in ["a@nowhere.com", "b@nowhere.com"]:
+        with pytest.raises(EmailUndeliverableError):
+            Email(email)
+    assert deliverability.call_count == 1
+
+def test_email_unknown_deliverability_retried_sooner(deliverability, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(primitives.email, "_deliverability", TTLCache(clock=lambda: now[0]))
+    deliverability.return_value = {"unknown-deliverability": "timeout"}
+
+    Email("domenico@gmail.com")
+    now[0] = 30.0
+    Email("domenico@gmail.com")
+    assert deliverability.call_count == 1
+
+    now[0] = 61.0
+    Email("domenico@gmail.com")
+    assert deliverability.call_count == 2
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 from exceptions.primitives.game_title_exception import GameTitleException
 from primitives.game_title import GameTitle
@@ -19,4 +21,14 @@ def test_game_title_creation_successful():
     GameTitle("Call Of Duty: Black Ops III")
 
 def test_game_title_str():
-    assert str(GameTitle("Call Of Duty: Black Ops III")) == "Call Of Duty: Black Ops III"
\ No newline at end of file
+    assert str(GameTitle("Call Of Duty: Black Ops III")) == "Call Of Duty: Black Ops III"
+
+def test_game_title_is_slotted_and_frozen():
+    title = GameTitle("Call Of Duty: Black Ops III")
+    assert not hasattr(title, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        title.title = "Another title"
+
+def test_game_title_order():
+    assert GameTitle("Alpha") < GameTitle("Beta")
+    assert GameTitle("Alpha") == GameTitle("Alpha")
@@ -20,4 +20,12 @@ def test_genre_creation_successful():
     Genre("Shooter")
 
 def test_genre_str():
-    assert str(Genre("Shooter")) == "Shooter"
\ No newline at end of file
+    assert str(Genre("Shooter")) == "Shooter"
+
+def test_genre_of_returns_shared_instance():
+    assert Genre.of("Shooter") is Genre.of("Shooter")
+    assert Genre.of("Shooter") == Genre("Shooter")
+
+def test_genre_of_still_validates():
+    with pytest.raises(GenreException):
+        Genre.of("Shooter.")
@@ -25,4 +25,8 @@ def test_global_rating_creation_successful():
     GlobalRating.create(10, 00)
 
 def test_global_rating_str():
-    assert str(GlobalRating.create(10, 00)) == "10.00"
\ No newline at end of file
+    assert str(GlobalRating.create(10, 00)) == "10.00"
+
+def test_global_rating_is_slotted():
+    assert not hasattr(GlobalRating.create(7, 50), "__dict__")
+    assert GlobalRating.create(7, 50) < GlobalRating.create(8, 0)
@@ -18,4 +18,13 @@ def test_pegi_creation_successful():
 def test_pegi_str():
     valid_values = [3, 7, 12, 16, 18]
     for value in valid_values:
-        assert str(Pegi(value)) == f"PEGI {value}"
\ No newline at end of file
+        assert str(Pegi(value)) == f"PEGI {value}"
+
+def test_pegi_of_returns_shared_instance():
+    for value in [3, 7, 12, 16, 18]:
+        assert Pegi.of(value) is Pegi.of(value)
+        assert Pegi.of(value) == Pegi(value)
+
+def test_pegi_of_still_validates():
+    with pytest.raises(PegiRankingException):
+        Pegi.of(4)
@@ -20,4 +20,12 @@ def test_vote_creation_successful():
 def test_vote_str():
     valid_values = range(1, 11)
     for value in valid_values:
-        assert(str(Vote(value)) == str(value))
\ No newline at end of file
+        assert(str(Vote(value)) == str(value))
+
+def test_vote_of_returns_shared_instance():
+    assert Vote.of(7) is Vote.of(7)
+    assert Vote.of(7) == Vote(7)
+
+def test_vote_of_still_validates():
+    with pytest.raises(VoteException):
+        Vote.of(11)
@@ -1,7 +1,11 @@
+import json
+import traceback
+
 import pytest
 from valid8 import ValidationError
 
 from app import App
+from client.http_client import HttpClient
 from exceptions.primitives.game_title_exception import GameTitleException
 from main import main
 from unittest.mock import patch, Mock
@@ -12,12 +16,16 @@ from primitives.genre import Genre
 from primitives.global_rating import GlobalRating
 from primitives.pegi import Pegi
 from primitives.token import Token
+from tests.helpers import response as http_response
+from utils.metrics import Metrics
+
+pytestmark = pytest.mark.usefixtures("offline_email")
 
 
 @patch("builtins.input", side_effect=["0"])
 @patch("builtins.print")
 def test_app_main(mocked_print, mocked_input):
-    main()
+    main([])
     mocked_print.assert_any_call("*** Fiordispino App ***")
     mocked_print.assert_any_call("0:\tExit")
     mocked_print.assert_any_call("Goodbye!")
@@ -25,17 +33,14 @@ def test_app_main(mocked_print, mocked_input):
 
 @patch("builtins.input", side_effect=["1", "user@gmail.com"])
 @patch("getpass.getpass", side_effect=["string12"])
-@patch("requests.get")
-@patch("requests.post")
+@patch("requests.Session.get")
+@patch("requests.Session.post")
 @patch("builtins.print")
 def test_app_login(mocked_print, mocked_post, mocked_get, mocked_getpass, mocked_input):
-    login_response = Mock()
-    login_response.status_code = 200
-    login_response.json.return_value = {"key": "a" * 40}
+    login_response = http_response({"key": "a" * 40})
     mocked_post.return_value = login_response
 
-    me_response = Mock()
-    me_response.json.return_value = {"is_superuser": False}
+    me_response = http_response({"is_superuser": False})
     mocked_get.return_value = me_response
 
     App().run()
@@ -44,18 +49,15 @@ def test_app_login(mocked_print, mocked_post, mocked_get, mocked_getpass, mocked
 
 
 @patch("getpass.getpass", side_effect=["string12"])
-@patch("requests.get")
-@patch("requests.post")
+@patch("requests.Session.get")
+@patch("requests.Session.post")
 @patch("builtins.input", side_effect=["1", "admin@gmail.com", "4"])
 @patch("builtins.print")
 def test_app_login_as_admin(mocked_print, mocked_input, mocked_post, mocked_get, mocked_getpass):
-    response = Mock()
-    response.status_code = 200
-    response.json.return_value = {"key": "a" * 40}
+    response = http_response({"key": "a" * 40})
     mocked_post.return_value = response
 
-    response1 = Mock()
-    response1.json.return_value = {"is_superuser": True}
+    response1 = http_response({"is_superuser": True})
     mocked_get.return_value = response1
 
     App().run()
@@ -63,14 +65,37 @@ def test_app_login_as_admin(mocked_print, mocked_input, mocked_post, mocked_get,
     mocked_print.assert_any_call("\nLogged in as admin successfully!")
 
 
+@patch("getpass.getpass", side_effect=["string12"] * 3)
+@patch("requests.Session.get")
+@patch("requests.Session.post")
+@patch("builtins.input", side_effect=["1", "user@gmail.com", "12"] * 3 + ["0"])
+@patch("builtins.print")
+def test_app_login_logout_cycles_do_not_nest(mocked_print, mocked_input, mocked_post, mocked_get, mocked_getpass):
+    response = http_response({"key": "a" * 40})
+    mocked_post.return_value = response
+    mocked_get.return_value = http_response({"is_superuser": False})
+
+    depths = []
+    def record_depth(*args, **kwargs):
+        if args == ("\nLogged in successfully!",):
+            depths.append(len(traceback.extract_stack()))
+    mocked_print.side_effect = record_depth
+
+    app = App()
+    app.run()
+
+    assert len(depths) == 3
+    assert len(set(depths)) == 1
+    mocked_print.assert_any_call("Goodbye!")
+    assert len(app._App__menus) == 2
+
+
 @patch("getpass.getpass", side_effect=["string12"])
-@patch("requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input", side_effect=["1", "user@gmail.com", "0"])
 @patch("builtins.print")
 def test_app_login_failed_response(mocked_print, mocked_input, mocked_post, mocked_getpass):
-    response = Mock()
-    response.status_code = 403
-    response.text = '{"error": "Invalid credentials"}'
+    response = http_response(text='{"error": "Invalid credentials"}', status_code=403)
     mocked_post.return_value = response
 
     App().run()
@@ -95,13 +120,11 @@ def test_app_login_wrong_password_format(mocked_print, mocked_input, mocked_getp
     mocked_print.assert_any_call("The password format is not valid, please try again")
 
 @patch("getpass.getpass", side_effect=["string12", "string12"])
-@patch("requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input", side_effect=["2", "giovanni", "giovanni@gmail.com", "4"])
 @patch("builtins.print")
 def test_app_register(mocked_print, mocked_input, mocked_post, mocked_getpass):
-    response = Mock()
-    response.status_code = 200
-    response.json.return_value = {"key": "a" * 40}
+    response = http_response({"key": "a" * 40})
     mocked_post.return_value = response
 
     App().run()
@@ -109,13 +132,11 @@ def test_app_register(mocked_print, mocked_input, mocked_post, mocked_getpass):
     mocked_print.assert_any_call("\nLogged in successfully!")
 
 @patch("getpass.getpass", side_effect=["password", "password"])
-@patch("requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input", side_effect=["2", "giovanni", "giovanni@gmail.com", "0"])
 @patch("builtins.print")
 def test_app_register_failed_response(mocked_print, mocked_input, mocked_post, mocked_getpass):
-    response = Mock()
-    response.status_code = 400
-    response.text = '{"password": ["This password is too common"]}'
+    response = http_response(text='{"password": ["This password is too common"]}', status_code=400)
     mocked_post.return_value = response
 
     App().run()
@@ -148,11 +169,10 @@ def test_app_register_passwords_dont_match(mocked_print, mocked_input, mocked_ge
 
 @patch("builtins.input", side_effect=["3", "0"])
 @patch("builtins.print")
-@patch("requests.get")
+@patch("requests.Session.get")
 @patch("app.App._App__get_genre", side_effect=[Genre("MMO"), Genre("RPG")])
-def test_app_show_games(mock_get_genre, mocked_get, mocked_print, mock_input):
-    response = Mock()
-    response.json.return_value = [
+def test_app_show_games(mock_get_genre, mocked_get, mocked_print, mock_input, capsys):
+    response = http_response([
         {
             "id": 1,
             "title": "GoodGame",
@@ -162,13 +182,13 @@ def test_app_show_games(mock_get_genre, mocked_get, mocked_print, mock_input):
             "release_date": "2025-01-01",
             "global_rating": "0.0"
         }
-    ]
+    ])
 
     mocked_get.return_value = response
 
     App().run()
 
-    mocked_print.assert_any_call(
+    assert (
         "1     | "
         "GoodGame                       | "
         "A fantastic game                         | "
@@ -176,26 +196,38 @@ def test_app_show_games(mock_get_genre, mocked_get, mocked_print, mock_input):
         "PEGI 3 | "
         "2025-01-01   | "
         "No votes yet"
-    )
+    ) in capsys.readouterr().out.splitlines()
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 def test_app_get_genre(mocked_get):
-    response = Mock()
-    response.json.return_value = {"name": "Action"}
+    response = http_response([{"id": 1, "name": "Action"}, {"id": 2, "name": "RPG"}])
     mocked_get.return_value = response
 
     app = App()
     genre = app._App__get_genre(1)
     assert isinstance(genre, Genre)
+    assert str(app._App__get_genre(2)) == "RPG"
+    assert mocked_get.call_count == 1
+
+
+@patch("requests.Session.get")
+def test_app_get_genre_missing_from_map(mocked_get):
+    list_response = http_response([{"id": 1, "name": "Action"}])
+    detail_response = http_response({"name": "Puzzle"})
+    mocked_get.side_effect = [list_response, detail_response]
+
+    app = App()
+    assert str(app._App__get_genre(7)) == "Puzzle"
+    assert str(app._App__get_genre(7)) == "Puzzle"
+    assert mocked_get.call_count == 2
 
 @patch("builtins.input", side_effect=["4", "0"])
 @patch("builtins.print")
-@patch("requests.get")
+@patch("requests.Session.get")
 @patch("app.App._App__get_genre", side_effect=[Genre("MMO"), Genre("RPG")])
 def test_app_get_genres(mocked_get_genre, mocked_get, mocked_print, mocked_input):
-    response = Mock()
-    response.json.return_value = [
+    response = http_response([
       {
         "id": 1,
         "name": "MMO"
@@ -204,7 +236,7 @@ def test_app_get_genres(mocked_get_genre, mocked_get, mocked_print, mocked_input
         "id": 2,
         "name": "RPG"
       }
-    ]
+    ])
 
     mocked_get.return_value = response
 
@@ -217,13 +249,12 @@ def test_app_get_genres(mocked_get_genre, mocked_get, mocked_print, mocked_input
 
 
 @patch("builtins.print")
-@patch("requests.get")
-def test_show_games_to_play(mocked_get, mocked_print):
+@patch("requests.Session.get")
+def test_show_games_to_play(mocked_get, mocked_print, capsys):
     app = App()
     app._App__token = Token("a" * 40)
 
-    response_games_to_play = Mock()
-    response_games_to_play.json.return_value = [
+    response_games_to_play = http_response([
         {
             "id": 10,
             "game":         {
@@ -236,7 +267,7 @@ def test_show_games_to_play(mocked_get, mocked_print):
             "global_rating": "0.0"
         }
         }
-    ]
+    ])
 
 
     mocked_get.return_value = response_games_to_play
@@ -245,21 +276,20 @@ def test_show_games_to_play(mocked_get, mocked_print):
     assert ids_global == [1]
     assert ids_to_play == [10]
 
-    printed_output = "".join([str(call.args[0]) if call.args else "\n" for call in mocked_print.call_args_list])
+    printed_output = capsys.readouterr().out
 
     assert "GoodGame" in printed_output
     assert "MMO, RPG" in printed_output
     assert "A fantastic game" in printed_output
 
-@patch("app.GlobalRating.create")
-@patch("app.requests.get")
+@patch("primitives.global_rating.GlobalRating.create")
+@patch("requests.Session.get")
 @patch("app.App._App__get_genre")
 def test_get_game_success(mock_get_genre, mock_requests_get, mock_rating_create):
     mock_get_genre.return_value = Genre("Action")
     mock_rating_create.return_value = "Rated 4.50"
 
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = http_response({
         "id": 1,
         "title": "Super Game",
         "description": "Description",
@@ -267,7 +297,7 @@ def test_get_game_success(mock_get_genre, mock_requests_get, mock_rating_create)
         "pegi": 18,
         "release_date": "2023-10-10",
         "global_rating": 4.5
-    }
+    })
     mock_requests_get.return_value = mock_response
 
     app = App()
@@ -279,13 +309,36 @@ def test_get_game_success(mock_get_genre, mock_requests_get, mock_rating_create)
     assert str(result[0]) == "Super Game"
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
+def test_get_game_resolves_genres_with_one_request(mocked_get):
+    def get(url, **kwargs):
+        if url.endswith("/genre/"):
+            return http_response([{"id": 1, "name": "Action"}, {"id": 2, "name": "RPG"}])
+        return http_response({
+            "id": 1,
+            "title": "Super Game",
+            "description": "Description",
+            "genres": [1, 2],
+            "pegi": 18,
+            "release_date": "2023-10-10",
+            "global_rating": "0.0"
+        })
+    mocked_get.side_effect = get
+
+    app = App()
+    app._App__get_game(1)
+    result = app._App__get_game(1)
+
+    assert [str(g) for g in result[2]] == ["Action", "RPG"]
+    assert sum(1 for call in mocked_get.call_args_list if call.args[0].endswith("/genre/")) == 1
+
+
+@patch("requests.Session.get")
 @patch("app.App._App__get_genre")
 def test_get_game_no_votes(mock_get_genre, mock_requests_get):
     mock_get_genre.return_value = Genre("Action")
 
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = http_response({
         "id": 1,
         "title": "New Game",
         "description": "Desc",
@@ -293,7 +346,7 @@ def test_get_game_no_votes(mock_get_genre, mock_requests_get):
         "pegi": 3,
         "release_date": "2024-01-01",
         "global_rating": "0.0"  # Caso 0.0
-    }
+    })
     mock_requests_get.return_value = mock_response
 
     app = App()
@@ -302,7 +355,7 @@ def test_get_game_no_votes(mock_get_genre, mock_requests_get):
     assert result[5] == "No votes yet"
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
 @patch("app.App._App__show_games_to_play")
@@ -312,8 +365,7 @@ def test_add_game_to_games_to_play_success(mock_show_to_play, mock_show_games, m
 
     mock_input.return_value = "2"
 
-    mock_response = Mock()
-    mock_response.status_code = 201
+    mock_response = http_response(status_code=201)
     mock_post.return_value = mock_response
 
     app = App()
@@ -323,7 +375,7 @@ def test_add_game_to_games_to_play_success(mock_show_to_play, mock_show_games, m
     assert kwargs['json']['game'] == 20
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -343,7 +395,7 @@ def test_add_game_to_games_to_play_cancel(mock_show_to_play, mock_show_games, mo
     mock_post.assert_not_called()
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -355,8 +407,7 @@ def test_add_game_to_games_to_play_invalid_input_retry(mock_show_to_play, mock_s
 
     mock_input.side_effect = ["5", "1"]
 
-    mock_response = Mock()
-    mock_response.status_code = 201
+    mock_response = http_response(status_code=201)
     mock_post.return_value = mock_response
 
     app = App()
@@ -369,14 +420,13 @@ def test_add_game_to_games_to_play_invalid_input_retry(mock_show_to_play, mock_s
     assert any("Game added to games to play!" in msg for msg in printed_messages)
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 @patch("builtins.print")
-def test_show_games_to_play_no_votes(mocked_print, mocked_get):
+def test_show_games_to_play_no_votes(mocked_print, mocked_get, capsys):
     app = App()
     app._App__token = Token("a" * 40)
 
-    response_list = Mock()
-    response_list.json.return_value = [
+    response_list = http_response([
         {
             "id": 100,
             "game": {
@@ -389,26 +439,24 @@ def test_show_games_to_play_no_votes(mocked_print, mocked_get):
                 "global_rating": "0.0"
             }
         }
-    ]
+    ])
     mocked_get.return_value = response_list
 
     app._App__show_games_to_play()
 
-    printed_output = "".join([str(call.args[0]) if call.args else "" for call in mocked_print.call_args_list])
+    printed_output = capsys.readouterr().out
 
     assert "No votes yet" in printed_output
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 @patch("builtins.print")
 @patch("app.App._App__get_genre")
-def test_show_games_rating_parsing(mocked_get_genre, mocked_print, mocked_get):
+def test_show_games_rating_parsing(mocked_get_genre, mocked_print, mocked_get, capsys):
     app = App()
 
     # rating to forse else branch
-    response_mock = Mock()
-
-    response_mock.json.return_value = [
+    response_mock = http_response([
         {
             "id": 1,
             "title": "Rated Game",
@@ -418,19 +466,19 @@ def test_show_games_rating_parsing(mocked_get_genre, mocked_print, mocked_get):
             "release_date": "2023-10-10",
             "global_rating": "4.5"
         }
-    ]
+    ])
     mocked_get.return_value = response_mock
     mocked_get_genre.return_value = Genre("Action")
 
     app._App__show_games()
 
-    printed_output = "".join([str(call.args[0]) if call.args else "" for call in mocked_print.call_args_list])
+    printed_output = capsys.readouterr().out
 
     assert "4.50" in printed_output or "4.5" in printed_output
     assert "Rated Game" in printed_output
 
 @patch("builtins.open")
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input", side_effect = ["A fantastic game", "GoodGame", "1", "1", "16", "2025", "1", "10"])
 @patch("builtins.print")
 @patch("app.App._App__show_genres", side_effect=[[1]])
@@ -439,8 +487,7 @@ def test_app_add_game_successful(mock_show_genres, mock_print, mock_input, mock_
     fake_file = Mock()  # A fake file must be inserted in the post
     mock_open.return_value.__enter__.return_value = fake_file
 
-    response = Mock()
-    response.status_code = 201
+    response = http_response(status_code=201)
     mock_post.return_value = response
 
     app = App()
@@ -450,7 +497,7 @@ def test_app_add_game_successful(mock_show_genres, mock_print, mock_input, mock_
 
 
 @patch("builtins.open")
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input", side_effect = ["A fantastic game", "GoodGame", "1", "1", "16", "2025", "1", "10"])
 @patch("builtins.print")
 @patch("app.App._App__show_genres", side_effect=[[1]])
@@ -458,8 +505,7 @@ def test_app_add_game_failed_on_wrong_response_code(mocked_show_genres, mocked_p
     fake_file = Mock() # A fake file must be inserted in the post
     mocked_open.return_value.__enter__.return_value = fake_file
 
-    response = Mock()
-    response.status_code = 403
+    response = http_response(status_code=403)
     mocked_post.return_value = response
 
     app = App()
@@ -471,13 +517,12 @@ def test_app_add_game_failed_on_wrong_response_code(mocked_show_genres, mocked_p
 @patch("builtins.input", side_effect=["A fantastic game", "GoodGame", "2", "1", "1", "2", "16", "2025", "1", "10"])
 @patch("builtins.print")
 @patch("app.App._App__show_genres", side_effect=[[1, 2]])
-@patch("app.requests.post")
+@patch("requests.Session.post")
 def test_app_add_game_failed_on_genre_already_selected(mocked_post, mocked_show_genres, mocked_print, mocked_input, mocked_open):
     fake_file = Mock()
     mocked_open.return_value.__enter__.return_value = fake_file
 
-    response = Mock()
-    response.status_code = 201
+    response = http_response(status_code=201)
     mocked_post.return_value = response
 
     app = App()
@@ -492,13 +537,12 @@ def test_app_add_game_failed_on_genre_already_selected(mocked_post, mocked_show_
 @patch("builtins.input", side_effect=["A fantastic game", "GoodGame", "1", "5", "1", "16", "2025", "1", "10"])
 @patch("builtins.print")
 @patch("app.App._App__show_genres", side_effect=[[1]])
-@patch("app.requests.post")
+@patch("requests.Session.post")
 def test_app_add_game_invalid_genre_index(mocked_post, mocked_show_genres, mocked_print, mocked_input, mocked_open):
     fake_file = Mock()
     mocked_open.return_value.__enter__.return_value = fake_file
 
-    response = Mock()
-    response.status_code = 201
+    response = http_response(status_code=201)
     mocked_post.return_value = response
 
     app = App()
@@ -511,14 +555,11 @@ def test_app_add_game_invalid_genre_index(mocked_post, mocked_show_genres, mocke
 
 @patch("builtins.input")
 @patch("builtins.print")
-@patch("app.App._App__show_genres")
-@patch("app.App._App__get_genre")
-def test_add_genre_already_exists(mock_get_genre, mock_show_genres, mock_print, mock_input):
+@patch("app.App._App__genre_map")
+def test_add_genre_already_exists(mock_genre_map, mock_print, mock_input):
     app = App()
     mock_input.return_value = "RPG"
-    mock_show_genres.return_value = [1, 2]
-
-    mock_get_genre.side_effect = [Genre("Action"), Genre("RPG")]
+    mock_genre_map.return_value = {1: Genre("Action"), 2: Genre("RPG")}
 
     app._App__add_genre()
 
@@ -526,21 +567,19 @@ def test_add_genre_already_exists(mock_get_genre, mock_show_genres, mock_print,
     assert "Genre already added" in printed_messages
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input")
 @patch("builtins.print")
-@patch("app.App._App__show_genres")
-@patch("app.App._App__get_genre")
-def test_add_genre_success(mock_get_genre, mock_show_genres, mock_print, mock_input, mock_post):
+@patch("app.App._App__genre_map")
+def test_add_genre_success(mock_genre_map, mock_print, mock_input, mock_post):
     app = App()
     app._App__token = Token("a" * 40)
 
     mock_input.return_value = "Strategy"
 
-    mock_show_genres.return_value = [1]
-    mock_get_genre.return_value = Genre("Racing")
+    mock_genre_map.return_value = {1: Genre("Racing")}
 
-    mock_post.return_value = Mock(status_code=201)
+    mock_post.return_value = http_response(status_code=201)
 
     app._App__add_genre()
 
@@ -552,12 +591,11 @@ def test_add_genre_success(mock_get_genre, mock_show_genres, mock_print, mock_in
 
 @patch("builtins.print")
 @patch("builtins.input", side_effect=["1"])
-@patch("requests.delete")
+@patch("requests.Session.delete")
 @patch("app.App._App__show_games_to_play", side_effect=[([10], [1])])
 def test_remove_game_from_games_to_play_success(mocked_show_games_to_play, mocked_delete, mocked_input, mocked_print):
 
-    response = Mock()
-    response.status_code = 204
+    response = http_response(status_code=204)
     mocked_delete.return_value = response
 
     app = App()
@@ -569,12 +607,11 @@ def test_remove_game_from_games_to_play_success(mocked_show_games_to_play, mocke
 
 @patch("builtins.print")
 @patch("builtins.input", side_effect=["0"])
-@patch("requests.delete")
+@patch("requests.Session.delete")
 @patch("app.App._App__show_games_to_play", side_effect=[([10], [1])])
 def test_remove_game_from_games_to_play_cancelled(mocked_show_games_to_play, mocked_delete, mocked_input, mocked_print):
 
-    response = Mock()
-    response.status_code = 204
+    response = http_response(status_code=204)
     mocked_delete.return_value = response
 
     app = App()
@@ -585,11 +622,10 @@ def test_remove_game_from_games_to_play_cancelled(mocked_show_games_to_play, moc
 
 @patch("builtins.print")
 @patch("builtins.input", side_effect=["1"])
-@patch("requests.delete")
+@patch("requests.Session.delete")
 @patch("app.App._App__show_games_played", side_effect=[([10], [1])])
 def test_remove_game_from_games_played_success(mocked_show_games_played, mocked_delete, mocked_input, mocked_print):
-    response = Mock()
-    response.status_code = 204
+    response = http_response(status_code=204)
     mocked_delete.return_value = response
 
     app = App()
@@ -599,11 +635,10 @@ def test_remove_game_from_games_played_success(mocked_show_games_played, mocked_
 
 @patch("builtins.print")
 @patch("builtins.input", side_effect=["0"])
-@patch("requests.delete")
+@patch("requests.Session.delete")
 @patch("app.App._App__show_games_played", side_effect=[([10], [1])])
 def test_remove_game_from_games_played_cancelled(mocked_show_games_played, mocked_delete, mocked_input, mocked_print):
-    response = Mock()
-    response.status_code = 204
+    response = http_response(status_code=204)
     mocked_delete.return_value = response
 
     app = App()
@@ -613,7 +648,7 @@ def test_remove_game_from_games_played_cancelled(mocked_show_games_played, mocke
 
 @patch("builtins.print")
 @patch("builtins.input", side_effect=["1"])
-@patch("requests.post")
+@patch("requests.Session.post")
 @patch("app.App._App__show_games", return_value=[1, 2, 3])
 @patch("app.App._App__show_games_to_play", return_value=([1], [1]))
 def test_add_game_to_games_to_play_already_in_list(mocked_show_games_to_play, mocked_show_games, mocked_post, mocked_input, mocked_print):
@@ -625,16 +660,14 @@ def test_add_game_to_games_to_play_already_in_list(mocked_show_games_to_play, mo
 
 @patch("builtins.print")
 @patch("builtins.input", side_effect=["1", "5"])
-@patch("requests.delete")
-@patch("requests.post")
+@patch("requests.Session.delete")
+@patch("requests.Session.post")
 @patch("app.App._App__show_games_to_play", return_value=([10], [1]))
 def test_move_game_from_games_to_play_to_games_played_success(mocked_show_games_to_play, mocked_post, mocked_delete, mocked_input, mocked_print):
-    delete_response = Mock()
-    delete_response.status_code = 204
+    delete_response = http_response(status_code=204)
     mocked_delete.return_value = delete_response
 
-    post_response = Mock()
-    post_response.status_code = 201
+    post_response = http_response(status_code=201)
     mocked_post.return_value = post_response
 
     app = App()
@@ -653,17 +686,16 @@ def test_move_game_from_games_to_play_to_games_played_game_cancelled(mocked_show
     mocked_print.assert_any_call("Cancelled!")
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 @patch("builtins.print")
 @patch("app.App._App__get_genre")
-def test_show_games_played(mocked_get_genre, mocked_print, mocked_get):
+def test_show_games_played(mocked_get_genre, mocked_print, mocked_get, capsys):
     app = App()
     app._App__token = Token("a" * 40)
 
 
 
-    response_mock = Mock()
-    response_mock.json.return_value = [
+    response_mock = http_response([
         {
             "id": 500,
             "rating": 5,
@@ -676,7 +708,7 @@ def test_show_games_played(mocked_get_genre, mocked_print, mocked_get):
                 "release_date": "2024-05-20"
             }
         }
-    ]
+    ])
     mocked_get.return_value = response_mock
 
     mocked_get_genre.return_value = Genre("RPG")
@@ -686,7 +718,7 @@ def test_show_games_played(mocked_get_genre, mocked_print, mocked_get):
     assert ids_global == [1]
     assert ids_played == [500]
 
-    printed_output = "".join([str(call.args[0]) if call.args else "\n" for call in mocked_print.call_args_list])
+    printed_output = capsys.readouterr().out
 
     assert "Played Masterpiece" in printed_output
     assert "RPG" in printed_output
@@ -695,14 +727,11 @@ def test_show_games_played(mocked_get_genre, mocked_print, mocked_get):
 
 @patch("builtins.input")
 @patch("builtins.print")
-@patch("app.App._App__show_genres")
-@patch("app.App._App__get_genre")
-def test_add_genre_already_exists(mock_get_genre, mock_show_genres, mock_print, mock_input):
+@patch("app.App._App__genre_map")
+def test_add_genre_already_exists(mock_genre_map, mock_print, mock_input):
     app = App()
     mock_input.return_value = "RPG"
-    mock_show_genres.return_value = [1, 2]
-
-    mock_get_genre.side_effect = [Genre("Action"), Genre("RPG")]
+    mock_genre_map.return_value = {1: Genre("Action"), 2: Genre("RPG")}
 
     app._App__add_genre()
 
@@ -710,21 +739,19 @@ def test_add_genre_already_exists(mock_get_genre, mock_show_genres, mock_print,
     assert "Genre already added" in printed_messages
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.input")
 @patch("builtins.print")
-@patch("app.App._App__show_genres")
-@patch("app.App._App__get_genre")
-def test_add_genre_success(mock_get_genre, mock_show_genres, mock_print, mock_input, mock_post):
+@patch("app.App._App__genre_map")
+def test_add_genre_success(mock_genre_map, mock_print, mock_input, mock_post):
     app = App()
     app._App__token = Token("a" * 40)
 
     mock_input.return_value = "Strategy"
 
-    mock_show_genres.return_value = [1]
-    mock_get_genre.return_value = Genre("Racing")
+    mock_genre_map.return_value = {1: Genre("Racing")}
 
-    mock_post.return_value = Mock(status_code=201)
+    mock_post.return_value = http_response(status_code=201)
 
     app._App__add_genre()
 
@@ -735,7 +762,7 @@ def test_add_genre_success(mock_get_genre, mock_show_genres, mock_print, mock_in
     assert "Genre added successfully!" in printed_messages
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -790,7 +817,7 @@ def test_read_custom_exception(mock_print, mock_input):
     assert result == "valid title"
 
 
-@patch("app.requests.delete")
+@patch("requests.Session.delete")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -801,7 +828,7 @@ def test_remove_game_success(mock_show_games, mock_input, mock_print, mock_delet
     mock_show_games.return_value = [10, 20, 30]
     mock_input.return_value = "2"
 
-    mock_delete.return_value = Mock(status_code=204)
+    mock_delete.return_value = http_response(status_code=204)
 
     app._App__remove_game()
 
@@ -814,7 +841,7 @@ def test_remove_game_success(mock_show_games, mock_input, mock_print, mock_delet
     assert "Game removed successfully!" in printed_messages
 
 
-@patch("app.requests.delete")
+@patch("requests.Session.delete")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -831,7 +858,7 @@ def test_remove_game_cancel(mock_show_games, mock_input, mock_print, mock_delete
     mock_delete.assert_not_called()
 
 
-@patch("app.requests.delete")
+@patch("requests.Session.delete")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -850,7 +877,7 @@ def test_remove_game_cancel(mock_show_games, mock_input, mock_print, mock_delete
     mock_delete.assert_not_called()
 
 
-@patch("app.requests.delete")
+@patch("requests.Session.delete")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_genres")
@@ -861,7 +888,7 @@ def test_remove_genre_success(mock_show_genres, mock_input, mock_print, mock_del
     mock_show_genres.return_value = [5, 9]
     mock_input.return_value = "2"
 
-    mock_delete.return_value = Mock(status_code=204)
+    mock_delete.return_value = http_response(status_code=204)
 
     app._App__remove_genre()
 
@@ -873,7 +900,7 @@ def test_remove_genre_success(mock_show_genres, mock_input, mock_print, mock_del
     assert "Genre removed successfully!" in printed_messages
 
 
-@patch("app.requests.delete")
+@patch("requests.Session.delete")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_genres")
@@ -891,16 +918,15 @@ def test_remove_genre_cancel(mock_show_genres, mock_input, mock_print, mock_dele
     mock_delete.assert_not_called()
 
 
-@patch("app.requests.get")
-@patch("app.requests.delete")
+@patch("requests.Session.get")
+@patch("requests.Session.delete")
 @patch("builtins.print")
 @patch("builtins.input")
 def test_ban_user_success(mock_input, mock_print, mock_delete, mock_get):
     app = App()
     app._App__token = Token("a" * 40)
 
-    mock_get.return_value = Mock(status_code=200)
-    mock_get.return_value.json.return_value = [
+    mock_get.return_value = http_response([
         {
             "id": 101,
             "username": "nameuser",
@@ -911,10 +937,10 @@ def test_ban_user_success(mock_input, mock_print, mock_delete, mock_get):
             "username": "admin",
             "email": "admin@gmail.com"
         }
-    ]
+    ])
 
     mock_input.return_value = "1"
-    mock_delete.return_value = Mock(status_code=204)
+    mock_delete.return_value = http_response(status_code=204)
 
     app._App__ban_user()
 
@@ -925,16 +951,15 @@ def test_ban_user_success(mock_input, mock_print, mock_delete, mock_get):
     assert "User banned successfully!" in printed_output
 
 
-@patch("app.requests.get")
-@patch("app.requests.delete")
+@patch("requests.Session.get")
+@patch("requests.Session.delete")
 @patch("builtins.print")
 @patch("builtins.input")
 def test_ban_user_cancel(mock_input, mock_print, mock_delete, mock_get):
     app = App()
 
     # 1. Mock the user list
-    mock_get.return_value = Mock(status_code=200)
-    mock_get.return_value.json.return_value = [{"id": 101, "username": "test", "email": "test@gmail.com"}]
+    mock_get.return_value = http_response([{"id": 101, "username": "test", "email": "test@gmail.com"}])
 
     # 2. User enters "0" to cancel the operation
     mock_input.return_value = "0"
@@ -948,7 +973,7 @@ def test_ban_user_cancel(mock_input, mock_print, mock_delete, mock_get):
     mock_delete.assert_not_called()
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -965,7 +990,7 @@ def test_add_game_to_games_played_success(mock_show_played, mock_show_games, moc
     mock_input.side_effect = ["2", "5"]
 
     # 3. Mock successful POST response
-    mock_post.return_value = Mock(status_code=201)
+    mock_post.return_value = http_response(status_code=201)
 
     # Execution
     app._App__add_game_to_games_played()
@@ -980,7 +1005,7 @@ def test_add_game_to_games_played_success(mock_show_played, mock_show_games, moc
     assert "Game added to games played!" in printed_output
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -1004,7 +1029,7 @@ def test_add_game_to_games_played_already_exists(mock_show_played, mock_show_gam
     mock_post.assert_not_called()
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -1029,11 +1054,10 @@ def test_add_game_to_games_played_cancel(mock_show_played, mock_show_games, mock
 
 @patch("builtins.input", side_effect=["0"])
 @patch("builtins.print")
-@patch("requests.get")
-@patch("app.GlobalRating.create", side_effect=["7.50"])
-def test_app_show_games_to_play_with_vote(mocked_create, mocked_get, mocked_print, mock_input):
-    response = Mock()
-    response.json.return_value = [
+@patch("requests.Session.get")
+@patch("primitives.global_rating.GlobalRating.create", side_effect=["7.50"])
+def test_app_show_games_to_play_with_vote(mocked_create, mocked_get, mocked_print, mock_input, capsys):
+    response = http_response([
         {
             "id": 10,
             "game": {
@@ -1046,7 +1070,7 @@ def test_app_show_games_to_play_with_vote(mocked_create, mocked_get, mocked_prin
                 "global_rating": "7.5"
             }
         }
-    ]
+    ])
 
     mocked_get.return_value = response
 
@@ -1054,7 +1078,7 @@ def test_app_show_games_to_play_with_vote(mocked_create, mocked_get, mocked_prin
     app._App__show_games_to_play()
 
 
-    mocked_print.assert_any_call(
+    assert (
         "1     | "
         "RatedGame                      | "
         "A rated game                             | "
@@ -1062,15 +1086,14 @@ def test_app_show_games_to_play_with_vote(mocked_create, mocked_get, mocked_prin
         "PEGI 18 | "
         "2025-05-01   | "
         "7.50"
-    )
+    ) in capsys.readouterr().out.splitlines()
 
 @patch("builtins.input", side_effect=["testuser"])
 @patch("builtins.print")
-@patch("requests.get")
-@patch("app.GlobalRating.create", side_effect=["6.20"])
-def test_show_games_to_play_given_user(mocked_create, mocked_get, mocked_print, mocked_input):
-    response = Mock()
-    response.json.return_value = [
+@patch("requests.Session.get")
+@patch("primitives.global_rating.GlobalRating.create", side_effect=["6.20"])
+def test_show_games_to_play_given_user(mocked_create, mocked_get, mocked_print, mocked_input, capsys):
+    response = http_response([
         {
             "id": 50,
             "game": {
@@ -1083,7 +1106,7 @@ def test_show_games_to_play_given_user(mocked_create, mocked_get, mocked_print,
                 "global_rating": "6.2"
             }
         }
-    ]
+    ])
 
     mocked_get.return_value = response
 
@@ -1091,7 +1114,7 @@ def test_show_games_to_play_given_user(mocked_create, mocked_get, mocked_print,
     app._App__show_games_to_play_given_user()
 
     mocked_print.assert_any_call("GAMES TO PLAY BY testuser")
-    mocked_print.assert_any_call(
+    assert (
         f"{'1':<5} | "
         f"{'UserGame':<30} | "
         f"{'Game for user':<40} | "
@@ -1099,15 +1122,14 @@ def test_show_games_to_play_given_user(mocked_create, mocked_get, mocked_print,
         f"{'PEGI 16':<6} | "
         f"{'2025-03-01':<12} | "
         f"6.20"
-    )
+    ) in capsys.readouterr().out.splitlines()
 
 @patch("builtins.input", side_effect=["testuser"])
 @patch("builtins.print")
-@patch("requests.get")
-@patch("app.GlobalRating.create", side_effect=["6.20"])
-def test_show_games_to_play_given_user_no_votes(mocked_create, mocked_get, mocked_print, mocked_input):
-    response = Mock()
-    response.json.return_value = [
+@patch("requests.Session.get")
+@patch("primitives.global_rating.GlobalRating.create", side_effect=["6.20"])
+def test_show_games_to_play_given_user_no_votes(mocked_create, mocked_get, mocked_print, mocked_input, capsys):
+    response = http_response([
         {
             "id": 50,
             "game": {
@@ -1120,14 +1142,14 @@ def test_show_games_to_play_given_user_no_votes(mocked_create, mocked_get, mocke
                 "global_rating": "0.0"
             }
         }
-    ]
+    ])
 
     mocked_get.return_value = response
 
     app = App()
     app._App__show_games_to_play_given_user()
 
-    mocked_print.assert_any_call(
+    assert (
         f"{'1':<5} | "
         f"{'UserGame':<30} | "
         f"{'Game for user':<40} | "
@@ -1135,15 +1157,14 @@ def test_show_games_to_play_given_user_no_votes(mocked_create, mocked_get, mocke
         f"{'PEGI 16':<6} | "
         f"{'2025-03-01':<12} | "
         "No votes yet"
-    )
+    ) in capsys.readouterr().out.splitlines()
 
 @patch("builtins.input", side_effect=["testuser"])
 @patch("builtins.print")
-@patch("requests.get")
-@patch("app.GlobalRating.create", side_effect=["6.20"])
+@patch("requests.Session.get")
+@patch("primitives.global_rating.GlobalRating.create", side_effect=["6.20"])
 def test_show_games_to_play_given_user_no_games_for_user(mocked_create, mocked_get, mocked_print, mocked_input):
-    response = Mock()
-    response.json.return_value = []
+    response = http_response([])
 
     mocked_get.return_value = response
 
@@ -1155,10 +1176,9 @@ def test_show_games_to_play_given_user_no_games_for_user(mocked_create, mocked_g
 
 @patch("builtins.input", side_effect=["testuser"])
 @patch("builtins.print")
-@patch("requests.get")
-def test_show_games_played_given_user(mocked_get, mocked_print, mocked_input):
-    response = Mock()
-    response.json.return_value = [
+@patch("requests.Session.get")
+def test_show_games_played_given_user(mocked_get, mocked_print, mocked_input, capsys):
+    response = http_response([
         {
             "id": 50,
             "game": {
@@ -1171,7 +1191,7 @@ def test_show_games_played_given_user(mocked_get, mocked_print, mocked_input):
             },
             "rating": 6
         }
-    ]
+    ])
 
     mocked_get.return_value = response
 
@@ -1183,7 +1203,7 @@ def test_show_games_played_given_user(mocked_get, mocked_print, mocked_input):
     mocked_print.assert_any_call("GAMES PLAYED BY testuser")
 
     # Controlla riga del gioco (spazi coerenti con il codice)
-    mocked_print.assert_any_call(
+    assert (
         f"{'1':<5} | "
         f"{'UserGame':<30} | "
         f"{'Game for user':<40} | "
@@ -1191,15 +1211,14 @@ def test_show_games_played_given_user(mocked_get, mocked_print, mocked_input):
         f"{'PEGI 16':<6} | "
         f"{'2025-03-01':<12} | "
         f"6"
-    )
+    ) in capsys.readouterr().out.splitlines()
 
 
 @patch("builtins.input", side_effect=["testuser"])
 @patch("builtins.print")
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_show_games_played_given_user_no_games_for_user(mocked_get, mocked_print, mocked_input):
-    response = Mock()
-    response.json.return_value = []
+    response = http_response([])
     mocked_get.return_value = response
 
     app = App()
@@ -1208,9 +1227,9 @@ def test_show_games_played_given_user_no_games_for_user(mocked_get, mocked_print
     mocked_print.assert_any_call("No games for user testuser")
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 @patch("builtins.print")
-def test_show_games_handles_invalid_primitive_data_and_continues(mocked_print, mocked_get):
+def test_show_games_handles_invalid_primitive_data_and_continues(mocked_print, mocked_get, capsys):
     """
     Test that __show_games handles invalid primitive data (e.g., wrong PEGI)
     without crashing, printing an error message instead.
@@ -1218,9 +1237,7 @@ def test_show_games_handles_invalid_primitive_data_and_continues(mocked_print, m
     app = App()
 
     # Mocking response: 1st is valid, 2nd has invalid PEGI (99), 3rd is valid
-    response_mock = Mock()
-    response_mock.status_code = 200
-    response_mock.json.return_value = [
+    response_mock = http_response([
         {
             "id": 1,
             "title": "Valid Game 1",
@@ -1248,7 +1265,7 @@ def test_show_games_handles_invalid_primitive_data_and_continues(mocked_print, m
             "release_date": "2023-05-05",
             "global_rating": 9.0
         }
-    ]
+    ])
     mocked_get.return_value = response_mock
 
     # Execution
@@ -1260,24 +1277,22 @@ def test_show_games_handles_invalid_primitive_data_and_continues(mocked_print, m
     assert 2 not in ids
 
     # Check for the printed error message in the logs
-    printed_messages = [str(call.args[0]) for call in mocked_print.call_args_list if call.args]
+    printed_messages = capsys.readouterr().out.splitlines()
     assert any("ERROR: Game ID 2 has invalid data" in msg for msg in printed_messages)
     assert any("Valid Game 1" in msg for msg in printed_messages)
     assert any("Valid Game 2" in msg for msg in printed_messages)
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 @patch("builtins.print")
-def test_show_games_handles_invalid_genre_structure_and_continues(mocked_print, mocked_get):
+def test_show_games_handles_invalid_genre_structure_and_continues(mocked_print, mocked_get, capsys):
     """
     Test that __show_games handles a genre that is not a dictionary
     without crashing (checks the isinstance(g, dict) logic).
     """
     app = App()
 
-    response_mock = Mock()
-    response_mock.status_code = 200
-    response_mock.json.return_value = [
+    response_mock = http_response([
         {
             "id": 1,
             "title": "Broken Genre Game",
@@ -1296,7 +1311,7 @@ def test_show_games_handles_invalid_genre_structure_and_continues(mocked_print,
             "release_date": "2023-01-01",
             "global_rating": "0.0"
         }
-    ]
+    ])
     mocked_get.return_value = response_mock
 
     # Execution
@@ -1307,11 +1322,11 @@ def test_show_games_handles_invalid_genre_structure_and_continues(mocked_print,
     # but the key is that it MUST NOT crash and should process Game ID 2.
     assert 2 in ids
 
-    printed_messages = [str(call.args[0]) for call in mocked_print.call_args_list if call.args]
+    printed_messages = capsys.readouterr().out.splitlines()
     assert any("Valid Game After" in msg for msg in printed_messages)
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 @patch("app.App._App__get_genre")
 def test_get_game_genres_as_dicts(mock_get_genre, mock_requests_get):
     """
@@ -1325,8 +1340,7 @@ def test_get_game_genres_as_dicts(mock_get_genre, mock_requests_get):
     mock_get_genre.return_value = Genre("RPG")
 
     # Simuliamo una risposta dove 'genres' è una lista di dizionari
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = http_response({
         "id": 1,
         "title": "Nested Genre Game",
         "description": "A game where genres are objects",
@@ -1334,7 +1348,7 @@ def test_get_game_genres_as_dicts(mock_get_genre, mock_requests_get):
         "pegi": 12,
         "release_date": "2024-12-18",
         "global_rating": "8.5"
-    }
+    })
     mock_requests_get.return_value = mock_response
 
     # Esecuzione del metodo privato
@@ -1349,7 +1363,7 @@ def test_get_game_genres_as_dicts(mock_get_genre, mock_requests_get):
     assert str(result[2][0]) == "RPG"
 
 
-@patch("app.requests.get")
+@patch("requests.Session.get")
 @patch("app.App._App__get_genre")
 def test_get_game_rating_parsing_error(mock_get_genre, mock_requests_get):
     """
@@ -1361,8 +1375,7 @@ def test_get_game_rating_parsing_error(mock_get_genre, mock_requests_get):
 
     # Mocking a response where global_rating is a malformed string
     # "10.abc" will cause a ValueError when trying to convert int("abc")
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = http_response({
         "id": 1,
         "title": "Malformed Rating Game",
         "description": "A game with a rating that cannot be parsed",
@@ -1370,7 +1383,7 @@ def test_get_game_rating_parsing_error(mock_get_genre, mock_requests_get):
         "pegi": 12,
         "release_date": "2024-12-18",
         "global_rating": "10.abc"
-    }
+    })
     mock_requests_get.return_value = mock_response
     mock_get_genre.return_value = Genre("Action")
 
@@ -1382,7 +1395,7 @@ def test_get_game_rating_parsing_error(mock_get_genre, mock_requests_get):
     assert result[5] == "Rating Error"
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -1399,7 +1412,7 @@ def test_add_game_to_games_played_failed(mock_show_played, mock_show_games, mock
     mock_input.side_effect = ["2", "5"]
 
     # 3. Mock successful POST response
-    mock_post.return_value = Mock(status_code=400)
+    mock_post.return_value = http_response(status_code=400)
 
     # Execution
     app._App__add_game_to_games_played()
@@ -1414,7 +1427,7 @@ def test_add_game_to_games_played_failed(mock_show_played, mock_show_games, mock
     assert "Impossible to add this game to games played" in printed_output
 
 
-@patch("app.requests.post")
+@patch("requests.Session.post")
 @patch("builtins.print")
 @patch("builtins.input")
 @patch("app.App._App__show_games")
@@ -1426,7 +1439,7 @@ def test_add_game_to_games_to_play_failed(mock_show_to_play, mock_show_games, mo
     mock_show_to_play.return_value = ([], [])
 
     mock_input.side_effect = ["1"]
-    mock_post.return_value = Mock(status_code=400)
+    mock_post.return_value = http_response(status_code=400)
 
     app._App__add_game_to_games_to_play()
 
@@ -1435,4 +1448,221 @@ def test_add_game_to_games_to_play_failed(mock_show_to_play, mock_show_games, mo
     assert "rating" not in kwargs['json']
 
     printed_output = "".join([str(call.args[0]) for call in mock_print.call_args_list if call.args])
-    assert "Impossible to add this game to games to play" in printed_output
\ No newline at end of file
+    assert "Impossible to add this game to games to play" in printed_output
+
+@patch("requests.Session.get")
+@patch("builtins.print")
+@patch("builtins.input", side_effect=["0"])
+def test_add_game_to_games_to_play_fetches_lists_once(mocked_input, mocked_print, mocked_get):
+    def get(url, **kwargs):
+        response = http_response([])
+        return response
+    mocked_get.side_effect = get
+
+    app = App()
+    app._App__add_game_to_games_to_play()
+
+    urls = sorted(call.args[0] for call in mocked_get.call_args_list)
+    assert urls == ["http://localhost:8000/api/v1/game/", "http://localhost:8000/api/v1/games-to-play/"]
+
+
+@patch("builtins.input", side_effect=["n", "0"])
+@patch("builtins.print")
+@patch("requests.Session.get")
+def test_show_games_pages_through_paginated_catalogue(mocked_get, mocked_print, mocked_input, capsys):
+    def game(id):
+        return {"id": id, "title": f"Game {id}", "description": "Desc", "genres": [{"name": "RPG"}],
+                "pegi": 3, "release_date": "2025-01-01", "global_rating": "0.0"}
+
+    first_page = http_response({"count": 3, "next": "http://localhost:8000/api/v1/game/?limit=2&offset=2",
+                                    "previous": None, "results": [game(1), game(2)]})
+    second_page = http_response({"count": 3, "next": None,
+                                     "previous": "http://localhost:8000/api/v1/game/?limit=2",
+                                     "results": [game(3)]})
+    mocked_get.side_effect = [first_page, second_page]
+
+    ids = App()._App__show_games()
+
+    assert ids == [1, 2, 3]
+    printed_messages = [str(call.args[0]) for call in mocked_print.call_args_list if call.args]
+    assert "Rows 1-2 of 3" in printed_messages
+    assert "Rows 3-3 of 3" in printed_messages
+    assert any(line.startswith("3     | Game 3") for line in capsys.readouterr().out.splitlines())
+
+
+def search_catalogue():
+    return [
+        {"id": 1, "title": "Zelda", "description": "A fantastic game", "genres": [{"name": "Adventure"}],
+         "pegi": 7, "release_date": "2017-03-03", "global_rating": "9.5"},
+        {"id": 2, "title": "Doom", "description": "A loud game", "genres": [{"name": "Shooter"}],
+         "pegi": 18, "release_date": "1993-12-10", "global_rating": "0.0"},
+    ]
+
+
+@patch("builtins.input", side_effect=["zelda", "genre:shooter pegi>=16", "mario"])
+@patch("requests.Session.get")
+def test_app_search_games_fetches_catalogue_once(mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response(search_catalogue())
+
+    app = App()
+    app._App__search_games()
+    first = capsys.readouterr().out
+    app._App__search_games()
+    second = capsys.readouterr().out
+    app._App__search_games()
+
+    assert "Zelda" in first and "Doom" not in first
+    assert "Doom" in second and "Zelda" not in second
+    assert "No games found" in capsys.readouterr().out
+    assert mocked_get.call_count == 1
+
+
+@patch("builtins.input", side_effect=["zelda"])
+@patch("requests.Session.get")
+@patch("requests.Session.delete")
+def test_app_search_index_follows_removed_games(mocked_delete, mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response(search_catalogue())
+
+    app = App()
+    app._App__catalogue_index()
+    with patch("app.App._App__show_games", return_value=[1, 2]), patch("builtins.input", side_effect=["1"]):
+        app._App__remove_game()
+    capsys.readouterr()
+    app._App__search_games()
+
+    assert "No games found" in capsys.readouterr().out
+
+
+@patch("builtins.input", side_effect=["zleda", "0", "dom", "1"])
+@patch("requests.Session.get")
+@patch("requests.Session.delete")
+def test_app_remove_game_by_title(mocked_delete, mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response(search_catalogue())
+    mocked_delete.return_value = http_response(status_code=204)
+
+    app = App()
+    with patch("app.App._App__show_games", return_value=[1, 2]):
+        app._App__remove_game()
+
+    assert "Zelda" in capsys.readouterr().out
+    assert "/game/2/" in mocked_delete.call_args.args[0]
+
+
+@patch("builtins.input", side_effect=["tetris", "0"])
+@patch("requests.Session.get")
+@patch("requests.Session.post")
+def test_app_add_game_to_games_to_play_by_title_not_found(mocked_post, mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response(search_catalogue())
+
+    app = App()
+    with patch("app.App._App__show_games", return_value=[1, 2]), \
+            patch("app.App._App__show_games_to_play", return_value=([], [])):
+        app._App__add_game_to_games_to_play()
+
+    out = capsys.readouterr().out
+    assert "No games found" in out and "Cancelled!" in out
+    mocked_post.assert_not_called()
+
+
+@patch("builtins.input", side_effect=["1", "2"])
+@patch("requests.Session.post")
+def test_app_select_game_asks_again_for_a_row_with_invalid_data(mocked_post, mocked_input, capsys):
+    mocked_post.return_value = http_response(status_code=201)
+
+    app = App()
+    with patch("app.App._App__show_games", return_value=[None, 2]), \
+            patch("app.App._App__show_games_to_play", return_value=([], [])):
+        app._App__add_game_to_games_to_play()
+
+    out = capsys.readouterr().out
+    assert "invalid data" in out and "Cancelled!" not in out
+    assert mocked_post.call_args.kwargs["json"] == {"game": 2}
+
+
+@patch("builtins.input", side_effect=["doom", "doom"])
+@patch("requests.Session.get")
+def test_app_search_index_is_refreshed_with_catalogue_changes(mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response(search_catalogue())
+    app = App()
+    app._App__search_games()
+    capsys.readouterr()
+
+    mocked_get.return_value = http_response(search_catalogue()[:1])
+    app._App__synced_at -= 3600
+    app._App__search_games()
+
+    assert "No games found" in capsys.readouterr().out
+    assert mocked_get.call_count == 2
+
+
+@patch("builtins.input", side_effect=["diag", "trace.jsonl", "0"])
+def test_app_diagnostics_shows_timings_and_exports_trace(mocked_input, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    metrics = Metrics()
+    metrics.record("http", "GET /game/", 0.25, status=200)
+    app = App(HttpClient("http://localhost:8000/api/v1", metrics=metrics))
+
+    app.run()
+
+    out = capsys.readouterr().out
+    assert "Diagnostics" not in out.split("GET /game/")[0]
+    assert "250.0" in out
+    assert "events written to trace.jsonl" in out
+    assert (tmp_path / "trace.jsonl").read_text().count("\n") >= 1
+
+
+@patch("builtins.input", side_effect=["3", "0"])
+@patch("requests.Session.get")
+def test_app_streams_game_lists_as_ndjson(mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response([{"id": 1, "title": "GoodGame", "description": "A fantastic game",
+                                                  "genres": [{"name": "MMO"}], "pegi": 3,
+                                                  "release_date": "2025-01-01", "global_rating": "0.0"}])
+
+    App(output_format="ndjson").run()
+
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    assert rows == [{"index": 1, "title": "GoodGame", "description": "A fantastic game", "genre": "MMO",
+                     "pegi": "PEGI 3", "release_date": "2025-01-01", "vote": "No votes yet"}]
+
+
+def test_app_rejects_unknown_output_formats():
+    with pytest.raises(ValidationError):
+        App(output_format="xml")
+
+
+
+def user_game(id, title, **fields):
+    return {"id": id + 49, "rating": 6, "game": {"id": id, "title": title, "description": "Game for user",
+                                                 "genres": [{"name": "MMO"}], "pegi": 16,
+                                                 "release_date": "2025-03-01", "global_rating": "0.0", **fields}}
+
+
+@patch("builtins.input", side_effect=["testuser", "testuser"])
+@patch("requests.Session.get")
+def test_app_keeps_headings_off_an_ndjson_stdout(mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response([user_game(1, "UserGame")])
+    app = App(output_format="ndjson")
+    app._App__token = Token("a" * 40)
+
+    app._App__show_games_played_given_user()
+    app._App__show_games_to_play_given_user()
+
+    captured = capsys.readouterr()
+    assert [json.loads(line)["title"] for line in captured.out.splitlines()] == ["UserGame", "UserGame"]
+    assert "GAMES PLAYED BY testuser" in captured.err and "GAMES TO PLAY BY testuser" in captured.err
+
+
+@patch("builtins.input", side_effect=["testuser", "0"])
+@patch("requests.Session.get")
+def test_app_reports_the_rows_shown_on_stderr_in_machine_formats(mocked_get, mocked_input, capsys):
+    mocked_get.return_value = http_response({
+        "count": 2, "next": "http://localhost:8000/api/v1/games-played/owner/testuser/?limit=1&offset=1",
+        "previous": None, "results": [user_game(1, "UserGame")]})
+    app = App(output_format="csv")
+    app._App__token = Token("a" * 40)
+
+    app._App__show_games_played_given_user()
+
+    captured = capsys.readouterr()
+    assert "Rows 1-1 of 2" in captured.err
+    assert "Rows" not in captured.out
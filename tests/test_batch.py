@@ -0,0 +1,336 @@
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from batch import Batch
+from main import main
+from tests.helpers import response, streamed
+
+pytestmark = pytest.mark.usefixtures("offline_email")
+
+TOKEN = "a" * 40
+
+
+def entry(entry_id, game_id):
+    return {"id": entry_id, "game": {"id": game_id}}
+
+
+@pytest.fixture(autouse=True)
+def token(monkeypatch):
+    monkeypatch.setenv("FIORDISPINO_TOKEN", TOKEN)
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_add_to_play_posts_every_id(mocked_get, mocked_post):
+    mocked_get.return_value = response(json=[entry(10, 5)])
+    mocked_post.return_value = response(status_code=201)
+    out = io.StringIO()
+
+    assert Batch.main(["add-to-play", "--ids", "1,5,9,1"], out) == 0
+
+    posted = sorted(kwargs["json"]["game"] for _, kwargs in mocked_post.call_args_list)
+    assert posted == [1, 9]
+    assert mocked_get.call_count == 1
+    assert mocked_post.call_args.kwargs["headers"]["Authorization"] == f"Token {TOKEN}"
+    assert out.getvalue().splitlines() == ["SKIPPED add-to-play 5: already in list", "OK add-to-play 1", "OK add-to-play 9"]
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_add_played_sends_vote(mocked_get, mocked_post):
+    mocked_get.return_value = response(json=[])
+    mocked_post.return_value = response(status_code=201)
+
+    assert Batch.main(["add-played", "--ids", "3", "--vote", "8"], io.StringIO()) == 0
+
+    assert mocked_post.call_args.kwargs["json"] == {"game": 3, "rating": 8}
+
+
+@patch("requests.Session.post")
+def test_batch_rejects_invalid_vote_before_sending(mocked_post, capsys):
+    with pytest.raises(SystemExit):
+        Batch.main(["add-played", "--ids", "3", "--vote", "11"])
+
+    assert "Invalid vote" in capsys.readouterr().err
+    mocked_post.assert_not_called()
+
+
+@pytest.mark.parametrize("concurrency", ["0", "-3", "many"])
+def test_batch_rejects_a_concurrency_below_one(concurrency, capsys):
+    with pytest.raises(SystemExit) as exit:
+        Batch.main(["--concurrency", concurrency, "add-to-play", "--ids", "1"])
+
+    assert exit.value.code == 2
+    assert "expected a positive number of requests" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("ids", ["0", "a,b", ",", "1,-2"])
+def test_batch_rejects_invalid_ids(ids):
+    with pytest.raises(SystemExit):
+        Batch.parser().parse_args(["add-to-play", "--ids", ids])
+
+
+@patch("requests.Session.delete")
+@patch("requests.Session.get")
+def test_batch_remove_to_play_deletes_list_entries(mocked_get, mocked_delete):
+    mocked_get.return_value = response(json=[entry(10, 5), entry(11, 6)])
+    mocked_delete.return_value = response(status_code=204)
+    out = io.StringIO()
+
+    assert Batch.main(["remove-to-play", "--ids", "5,7"], out) == 1
+
+    mocked_delete.assert_called_once()
+    assert mocked_delete.call_args.args[0].endswith("/games-to-play/10/")
+    assert "FAILED remove-to-play 7: not in list" in out.getvalue()
+
+
+@patch("requests.Session.delete")
+def test_batch_ban_reports_failures(mocked_delete):
+    mocked_delete.side_effect = lambda url, **kwargs: response(status_code=404 if url.endswith("/2/") else 204)
+    out = io.StringIO()
+
+    assert Batch.main(["ban", "--ids", "1,2,3"], out) == 1
+
+    assert out.getvalue().splitlines() == ["OK ban 1", "FAILED ban 2: HTTP 404", "OK ban 3"]
+
+
+@patch("requests.Session.delete")
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_runs_command_file(mocked_get, mocked_post, mocked_delete, tmp_path):
+    mocked_get.return_value = response(json=[])
+    mocked_post.return_value = response(status_code=201)
+    mocked_delete.return_value = response(status_code=204)
+    commands = tmp_path / "commands.txt"
+    commands.write_text("# seed the backlog\nadd-to-play --ids 1,2\n\nban --ids 4\n")
+    out = io.StringIO()
+
+    assert Batch.main(["run", str(commands)], out) == 0
+
+    assert mocked_post.call_count == 2
+    assert mocked_delete.call_count == 1
+
+
+@patch("requests.Session.post")
+def test_batch_command_file_is_validated_up_front(mocked_post, tmp_path, capsys):
+    commands = tmp_path / "commands.txt"
+    commands.write_text("ban --ids 4\nadd-played --ids 1 --vote 0\n")
+
+    assert Batch.main(["run", str(commands)]) == 2
+
+    assert "line 2" in capsys.readouterr().err
+    mocked_post.assert_not_called()
+
+
+@patch("requests.Session.get")
+def test_batch_command_file_lines_choose_their_format(mocked_get, tmp_path):
+    mocked_get.side_effect = lambda url, **kwargs: streamed([game(1)])
+    commands = tmp_path / "commands.txt"
+    commands.write_text("list-games --format csv\nlist-games\n")
+    out = io.StringIO()
+
+    assert Batch.main(["--format", "ndjson", "run", str(commands)], out) == 0
+
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "id,title,description,genres,pegi,release_date,global_rating"
+    assert json.loads(lines[2])["title"] == "Zelda"
+
+
+def test_batch_command_file_lines_cannot_change_the_session(tmp_path, capsys):
+    commands = tmp_path / "commands.txt"
+    commands.write_text("ban --ids 4\n--base-url http://elsewhere --concurrency 2 ban --ids 5\n")
+
+    assert Batch.main(["run", str(commands)]) == 2
+
+    assert "line 2: --base-url, --concurrency can only be given before run" in capsys.readouterr().err
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_reads_commands_from_stdin(mocked_get, mocked_post, monkeypatch):
+    mocked_get.return_value = response(json=[])
+    mocked_post.return_value = response(status_code=201)
+    monkeypatch.setattr("sys.stdin", io.StringIO("add-to-play --ids 1\nadd-to-play --ids 2\n"))
+
+    assert Batch.main(["run", "-"], io.StringIO()) == 0
+
+    assert mocked_post.call_count == 2
+
+
+@patch("requests.Session.get")
+@patch("requests.Session.post")
+def test_batch_logs_in_with_email(mocked_post, mocked_get, monkeypatch):
+    monkeypatch.delenv("FIORDISPINO_TOKEN")
+    monkeypatch.setenv("FIORDISPINO_PASSWORD", "string12")
+    mocked_post.side_effect = [response({"key": "b" * 40}), response(status_code=201)]
+    mocked_get.return_value = response(json=[])
+
+    assert Batch.main(["--email", "user@gmail.com", "add-to-play", "--ids", "1"], io.StringIO()) == 0
+
+    assert mocked_post.call_args_list[0].kwargs["json"] == {"email": "user@gmail.com", "password": "string12"}
+    assert mocked_post.call_args_list[1].kwargs["headers"]["Authorization"] == f"Token {'b' * 40}"
+
+
+def test_batch_needs_credentials(monkeypatch, capsys):
+    monkeypatch.delenv("FIORDISPINO_TOKEN")
+
+    assert Batch.main(["ban", "--ids", "1"]) == 2
+    assert "no credentials" in capsys.readouterr().err
+
+
+@patch("batch.Batch.main", return_value=0)
+def test_main_dispatches_arguments_to_batch(mocked_batch):
+    assert main(["ban", "--ids", "1"]) == 0
+    mocked_batch.assert_called_once_with(["ban", "--ids", "1"])
+
+
+GENRES = [{"id": 1, "name": "Shooter"}, {"id": 2, "name": "Role Playing"}]
+
+
+@pytest.fixture
+def box_art(tmp_path):
+    path = tmp_path / "box_art.jpg"
+    path.write_bytes(b"\xff\xd8image")
+    return path
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_import_games_from_csv(mocked_get, mocked_post, tmp_path, box_art, capsys):
+    mocked_get.return_value = response(json=GENRES)
+    mocked_post.return_value = response(status_code=201)
+    games = tmp_path / "games.csv"
+    games.write_text("title,description,genres,pegi,release_date\n"
+                     "Doom,A fantastic game,Shooter,18,1993-12-10\n"
+                     "Zelda,Another fantastic game,Role Playing;Shooter,7,2017-03-03\n")
+    out = io.StringIO()
+
+    with patch("builtins.open", wraps=open) as mocked_open:
+        assert Batch.main(["import-games", str(games), "--box-art", str(box_art)], out) == 0
+    assert [c.args[0] for c in mocked_open.call_args_list].count(str(box_art)) == 1
+
+    assert mocked_get.call_count == 1
+    forms = sorted((kwargs["data"] for _, kwargs in mocked_post.call_args_list), key=lambda d: d[1][1])
+    assert forms[0] == [("description", "A fantastic game"), ("title", "Doom"), ("pegi", "18"),
+                        ("release_date", "1993-12-10"), ("genres", "1")]
+    assert forms[1][-2:] == [("genres", "2"), ("genres", "1")]
+    assert all(kwargs["files"]["box_art"] == ("box_art.jpg", b"\xff\xd8image") for _, kwargs in mocked_post.call_args_list)
+    assert out.getvalue().splitlines() == ["OK import-games 2", "OK import-games 3"]
+    assert "2/2 games" in capsys.readouterr().err
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_import_games_from_jsonl(mocked_get, mocked_post, tmp_path, box_art):
+    mocked_get.return_value = response(json=GENRES)
+    mocked_post.return_value = response(status_code=201)
+    games = tmp_path / "games.jsonl"
+    games.write_text("\n".join(json.dumps({"title": f"Game {i}", "description": "A fantastic game", "genres": ["Shooter"],
+                                           "pegi": 16, "release_date": "2020-01-01"}) for i in range(20)))
+
+    assert Batch.main(["--concurrency", "4", "import-games", str(games), "--box-art", str(box_art)], io.StringIO()) == 0
+
+    assert mocked_post.call_count == 20
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_import_games_validates_every_row_first(mocked_get, mocked_post, tmp_path, box_art, capsys):
+    mocked_get.return_value = response(json=GENRES)
+    games = tmp_path / "games.jsonl"
+    games.write_text("\n".join([
+        json.dumps({"title": "Doom", "description": "A fantastic game", "genres": ["Shooter"], "pegi": 18, "release_date": "1993-12-10"}),
+        json.dumps({"title": "Doom!", "description": "A fantastic game", "genres": ["Shooter"], "pegi": 18, "release_date": "1993-12-10"}),
+        json.dumps({"title": "Doom", "description": "A fantastic game", "genres": ["Racing"], "pegi": 18, "release_date": "1993-12-10"}),
+        json.dumps({"title": "Doom", "description": "A fantastic game", "genres": ["Shooter"], "pegi": 4, "release_date": "1993-12-10"}),
+    ]))
+
+    assert Batch.main(["import-games", str(games), "--box-art", str(box_art)]) == 2
+
+    err = capsys.readouterr().err
+    assert "line 1" not in err
+    assert "line 2" in err and "line 3: unknown genres Racing" in err and "line 4" in err
+    mocked_post.assert_not_called()
+
+
+@patch("requests.Session.post")
+@patch("requests.Session.get")
+def test_batch_import_games_reports_malformed_json_lines(mocked_get, mocked_post, tmp_path, box_art, capsys):
+    mocked_get.return_value = response(json=GENRES)
+    games = tmp_path / "games.jsonl"
+    games.write_text("\n".join([
+        '{"title": "Doom", "description": "A fantastic game", "genres": ["Shooter"], "pegi": 18,',
+        '["Doom"]',
+        json.dumps({"title": "Doom", "description": "A fantastic game", "genres": ["Shooter"], "pegi": 18,
+                    "release_date": "1993-12-10"}),
+    ]))
+
+    assert Batch.main(["import-games", str(games), "--box-art", str(box_art)]) == 2
+
+    err = capsys.readouterr().err
+    assert f"{games}, line 1: invalid JSON" in err and f"{games}, line 2: expected a JSON object" in err
+    assert "line 3" not in err
+    mocked_post.assert_not_called()
+
+
+def game(id, title="Zelda"):
+    return {"id": id, "title": title, "description": "An adventure", "genres": [{"name": "Adventure"}],
+            "pegi": 12, "release_date": "2017-03-03", "global_rating": "9.50"}
+
+
+@patch("requests.Session.get")
+def test_batch_list_games_streams_ndjson_page_by_page(mocked_get, monkeypatch):
+    monkeypatch.delenv("FIORDISPINO_TOKEN")
+    mocked_get.side_effect = [
+        streamed({"count": 2, "results": [game(1)], "next": "http://localhost:8000/api/v1/game/?offset=1",
+                  "previous": None}),
+        streamed({"count": 2, "results": [game(2, "Metroid")], "next": None, "previous": None}),
+    ]
+    out = io.StringIO()
+
+    assert Batch.main(["--format", "ndjson", "list-games"], out) == 0
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["title"] for line in lines] == ["Zelda", "Metroid"]
+    assert mocked_get.call_args_list[0].kwargs["stream"] is True
+    assert lines[0] == {"id": 1, "title": "Zelda", "description": "An adventure", "genres": ["Adventure"],
+                        "pegi": 12, "release_date": "2017-03-03", "global_rating": "9.50"}
+
+
+@patch("requests.Session.get")
+def test_batch_list_reports_invalid_rows_on_stderr(mocked_get, capsys):
+    mocked_get.return_value = streamed([{"id": 3, "game": game(1), "rating": 4},
+                                        {"id": 4, "game": game(2, ""), "rating": 5}])
+    out = io.StringIO()
+
+    assert Batch.main(["--format", "csv", "list-played", "--owner", "mario"], out) == 1
+
+    assert out.getvalue().splitlines() == ["id,title,description,genres,pegi,release_date,vote",
+                                           "1,Zelda,An adventure,Adventure,PEGI 12,2017-03-03,4"]
+    assert capsys.readouterr().err.startswith("FAILED list-played 4: ")
+    assert mocked_get.call_args.args[0].endswith("/games-played/owner/mario/")
+
+
+@patch("app.App.run")
+def test_main_opens_the_menus_with_the_format(mocked_run):
+    with patch("app.App.__init__", return_value=None) as mocked_init:
+        main(["--format", "csv"])
+
+    mocked_init.assert_called_once_with(output_format="csv")
+    mocked_run.assert_called_once()
+
+
+@patch("requests.Session.get")
+def test_main_passes_a_format_after_the_command_to_batch(mocked_get, monkeypatch):
+    monkeypatch.delenv("FIORDISPINO_TOKEN")
+    mocked_get.return_value = streamed([game(1)])
+    out = io.StringIO()
+
+    with patch("app.App.run") as mocked_run, patch("sys.stdout", out):
+        assert main(["list-games", "--format", "ndjson"]) == 0
+
+    mocked_run.assert_not_called()
+    assert [json.loads(line)["title"] for line in out.getvalue().splitlines()] == ["Zelda"]
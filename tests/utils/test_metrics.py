@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from utils.metrics import Histogram, Metrics
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for ms in range(1, 101):
+        histogram.add(ms / 1000)
+
+    assert histogram.count == 100
+    assert histogram.percentile(50) == 0.051
+    assert histogram.percentile(99) == 0.1
+    assert histogram.max == 0.1
+
+
+def test_histogram_keeps_recent_samples_only():
+    histogram = Histogram(samples=2)
+    for seconds in (9.0, 1.0, 2.0):
+        histogram.add(seconds)
+
+    assert histogram.count == 3
+    assert histogram.percentile(99) == 2.0
+    assert histogram.max == 9.0
+
+
+def test_empty_histogram_percentile():
+    assert Histogram().percentile(95) == 0.0
+
+
+def test_metrics_summary_groups_by_kind_and_name():
+    metrics = Metrics()
+    metrics.record("http", "GET /game/", 0.2)
+    metrics.record("http", "GET /game/", 0.1)
+    metrics.record("json", "GET /game/", 0.01)
+
+    assert [(kind, name, h.count) for kind, name, h in metrics.summary()] == [
+        ("http", "GET /game/", 2), ("json", "GET /game/", 1)]
+
+
+def test_metrics_summary_is_not_changed_by_later_records():
+    metrics = Metrics()
+    metrics.record("http", "GET /game/", 0.2)
+    (_, _, histogram), = metrics.summary()
+
+    for _ in range(100):
+        metrics.record("http", "GET /game/", 1.0)
+
+    assert (histogram.count, histogram.max, histogram.percentile(99)) == (1, 0.2, 0.2)
+
+
+def test_metrics_timer_records_errors(tmp_path):
+    metrics = Metrics()
+    with pytest.raises(ValueError):
+        with metrics.timer("http", "GET /game/") as fields:
+            fields["status"] = 500
+            raise ValueError
+
+    metrics.export(str(tmp_path / "trace.jsonl"))
+    event = json.loads((tmp_path / "trace.jsonl").read_text())
+    assert event["status"] == 500 and event["error"] == "ValueError"
+
+
+def test_metrics_export_writes_jsonl(tmp_path):
+    metrics = Metrics()
+    with metrics.timer("http", "GET /game/{id}/") as fields:
+        fields["status"] = 200
+    metrics.record("render", "games", 0.5, rows=3)
+
+    assert metrics.export(str(tmp_path / "trace.jsonl")) == 2
+    events = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()]
+    assert [(e["kind"], e["name"]) for e in events] == [("http", "GET /game/{id}/"), ("render", "games")]
+    assert events[0]["status"] == 200
+    assert events[1]["rows"] == 3 and events[1]["ms"] == 500.0
+
+
+def test_metrics_streams_to_trace_file(tmp_path):
+    trace = tmp_path / "trace.jsonl"
+    metrics = Metrics(trace=str(trace))
+    metrics.record("http", "GET /genre/", 0.1)
+    metrics.close()
+
+    assert json.loads(trace.read_text())["name"] == "GET /genre/"
+
+
+def test_metrics_clear():
+    metrics = Metrics()
+    metrics.record("http", "GET /genre/", 0.1)
+    metrics.clear()
+
+    assert metrics.summary() == []
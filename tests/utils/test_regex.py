@@ -0,0 +1,18 @@
+from utils.regex import pattern
+
+
+def test_pattern_full_matches():
+    is_digits = pattern(r'[0-9]*')
+
+    assert is_digits("123")
+    assert not is_digits("12a")
+    assert not is_digits("a123")
+
+
+def test_pattern_is_memoised():
+    assert pattern(r'[a-z]*') is pattern(r'[a-z]*')
+    assert pattern(r'[a-z]*') is not pattern(r'[A-Z]*')
+
+
+def test_pattern_name():
+    assert pattern(r'[a-z]*').__name__ == 'pattern([a-z]*)'
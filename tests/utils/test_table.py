@@ -0,0 +1,92 @@
+import io
+from unittest.mock import patch
+
+from utils.metrics import Metrics
+from utils.table import Column, Rows, Table
+
+
+def make_table(terminal_width=None):
+    return Table([Column('INDEX', 5), Column('TITLE', 10, wrap=True, min_width=4), Column('VOTE', 4)], terminal_width)
+
+
+def test_table_header_and_rule():
+    table = make_table()
+    table.header()
+
+    assert table.getvalue().splitlines() == ["INDEX | TITLE      | VOTE", "-" * 25]
+
+
+def test_table_wraps_only_wrapped_columns():
+    table = make_table()
+    table.row(1, "A fairly long title", 7)
+
+    assert table.getvalue().splitlines() == [
+        "1     | A fairly   | 7",
+        "      | long title | ",
+    ]
+
+
+def test_table_shrinks_wrapped_columns_to_terminal_width():
+    table = make_table(terminal_width=20)
+
+    assert table.widths == [5, 5, 4]
+    assert table.width == 20
+
+
+def test_table_never_shrinks_below_min_width():
+    assert make_table(terminal_width=5).widths == [5, 4, 4]
+
+
+def test_table_flush_writes_once():
+    out = io.StringIO()
+    table = make_table()
+    table.header()
+    for i in range(100):
+        table.row(i, "Title", 5)
+
+    with patch.object(out, "write", wraps=out.write) as mocked_write:
+        table.flush(out)
+
+    mocked_write.assert_called_once()
+    assert len(out.getvalue().splitlines()) == 102
+    assert table.getvalue() == ""
+
+
+def test_table_flush_records_render_time():
+    metrics = Metrics()
+    table = Table([Column('INDEX', 5)], name="games", metrics=metrics)
+    table.row(1)
+    table.row(2)
+    table.flush(io.StringIO())
+
+    (kind, name, histogram), = metrics.summary()
+    assert (kind, name, histogram.count) == ("render", "games", 1)
+
+
+def test_rows_stream_ndjson_keyed_by_headers():
+    out = io.StringIO()
+    rows = Rows("ndjson", [Column('INDEX', 5), Column('RELEASE DATE', 12), Column('GENRES', 20)], out,
+                metrics=Metrics())
+    rows.header()
+    rows.row(1, "2020-01-01", ["MMO", "RPG"])
+
+    assert out.getvalue() == '{"index": 1, "release_date": "2020-01-01", "genres": ["MMO", "RPG"]}\n'
+
+
+def test_rows_stream_csv_with_a_header_record():
+    out = io.StringIO()
+    rows = Rows("csv", [Column('INDEX', 5), Column('TITLE', 10, wrap=True)], out, metrics=Metrics())
+    rows.header()
+    rows.row(1, "A title, with a comma that is never wrapped")
+
+    assert out.getvalue().splitlines() == ['index,title', '1,"A title, with a comma that is never wrapped"']
+
+
+def test_rows_send_free_text_to_stderr(capsys):
+    out = io.StringIO()
+    rows = Rows("ndjson", [Column('INDEX', 5)], out, metrics=Metrics())
+    rows.line("1 | ERROR: invalid data")
+    rows.line()
+
+    assert out.getvalue() == ""
+    assert capsys.readouterr().err == "1 | ERROR: invalid data\n"
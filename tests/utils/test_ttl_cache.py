@@ -0,0 +1,55 @@
+from utils.ttl_cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_get_and_put():
+    cache = TTLCache()
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", 2) == 2
+    assert "a" in cache and "b" not in cache
+
+
+def test_ttl_cache_expires_entries():
+    clock = Clock()
+    cache = TTLCache(ttl=10.0, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=1.0)
+
+    clock.now = 5.0
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    clock.now = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_ttl_cache_keeps_falsy_values():
+    cache = TTLCache()
+    cache.put("a", None)
+    cache.put("b", 0)
+
+    assert "a" in cache
+    assert cache.get("b", 1) == 0
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from typeguard import TypeCheckError
+
+import utils.typechecking
+from utils.dataclasses import validate_dataclass
+from utils.typechecking import check_type, is_production, typechecked
+
+
+@pytest.fixture
+def production(monkeypatch):
+    monkeypatch.setattr(utils.typechecking, "PRODUCTION", True)
+
+
+@pytest.fixture
+def development(monkeypatch):
+    monkeypatch.setattr(utils.typechecking, "PRODUCTION", False)
+
+
+@pytest.mark.parametrize("value", ["", "0", "false", "No"])
+def test_is_production_off(monkeypatch, value):
+    monkeypatch.setenv("FIORDISPINO_PRODUCTION", value)
+    assert not is_production()
+
+
+@pytest.mark.parametrize("value", ["1", "true", "yes"])
+def test_is_production_on(monkeypatch, value):
+    monkeypatch.setenv("FIORDISPINO_PRODUCTION", value)
+    assert is_production()
+
+
+def test_typechecked_checks_outside_production(development):
+    @typechecked
+    def double(value: int) -> int:
+        return value * 2
+
+    with pytest.raises(TypeCheckError):
+        double("2")
+
+
+def test_typechecked_is_identity_in_production(production):
+    def double(value: int) -> int:
+        return value * 2
+
+    assert typechecked(double) is double
+
+
+def test_check_type_checks_items_outside_production(development):
+    with pytest.raises(TypeCheckError):
+        check_type(["a"], List[int])
+
+
+@pytest.mark.parametrize("value, expected_type", [
+    (1, int),
+    (["a"], List[int]),
+    ({"a": "b"}, Dict[int, int]),
+    (lambda: None, Callable[[], None]),
+    (None, Optional[int]),
+    (None, int | None),
+    (1, int | None),
+    (None, None),
+    (object(), Any),
+])
+def test_check_type_only_checks_outer_type_in_production(production, value, expected_type):
+    check_type(value, expected_type)
+
+
+@pytest.mark.parametrize("value, expected_type", [
+    ("1", int),
+    (("a",), List[int]),
+    (1, Callable[[], None]),
+    ("1", Optional[int]),
+    ("1", int | None),
+    (1, None),
+])
+def test_check_type_rejects_wrong_outer_type_in_production(production, value, expected_type):
+    with pytest.raises(TypeCheckError):
+        check_type(value, expected_type)
+
+
+def test_optional_fields_are_checked_by_member_in_production(production):
+    @dataclass
+    class Screen:
+        name: str
+        parent: int | None = None
+
+    validate_dataclass(Screen("login"))
+    validate_dataclass(Screen("user", 1))
+    with pytest.raises(TypeCheckError):
+        validate_dataclass(Screen("user", "login"))
@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+
+
+class Histogram:
+    """Durations of one kind of operation; percentiles are taken over the most recent samples."""
+
+    def __init__(self, samples: int = 2048) -> None:
+        self.__samples: Deque[float] = deque(maxlen=samples)
+        self.__count = 0
+        self.__max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def max(self) -> float:
+        return self.__max
+
+    def add(self, seconds: float) -> None:
+        self.__samples.append(seconds)
+        self.__count += 1
+        self.__max = max(self.__max, seconds)
+
+    def snapshot(self) -> "Histogram":
+        """A copy that later add() calls leave alone; take it under the lock that guards add()."""
+        copy = Histogram(self.__samples.maxlen)
+        copy.__samples.extend(self.__samples)
+        copy.__count = self.__count
+        copy.__max = self.__max
+        return copy
+
+    def percentile(self, p: float) -> float:
+        ordered = sorted(self.__samples)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+class Metrics:
+    """Thread-safe timings of HTTP requests, JSON decoding and rendering.
+
+    Every event goes into the histogram of its (kind, name) pair, e.g. ("http", "GET /game/{id}/"),
+    and into a bounded list of recent events that export() writes as JSONL. With a trace path, each
+    event is also appended to that file as it happens.
+    """
+
+    def __init__(self, events: int = 10_000, trace: Optional[str] = None) -> None:
+        self.__histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.__events: Deque[Dict[str, Any]] = deque(maxlen=events)
+        self.__trace_path = trace
+        self.__trace: Optional[TextIO] = None
+        self.__lock = threading.Lock()
+
+    def record(self, kind: str, name: str, seconds: float, **fields: Any) -> None:
+        event = {"ts": time.time(), "kind": kind, "name": name, "ms": round(seconds * 1000, 3), **fields}
+        with self.__lock:
+            self.__histograms.setdefault((kind, name), Histogram()).add(seconds)
+            self.__events.append(event)
+            if self.__trace_path is not None:
+                if self.__trace is None:
+                    self.__trace = open(self.__trace_path, "a", encoding="utf-8")
+                self.__trace.write(json.dumps(event, default=str) + "\n")
+                self.__trace.flush()
+
+    @contextmanager
+    def timer(self, kind: str, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """Times the block; the yielded dict takes extra fields for the event, e.g. a status code."""
+        start = time.perf_counter()
+        try:
+            yield fields
+        except BaseException as e:
+            fields["error"] = type(e).__name__
+            raise
+        finally:
+            self.record(kind, name, time.perf_counter() - start, **fields)
+
+    def summary(self) -> List[Tuple[str, str, Histogram]]:
+        """Snapshots of the histograms, safe to read while other threads keep recording."""
+        with self.__lock:
+            return [(kind, name, histogram.snapshot()) for (kind, name), histogram in sorted(self.__histograms.items())]
+
+    def export(self, path: str) -> int:
+        """Writes the recent events to path, one JSON object per line, and returns how many."""
+        with self.__lock:
+            events = list(self.__events)
+        with open(path, "w", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, default=str) + "\n")
+        return len(events)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__histograms.clear()
+            self.__events.clear()
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__trace is not None:
+                self.__trace.close()
+                self.__trace = None
+
+
+# Shared by the HTTP clients and tables of the process; FIORDISPINO_TRACE streams every event to a file
+METRICS = Metrics(trace=os.environ.get("FIORDISPINO_TRACE") or None)
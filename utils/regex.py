@@ -1,13 +1,15 @@
+import functools
 import re
 from typing import Callable
 
-from typeguard import typechecked
+from utils.typechecking import typechecked
 
 
+@functools.lru_cache(maxsize=None)
 @typechecked
 def pattern(regex: str) -> Callable[[str], bool]:
-    r = re.compile(regex)
+    fullmatch = re.compile(regex).fullmatch
     def res(value):
-        return bool(r.fullmatch(value))
+        return fullmatch(value) is not None
     res.__name__ = f'pattern({regex})'
-    return res
\ No newline at end of file
+    return res
@@ -0,0 +1,164 @@
+import csv
+import io
+import json
+import shutil
+import sys
+import textwrap
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, TextIO
+
+from utils.metrics import METRICS, Metrics
+
+FORMATS = ("table", "ndjson", "csv")
+
+
+@dataclass(frozen=True)
+class Column:
+    header: str
+    width: int
+    wrap: bool = field(default=False)
+    min_width: int = field(default=10)
+
+
+class Table:
+    """Fixed-width table rendered into one buffer and written with a single write.
+
+    Wrapped columns spread over as many lines as needed, the other cells are printed on the first
+    line only. When a terminal width is given and the table does not fit, the wrapped columns are
+    narrowed, never below their min_width. The time from creation, or the last flush, to a flush is
+    recorded as the rendering time of the table's name.
+    """
+
+    separator = " | "
+
+    def __init__(self, columns: Sequence[Column], terminal_width: Optional[int] = None, name: str = "table",
+                 metrics: Optional[Metrics] = None) -> None:
+        self.__columns = list(columns)
+        self.__widths = self.__fit([c.width for c in self.__columns], terminal_width)
+        self.__buffer = io.StringIO()
+        self.__name = name
+        self.__metrics = metrics or METRICS
+        self.__rows = 0
+        self.__started = time.perf_counter()
+
+    @staticmethod
+    def terminal_width() -> Optional[int]:
+        if not sys.stdout.isatty():
+            return None
+        return shutil.get_terminal_size().columns
+
+    @property
+    def widths(self) -> List[int]:
+        return list(self.__widths)
+
+    @property
+    def width(self) -> int:
+        return sum(self.__widths) + len(self.separator) * (len(self.__widths) - 1)
+
+    def __fit(self, widths: List[int], terminal_width: Optional[int]) -> List[int]:
+        excess = sum(widths) + len(self.separator) * (len(widths) - 1) - (terminal_width or 0)
+        if terminal_width is None or excess <= 0:
+            return widths
+
+        shrinkable = [i for i, c in enumerate(self.__columns) if c.wrap and widths[i] > c.min_width]
+        slack = sum(widths[i] - self.__columns[i].min_width for i in shrinkable)
+        for i in shrinkable:
+            share = widths[i] - self.__columns[i].min_width
+            widths[i] -= min(share, -(-excess * share // slack))
+        return widths
+
+    @staticmethod
+    def __wrap(text: str, width: int) -> List[str]:
+        # Short single-line cells, i.e. nearly all of them, need no wrapping work
+        if len(text) <= width and text.isprintable() and text == text.strip():
+            return [text] if text else []
+        return textwrap.wrap(text, width)
+
+    def header(self) -> None:
+        self.__buffer.write(self.separator.join(f"{c.header:{w}}" for c, w in zip(self.__columns, self.__widths)))
+        self.__buffer.write("\n")
+        self.__buffer.write("-" * self.width)
+        self.__buffer.write("\n")
+
+    def row(self, *cells: Any) -> None:
+        self.__rows += 1
+        texts = [str(cell) for cell in cells]
+        lines = [self.__wrap(t, w) if c.wrap else [t]
+                 for t, c, w in zip(texts, self.__columns, self.__widths)]
+        write = self.__buffer.write
+        last = len(lines) - 1
+        for i in range(max(len(cell_lines) for cell_lines in lines)):
+            parts = []
+            for j, cell_lines in enumerate(lines):
+                text = cell_lines[i] if i < len(cell_lines) else ""
+                parts.append(text if j == last else f"{text:{self.__widths[j]}}")
+            write(self.separator.join(parts))
+            write("\n")
+
+    def line(self, text: str = "") -> None:
+        self.__buffer.write(text)
+        self.__buffer.write("\n")
+
+    def getvalue(self) -> str:
+        return self.__buffer.getvalue()
+
+    def flush(self, out: Optional[TextIO] = None) -> None:
+        (out or sys.stdout).write(self.__buffer.getvalue())
+        self.__buffer = io.StringIO()
+        self.__metrics.record("render", self.__name, time.perf_counter() - self.__started, rows=self.__rows)
+        self.__rows = 0
+        self.__started = time.perf_counter()
+
+
+class Rows:
+    """Rows streamed to out as they come, as NDJSON objects or CSV records keyed by the column headers.
+
+    Nothing is measured or wrapped and no row is kept, so memory stays the same however long the
+    list; the column widths are ignored. Free text lines, e.g. the note about an invalid row, go to
+    stderr so they never break the format. Takes the place of a Table: same methods, same metrics.
+    """
+
+    def __init__(self, format: str, columns: Sequence[Column], out: Optional[TextIO] = None, name: str = "table",
+                 metrics: Optional[Metrics] = None) -> None:
+        if format not in ("ndjson", "csv"):
+            raise ValueError(f"unknown row format {format!r}")
+        self.__format = format
+        self.__keys = [c.header.lower().replace(" ", "_") for c in columns]
+        self.__out = out or sys.stdout
+        self.__csv = csv.writer(self.__out) if format == "csv" else None
+        self.__name = name
+        self.__metrics = metrics or METRICS
+        self.__rows = 0
+        self.__started = time.perf_counter()
+
+    @classmethod
+    def __plain(cls, cell: Any) -> Any:
+        # Numbers stay numbers and lists stay arrays in JSON; primitives and everything else are written as they print
+        if isinstance(cell, (list, tuple)):
+            return [cls.__plain(item) for item in cell]
+        return cell if cell is None or isinstance(cell, (bool, int, float)) else str(cell)
+
+    def header(self) -> None:
+        if self.__csv is not None:
+            self.__csv.writerow(self.__keys)
+
+    def row(self, *cells: Any) -> None:
+        self.__rows += 1
+        if self.__csv is not None:
+            self.__csv.writerow(cells)
+        else:
+            self.__out.write(json.dumps(dict(zip(self.__keys, map(self.__plain, cells))), ensure_ascii=False))
+            self.__out.write("\n")
+
+    def line(self, text: str = "") -> None:
+        if text:
+            print(text, file=sys.stderr)
+
+    def flush(self, out: Optional[TextIO] = None) -> None:
+        # The rows are already written to the out given at creation; out is accepted as Table.flush takes it
+        self.__out.flush()
+        self.__metrics.record("render", self.__name, time.perf_counter() - self.__started, rows=self.__rows,
+                              format=self.__format)
+        self.__rows = 0
+        self.__started = time.perf_counter()
@@ -0,0 +1,55 @@
+import collections.abc
+import os
+import types
+import typing
+from typing import Any
+
+
+def is_production() -> bool:
+    return os.environ.get("FIORDISPINO_PRODUCTION", "").strip().lower() not in ("", "0", "false", "no")
+
+
+PRODUCTION = is_production()
+
+
+def typechecked(target):
+    """typeguard's @typechecked, left out entirely in production mode (FIORDISPINO_PRODUCTION=1)."""
+    if PRODUCTION:
+        return target
+    # typeguard is imported here, so production mode never loads it
+    import typeguard
+    return typeguard.typechecked(target)
+
+
+def _shallow_types(expected_type: Any) -> tuple:
+    origin = typing.get_origin(expected_type)
+    if expected_type is Any:
+        return (object,)
+    if expected_type is None:
+        return (type(None),)
+    # Optional[X] and X | None alike: the value is one of the members
+    if origin is typing.Union or origin is types.UnionType:
+        return tuple(t for arg in typing.get_args(expected_type) for t in _shallow_types(arg))
+    if origin is collections.abc.Callable or expected_type is typing.Callable:
+        return (collections.abc.Callable,)
+    if isinstance(origin, type):
+        return (origin,)
+    if isinstance(expected_type, type):
+        return (expected_type,)
+    return (object,)
+
+
+def check_type(value: Any, expected_type: Any) -> None:
+    """Full typeguard check, or in production mode only an isinstance on the outer type."""
+    if not PRODUCTION:
+        import typeguard
+        typeguard.check_type(
+            value=value,
+            expected_type=expected_type,
+            forward_ref_policy=typeguard.config.forward_ref_policy,
+            typecheck_fail_callback=typeguard.config.typecheck_fail_callback,
+            collection_check_strategy=typeguard.config.collection_check_strategy
+        )
+    elif not isinstance(value, _shallow_types(expected_type)):
+        from typeguard import TypeCheckError
+        raise TypeCheckError(f"is not an instance of {expected_type}")